@@ -0,0 +1,3 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
@@ -0,0 +1,358 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+"""
+Benchmarks for the Gofile client against the in-process Gofile emulator.
+
+Run from the repository root:
+
+    python -m benchmarks.bench --output results.json
+    python -m benchmarks.bench --latency 20 --bandwidth 50 --compare results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import gofile2
+from gofile2 import Gofile, RateLimiter, RequestTrace, RequestTracer
+from gofile2.testing import Faults, GofileEmulator
+
+MiB = 1024 * 1024
+
+SCENARIOS = ("get_content", "upload", "upload_folder", "upload_folder_concurrently")
+
+# Workload sizes per scenario; --quick scales them down for smoke runs.
+FULL = {
+    "get_content": {"requests": 1000, "concurrency": 16},
+    "upload": {"files": 16, "size": 4 * MiB, "concurrency": 4},
+    "upload_folder": {"files": 32, "size": 256 * 1024},
+    "upload_folder_concurrently": {"files": 64, "size": 256 * 1024, "concurrency": 8},
+}
+QUICK = {
+    "get_content": {"requests": 50, "concurrency": 8},
+    "upload": {"files": 4, "size": 256 * 1024, "concurrency": 2},
+    "upload_folder": {"files": 4, "size": 64 * 1024},
+    "upload_folder_concurrently": {"files": 8, "size": 64 * 1024, "concurrency": 4},
+}
+
+
+def _rss() -> int:
+    # Current resident set size in bytes.
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _RssSampler:
+    # Samples the RSS from a background thread while a scenario runs. The
+    # process RSS still holds whatever earlier scenarios allocated, so only
+    # the growth above the RSS at the start is attributed to the scenario.
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.start = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while True:
+            self.peak = max(self.peak, _rss())
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self) -> "_RssSampler":
+        self.start = self.peak = _rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss())
+
+    @property
+    def growth(self) -> int:
+        return self.peak - self.start
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+async def _timed_calls(
+    calls: List[Callable[[], Awaitable[Any]]], concurrency: int
+) -> Dict[str, Any]:
+    # Runs the calls with at most `concurrency` in flight and collects
+    # per-call latencies.
+    latencies: List[float] = []
+    errors = 0
+    queue = list(reversed(calls))
+
+    async def worker() -> None:
+        nonlocal errors
+        while queue:
+            call = queue.pop()
+            started = time.perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {
+        "seconds": time.perf_counter() - started,
+        "latencies": latencies,
+        "errors": errors,
+    }
+
+
+def _client(emulator: GofileEmulator, account: Dict[str, Any], **kwargs: Any) -> Gofile:
+    # The rate limiter is opened up so the client itself is measured.
+    return emulator.client(
+        account["token"],
+        rate_limiter=RateLimiter(initial_rate=1e9, max_rate=1e9),
+        **kwargs,
+    )
+
+
+def _write_files(directory: str, count: int, size: int) -> List[str]:
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"file{i:04d}.bin")
+        with open(path, "wb") as fh:
+            fh.write(os.urandom(size))
+        paths.append(path)
+    return paths
+
+
+async def bench_get_content(
+    emulator: GofileEmulator, account: Dict[str, Any], requests: int, concurrency: int
+):
+    root = account["rootFolder"]
+    async with _client(emulator, account) as g:
+        run = await _timed_calls(
+            [lambda: g.get_content(root) for _ in range(requests)], concurrency
+        )
+    return run, 0
+
+
+async def bench_upload(
+    emulator: GofileEmulator,
+    account: Dict[str, Any],
+    files: int,
+    size: int,
+    concurrency: int,
+):
+    root = account["rootFolder"]
+    directory = tempfile.mkdtemp(prefix="gofile2-bench-")
+    try:
+        paths = _write_files(directory, files, size)
+        async with _client(emulator, account) as g:
+            run = await _timed_calls(
+                [lambda p=p: g.upload(p, folderId=root) for p in paths], concurrency
+            )
+    finally:
+        shutil.rmtree(directory)
+    return run, files * size
+
+
+async def _bench_folder(
+    emulator: GofileEmulator,
+    account: Dict[str, Any],
+    files: int,
+    size: int,
+    upload: Callable[[Gofile, str], Awaitable[Any]],
+):
+    directory = tempfile.mkdtemp(prefix="gofile2-bench-")
+    latencies: List[float] = []
+
+    # Folder uploads send files internally, so per-file latencies are taken
+    # from the traces of the upload requests.
+    def on_trace(trace: RequestTrace) -> None:
+        if trace.url.endswith("/uploadfile"):
+            latencies.append(trace.duration)
+
+    try:
+        _write_files(directory, files, size)
+        async with _client(emulator, account, tracer=RequestTracer(on_trace)) as g:
+            started = time.perf_counter()
+            errors = await upload(g, directory)
+            seconds = time.perf_counter() - started
+    finally:
+        shutil.rmtree(directory)
+    run = {"seconds": seconds, "latencies": latencies, "errors": errors}
+    return run, files * size
+
+
+async def bench_upload_folder(
+    emulator: GofileEmulator, account: Dict[str, Any], files: int, size: int
+):
+    async def upload(g: Gofile, directory: str) -> int:
+        try:
+            await g.upload_folder(directory, folderId=account["rootFolder"])
+        except Exception:
+            return 1
+        return 0
+
+    return await _bench_folder(emulator, account, files, size, upload)
+
+
+async def bench_upload_folder_concurrently(
+    emulator: GofileEmulator,
+    account: Dict[str, Any],
+    files: int,
+    size: int,
+    concurrency: int,
+):
+    async def upload(g: Gofile, directory: str) -> int:
+        results = await g.upload_folder_concurrently(
+            directory, folderId=account["rootFolder"], concurrency=concurrency
+        )
+        return sum(isinstance(r, Exception) for r in results.values())
+
+    return await _bench_folder(emulator, account, files, size, upload)
+
+
+BENCHMARKS = {
+    "get_content": bench_get_content,
+    "upload": bench_upload,
+    "upload_folder": bench_upload_folder,
+    "upload_folder_concurrently": bench_upload_folder_concurrently,
+}
+
+
+async def run_scenario(
+    name: str,
+    params: Dict[str, Any],
+    latency: float,
+    bandwidth: Optional[float],
+    children: int,
+) -> Dict[str, Any]:
+    """Run one scenario against a fresh emulator and summarize it."""
+    # Uploaded bytes are only counted, not kept, so large workloads stay
+    # cheap; the listed folder is seeded with `children` files.
+    async with GofileEmulator(bandwidth=bandwidth, store_data=False) as emulator:
+        account = emulator.add_account()
+        for i in range(children):
+            emulator.add_file(account["rootFolder"], f"file{i}.bin", 1024 * i)
+        if latency:
+            emulator.faults.append(Faults(latency=latency))
+        with _RssSampler() as rss:
+            run, payload = await BENCHMARKS[name](emulator, account, **params)
+    requests = sum(emulator.calls.values())
+    latencies = run["latencies"]
+    seconds = run["seconds"]
+    return {
+        "name": name,
+        "params": params,
+        "requests": requests,
+        "errors": run["errors"],
+        "seconds": round(seconds, 4),
+        "requests_per_second": round(requests / seconds, 2),
+        "mb_per_second": round(payload / MiB / seconds, 2) if payload else None,
+        "latency_ms": {
+            key: round(percentile(latencies, q) * 1000, 3)
+            for key, q in (("p50", 50), ("p95", 95), ("p99", 99))
+        },
+        "rss_growth_mb": round(rss.growth / MiB, 1),
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Describe the change of each scenario's metrics relative to ``baseline``."""
+    before = {s["name"]: s for s in baseline["scenarios"]}
+    lines = []
+    for scenario in results["scenarios"]:
+        old = before.get(scenario["name"])
+        if old is None:
+            continue
+        changes = []
+        for key in ("requests_per_second", "mb_per_second"):
+            if scenario[key] and old.get(key):
+                changes.append(f"{key} {scenario[key] / old[key] - 1:+.1%}")
+        for key in ("p50", "p99"):
+            if old["latency_ms"][key]:
+                ratio = scenario["latency_ms"][key] / old["latency_ms"][key] - 1
+                changes.append(f"{key} {ratio:+.1%}")
+        lines.append(f"{scenario['name']}: " + ", ".join(changes))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="server latency per request in milliseconds")
+    parser.add_argument("--bandwidth", type=float, default=None,
+                        help="server bandwidth in MB/s (default: unlimited)")
+    parser.add_argument("--children", type=int, default=100,
+                        help="number of children in folder listings")
+    parser.add_argument("--quick", action="store_true",
+                        help="small workloads, for smoke testing")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    sizes = QUICK if args.quick else FULL
+    bandwidth = args.bandwidth * MiB if args.bandwidth else None
+    scenarios = []
+    for name in args.scenario or SCENARIOS:
+        result = asyncio.run(
+            run_scenario(name, sizes[name], args.latency / 1000, bandwidth, args.children)
+        )
+        scenarios.append(result)
+        latency = result["latency_ms"]
+        mbps = f"{result['mb_per_second']:>8.2f} MB/s" if result["mb_per_second"] else " " * 13
+        print(
+            f"{name:<26} {result['requests_per_second']:>9.1f} req/s {mbps}  "
+            f"p50 {latency['p50']:>8.2f} ms  p95 {latency['p95']:>8.2f} ms  "
+            f"p99 {latency['p99']:>8.2f} ms  rss +{result['rss_growth_mb']:.1f} MB"
+        )
+
+    results = {
+        "gofile2": gofile2.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "config": {
+            "latency_ms": args.latency,
+            "bandwidth_mb_s": args.bandwidth,
+            "children": args.children,
+            "quick": args.quick,
+        },
+        "scenarios": scenarios,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            for line in compare(results, json.load(fh)):
+                print(line)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,60 @@
 # Author: https://github.com/Itz-fork
 # Project: https://github.com/Itz-fork/Gofile2
 
-from .gofile2 import Gofile
-from .gofile2_sync import Sync_Gofile
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .cache import MetadataCache
+    from .codec import JsonCodec
+    from .connection import ConnectionOptions
+    from .dedup import DedupIndex
+    from .gofile2 import Gofile
+    from .gofile2_sync import Sync_Gofile
+    from .journal import UploadJournal
+    from .metrics import Metrics
+    from .models import Account, DirectLink, File, Folder, UploadResult
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .streaming import UploadProgress
+    from .tracing import RequestTrace, RequestTracer
 
 __version__ = "v2.1"
+
+# Public names and the submodules defining them. They are imported on first
+# access, so `import gofile2` (or `gofile2.errors`) does not load aiohttp.
+_LAZY = {
+    "Account": ".models",
+    "ConnectionOptions": ".connection",
+    "DedupIndex": ".dedup",
+    "DirectLink": ".models",
+    "File": ".models",
+    "Folder": ".models",
+    "Gofile": ".gofile2",
+    "JsonCodec": ".codec",
+    "MetadataCache": ".cache",
+    "Metrics": ".metrics",
+    "RateLimiter": ".ratelimit",
+    "RequestTrace": ".tracing",
+    "RequestTracer": ".tracing",
+    "RetryPolicy": ".retry",
+    "Sync_Gofile": ".gofile2_sync",
+    "UploadJournal": ".journal",
+    "UploadProgress": ".streaming",
+    "UploadResult": ".models",
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+
+class MetadataCache:
+    """
+    Size-bounded LRU cache with a per-entry TTL for :meth:`Gofile.get_content`.
+
+    Entries are keyed by content ID together with the password and token
+    used for the request. Write operations on a client invalidate the
+    affected content IDs and their parent folders; parents are learned from
+    the listings that pass through the cache.
+
+    Cached results are shared between callers and must not be modified.
+
+    Args:
+        maxsize: Maximum number of cached entries.
+        ttl: Seconds an entry stays valid.
+
+    Attributes:
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that were not cached or had expired.
+        evictions: Number of entries dropped to stay within ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._keys: Dict[str, Set[Tuple[Hashable, ...]]] = {}
+        self._parents: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, contentId: str, *extra: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``contentId``, or None."""
+        key = (contentId, *extra)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, contentId: str, value: Dict[str, Any], *extra: Hashable) -> None:
+        """Cache ``value`` as the result for ``contentId``."""
+        key = (contentId, *extra)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        self._keys.setdefault(contentId, set()).add(key)
+
+        parent = value.get("parentFolder")
+        if parent:
+            self._parents[contentId] = parent
+        if hasattr(value, "child_ids"):
+            # Typed folders list their children without parsing them.
+            childIds: Iterable[Optional[str]] = value.child_ids()
+        else:
+            children = value.get("children") or {}
+            childIds = children.keys() if isinstance(children, dict) else (
+                child.get("id") for child in children
+            )
+        for childId in childIds:
+            if childId:
+                self._parents[childId] = contentId
+
+        # Parent links are only hints for invalidation; forget the oldest
+        # ones so huge listings cannot grow the map without bound.
+        limit = max(64 * self.maxsize, 65536)
+        while len(self._parents) > limit:
+            del self._parents[next(iter(self._parents))]
+
+        while len(self._entries) > self.maxsize:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def invalidate(self, contentIds: Iterable[str], parents: bool = True) -> None:
+        """
+        Drop cached results for ``contentIds``.
+
+        Args:
+            contentIds: Content IDs whose results are dropped.
+            parents: Also drop the results of their known parent folders.
+        """
+        for contentId in contentIds:
+            for key in self._keys.pop(contentId, ()):
+                self._entries.pop(key, None)
+            if parents:
+                parent = self._parents.get(contentId)
+                if parent is not None:
+                    self.invalidate((parent,), parents=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        self._keys.clear()
+        self._parents.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters together with the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def _drop(self, key: Tuple[Hashable, ...]) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys[key[0]]
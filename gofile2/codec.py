@@ -0,0 +1,82 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import json
+from functools import lru_cache
+from typing import Any, Callable
+
+
+def _std_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class JsonCodec:
+    """
+    JSON encoder and decoder used for API request and response bodies.
+
+    Both functions work on ``bytes``: request bodies are sent exactly as
+    encoded and responses are decoded straight from the raw body, without
+    decoding it to text first.
+
+    Args:
+        dumps: Function encoding an object to JSON bytes.
+        loads: Function decoding JSON bytes to an object.
+        name: Name of the codec, for display.
+    """
+
+    __slots__ = ("dumps", "loads", "name")
+
+    def __init__(
+        self,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any],
+        name: str = "custom",
+    ) -> None:
+        self.dumps = dumps
+        self.loads = loads
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"JsonCodec(name={self.name!r})"
+
+    @classmethod
+    def named(cls, name: str) -> "JsonCodec":
+        """
+        Codec backed by a specific library.
+
+        Args:
+            name: ``"orjson"``, ``"msgspec"`` or ``"json"`` (the standard
+                  library).
+
+        Raises:
+            ImportError: If the library is not installed.
+        """
+        if name == "orjson":
+            import orjson
+
+            return cls(orjson.dumps, orjson.loads, name)
+        if name == "msgspec":
+            import msgspec.json
+
+            return cls(msgspec.json.encode, msgspec.json.decode, name)
+        if name == "json":
+            return cls(_std_dumps, json.loads, name)
+        raise ValueError(f"Unknown JSON codec: {name!r}")
+
+    @classmethod
+    def default(cls) -> "JsonCodec":
+        """
+        Fastest available codec: orjson, then msgspec, then the standard
+        library. The choice is made once per process.
+        """
+        return _default_codec()
+
+
+@lru_cache(maxsize=None)
+def _default_codec() -> JsonCodec:
+    for name in ("orjson", "msgspec"):
+        try:
+            return JsonCodec.named(name)
+        except ImportError:
+            continue
+    return JsonCodec.named("json")
@@ -0,0 +1,59 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import ssl
+from functools import lru_cache
+from typing import Optional
+
+from aiohttp import TCPConnector
+
+
+@lru_cache(maxsize=None)
+def _default_ssl_context() -> ssl.SSLContext:
+    return ssl.create_default_context()
+
+
+class ConnectionOptions:
+    """
+    Connection pool settings used when a client creates its own session.
+
+    Args:
+        limit: Maximum number of simultaneous connections (0 for no limit).
+        limit_per_host: Maximum number of simultaneous connections to one host
+                        (0 for no limit).
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        ttl_dns_cache: Seconds resolved DNS entries are cached (None to cache
+                       forever).
+        ssl_context: TLS context for HTTPS connections. Defaults to one
+                     process-wide context shared by every connector, so
+                     certificates are only loaded once.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 10,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.ssl_context = ssl_context
+
+    def create_connector(self) -> TCPConnector:
+        """
+        Create a connector with these settings.
+
+        Must be called from inside a running event loop. The connector can be
+        passed to several :class:`Gofile` clients to share one pool.
+        """
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            ssl=self.ssl_context or _default_ssl_context(),
+        )
@@ -0,0 +1,93 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from .journal import _open_append
+
+
+class DedupIndex:
+    """
+    Local index mapping file content hashes to Gofile content IDs.
+
+    When a client has an index, every upload first hashes the file in a
+    streaming pass. If the hash is already known, the existing content is
+    copied into the destination folder instead of uploading the bytes again.
+
+    Args:
+        path: Optional JSON Lines file the index is loaded from and appended
+              to. The index only lives in memory if omitted.
+        algorithm: Name of the :mod:`hashlib` algorithm used to hash files.
+
+    Supports use as a context manager.
+    """
+
+    def __init__(self, path: Optional[str] = None, algorithm: str = "sha256") -> None:
+        self.path = path
+        self.algorithm = algorithm
+        self._entries: Dict[str, str] = {}
+        self._fh = None
+        if path is not None:
+            if os.path.isfile(path):
+                with open(path, encoding="utf-8") as fh:
+                    for line in fh:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        if entry["contentId"] is None:
+                            self._entries.pop(entry["hash"], None)
+                        else:
+                            self._entries[entry["hash"]] = entry["contentId"]
+            self._fh = _open_append(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hash_file(self, file: str, chunk_size: int = 256 * 1024) -> str:
+        """
+        Hash a file's content, reading it ``chunk_size`` bytes at a time.
+
+        This reads from disk; call it from a thread pool inside async code.
+        """
+        digest = hashlib.new(self.algorithm)
+        with open(file, "rb") as fh:
+            for chunk in iter(lambda: fh.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, digest: str) -> Optional[str]:
+        """Content ID recorded for ``digest``, if any."""
+        return self._entries.get(digest)
+
+    def add(self, digest: str, contentId: str) -> None:
+        """Record that content with ``digest`` is stored as ``contentId``."""
+        self._entries[digest] = contentId
+        self._append(digest, contentId)
+
+    def discard(self, digest: str) -> None:
+        """Forget ``digest``, e.g. after its content was deleted."""
+        if self._entries.pop(digest, None) is not None:
+            self._append(digest, None)
+
+    def _append(self, digest: str, contentId: Optional[str]) -> None:
+        if self._fh is not None:
+            self._fh.write(
+                json.dumps({"hash": digest, "contentId": contentId}, separators=(",", ":"))
+                + "\n"
+            )
+            self._fh.flush()
+
+    def close(self) -> None:
+        """Close the index file."""
+        if self._fh is not None:
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
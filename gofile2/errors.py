@@ -12,10 +12,12 @@ class InvalidToken(Exception):
 
 
 class ResponseError(Exception):
-    def __init__(self, status) -> None:
+    def __init__(self, status, code=None) -> None:
         super().__init__(
             f"Gofile server responded with: {status} \n\nReport this at ----> https://github.com/Itz-fork/Gofile2/issues",
         )
+        self.status = status
+        self.code = code
 
 
 class RateLimitError(Exception):
@@ -2,11 +2,46 @@
 # Author: https://github.com/Itz-fork
 # Project: https://github.com/Itz-fork/Gofile2
 import os
-from typing import Any, Dict, List, Optional, Union
-from asyncio import sleep as asleep
+import stat
+import time
+from urllib.parse import urlsplit
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from asyncio import (
+    FIRST_COMPLETED,
+    Lock,
+    Queue,
+    QueueEmpty,
+    Semaphore,
+    Task,
+    ensure_future,
+    gather,
+    get_running_loop,
+    shield,
+    sleep as asleep,
+    wait,
+)
+from collections import deque
 
-from aiohttp import ClientSession, FormData
+from aiohttp import BaseConnector, ClientResponse, ClientSession, ClientTimeout, FormData
 
+from .cache import MetadataCache
+from .codec import JsonCodec
+from .connection import ConnectionOptions
+from .dedup import DedupIndex
 from .errors import (
     InvalidOption,
     InvalidPath,
@@ -14,6 +49,20 @@ from .errors import (
     RateLimitError,
     ResponseError,
 )
+from .journal import UploadJournal
+from .metrics import Metrics, endpoint_name
+from .models import Account, DirectLink, Folder, UploadResult, parse_content
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import FilePayload, ProgressCallback, iter_children
+from .tracing import RequestTracer, correlation
+
+T = TypeVar("T")
+
+
+class _RangeIgnored(Exception):
+    # A ranged download request was answered with the whole file.
+    pass
 
 
 class Gofile:
@@ -23,6 +72,42 @@ class Gofile:
     Args:
         token: API token for authentication. Can be retrieved from the profile page.
                Required for all operations except guest uploads.
+        rate_limiter: Adaptive per-host rate limiter used to pace requests.
+                      A new :class:`RateLimiter` is created if omitted; pass the
+                      same instance to several clients to share their budget.
+        retry_policy: Retry policy for transient failures (429, 5xx, connection
+                      errors and timeouts). Requests are not retried if omitted.
+        connection_options: Connection pool settings used when the client
+                            creates its own connector.
+        connector: Connector to share with other clients. It is not closed
+                   by :meth:`done`.
+        session: Session to share with other clients. It is not closed by
+                 :meth:`done`; ``connector`` and ``connection_options`` are
+                 ignored when a session is given.
+        chunk_size: Number of bytes read from disk at a time when uploading.
+                    Files are read in a thread pool, never on the event loop.
+        progress_interval: Minimum number of seconds between two progress
+                           reports of the same upload.
+        dedup_index: Content-hash index used to copy already uploaded files
+                     instead of uploading them again.
+        metadata_cache: Cache for :meth:`get_content` results. Write methods
+                        called on this client invalidate the affected entries.
+        json_codec: JSON encoder/decoder for API bodies. Defaults to orjson or
+                    msgspec when installed, else the standard library.
+        response_models: Return typed models (:class:`UploadResult`,
+                         :class:`Folder`, :class:`File`, :class:`DirectLink`,
+                         :class:`Account`) instead of dicts from the methods
+                         that have one.
+        metrics: :class:`Metrics` recording counters and latency histograms
+                 of every API request attempt, per endpoint and host.
+        tracer: :class:`RequestTracer` receiving the connection-phase timings
+                (DNS, connect, send, wait) of every HTTP request made by the
+                client's own session.
+        coalesce_reads: Let concurrent identical calls of :meth:`get_content`,
+                        :meth:`search_content`, :meth:`get_account_id` and
+                        :meth:`get_account` share one in-flight request. All
+                        callers get the same result object (which must not be
+                        modified) or exception.
 
     Supports use as an async context manager:
 
@@ -40,37 +125,123 @@ class Gofile:
         "upload-sa-sao",
     }
 
-    def __init__(self, token: Optional[str] = None):
+    VALID_ATTRIBUTES = {
+        "name",
+        "description",
+        "tags",
+        "public",
+        "expiry",
+        "password",
+    }
+
+    # Settings for server="auto": how long a probed server is kept, how long a
+    # single probe may take, the smallest upload whose throughput is tracked,
+    # and the fraction of the tracked throughput below which servers are
+    # probed again.
+    AUTO_SERVER_TTL = 600.0
+    AUTO_SERVER_PROBE_TIMEOUT = 5.0
+    AUTO_SERVER_MIN_SAMPLE = 1024 * 1024
+    AUTO_SERVER_SLOWDOWN = 0.5
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        connector: Optional[BaseConnector] = None,
+        session: Optional[ClientSession] = None,
+        chunk_size: int = 256 * 1024,
+        progress_interval: float = 0.5,
+        dedup_index: Optional[DedupIndex] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        json_codec: Optional[JsonCodec] = None,
+        response_models: bool = False,
+        metrics: Optional[Metrics] = None,
+        tracer: Optional[RequestTracer] = None,
+        coalesce_reads: bool = False,
+    ):
         self.api_url = "https://api.gofile.io"
+        # Base URL of upload servers; {server} is replaced by the server name.
+        self.upload_url = "https://{server}.gofile.io"
         self.token = token
-        self._session: Optional[ClientSession] = None
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy
+        self.connection_options = connection_options or ConnectionOptions()
+        self._connector = connector
+        self._session: Optional[ClientSession] = session
+        self._owns_session = session is None
+        self.chunk_size = chunk_size
+        self.progress_interval = progress_interval
+        self.dedup_index = dedup_index
+        self.metadata_cache = metadata_cache
+        self.json_codec = json_codec or JsonCodec.default()
+        self.response_models = response_models
+        self.metrics = metrics
+        self.tracer = tracer
+        self.coalesce_reads = coalesce_reads
+        self.coalesced = 0
+        self._inflight: Dict[Hashable, List[Any]] = {}
+        self._auto_server: Optional[str] = None
+        self._auto_server_expires = 0.0
+        self._auto_server_speed: Optional[float] = None
+        self._auto_server_lock: Optional[Lock] = None
 
     async def _get_session(self) -> ClientSession:
         if self._session is None or self._session.closed:
-            self._session = ClientSession()
+            connector = self._connector or self.connection_options.create_connector()
+            self._session = ClientSession(
+                connector=connector,
+                connector_owner=self._connector is None,
+                trace_configs=[self.tracer.trace_config()] if self.tracer else None,
+            )
+            self._owns_session = True
         return self._session
 
+    def _invalidate(self, *contentIds: Optional[str]) -> None:
+        # Drops cached metadata of the given (comma-separated) content IDs
+        # and their parent folders after a write.
+        if self.metadata_cache is None:
+            return
+        self.metadata_cache.invalidate(
+            i for ids in contentIds if ids for i in ids.split(",")
+        )
+
+    def _model(self, factory: Callable[[Dict[str, Any]], Any], result: Any) -> Any:
+        # Converts an API result when typed models are enabled.
+        if self.response_models and isinstance(result, dict):
+            return factory(result)
+        return result
+
     async def _api_request(
         self,
         method: str,
         url: str,
         json: Optional[dict] = None,
-        data: Optional[FormData] = None,
+        data: Optional[Union[FormData, Callable[[], FormData]]] = None,
         params: Optional[dict] = None,
         need_token: bool = True,
         token: Optional[str] = None,
+        coalesce: bool = False,
     ) -> Dict[str, Any]:
         """
         Make an API request to the Gofile server.
 
+        Transient failures are retried according to the client's retry policy.
+        With ``coalesce_reads`` enabled, concurrent coalescable requests with
+        the same method, URL, parameters and token share one request.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE).
             url: Full URL for the request.
             json: JSON body for the request.
-            data: Form data for the request (used for file uploads).
+            data: Form data for the request (used for file uploads). A callable
+                  returning fresh form data may be passed so that the body can
+                  be rebuilt for every attempt.
             params: Query parameters for the request.
             need_token: Whether a token is required for this request.
             token: Optional per-request token. Overrides the instance token.
+            coalesce: Whether the request is read-only and may be shared.
 
         Returns:
             The 'data' field from the API response.
@@ -84,22 +255,162 @@ class Gofile:
         headers: Dict[str, str] = {}
         if auth_token:
             headers["Authorization"] = f"Bearer {auth_token}"
+        if json is not None:
+            # Encoded once here rather than by aiohttp on every attempt.
+            data = self.json_codec.dumps(json)
+            headers["Content-Type"] = "application/json"
+
+        host = urlsplit(url).hostname or ""
+
+        def attempt() -> Awaitable[Dict[str, Any]]:
+            return self._send(
+                session,
+                host,
+                method,
+                url,
+                data() if callable(data) else data,
+                params,
+                headers,
+            )
+
+        async def call() -> Dict[str, Any]:
+            if self.tracer is None:
+                return await self._retrying(attempt)
+            # All attempts of the call are traced under one correlation ID.
+            with correlation():
+                return await self._retrying(attempt)
+
+        if coalesce and self.coalesce_reads:
+            key = (method, url, tuple(sorted(params.items())) if params else (), auth_token)
+            return await self._single_flight(key, call)
+        return await call()
+
+    async def _single_flight(
+        self, key: Hashable, call: Callable[[], Awaitable[T]]
+    ) -> T:
+        # Runs call() once for all concurrent callers with the same key. The
+        # shared request is only cancelled once every caller is cancelled.
+        flight = self._inflight.get(key)
+        if flight is None:
+            # [shared task, number of callers waiting for it]
+            flight = self._inflight[key] = [ensure_future(call()), 0]
+            flight[0].add_done_callback(lambda _: self._land(key, flight))
+        else:
+            self.coalesced += 1
+        task = flight[0]
+        flight[1] += 1
+        try:
+            return await shield(task)
+        finally:
+            flight[1] -= 1
+            if not flight[1] and not task.done():
+                task.cancel()
+                self._land(key, flight)
+
+    def _land(self, key: Hashable, flight: List[Any]) -> None:
+        # Later callers start a new request once a flight is done or abandoned.
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    async def _retrying(self, attempt_once: Callable[[], Awaitable[T]]) -> T:
+        # Runs attempt_once until it succeeds or the retry policy gives up.
+        policy = self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                return await attempt_once()
+            except Exception as e:
+                if (
+                    policy is None
+                    or attempt >= policy.max_attempts
+                    or not policy.is_retryable(e)
+                ):
+                    raise
+            await asleep(policy.backoff(attempt))
+            attempt += 1
+
+    async def _send(
+        self,
+        session: ClientSession,
+        host: str,
+        method: str,
+        url: str,
+        data: Optional[Union[FormData, bytes]],
+        params: Optional[dict],
+        headers: Dict[str, str],
+    ) -> Dict[str, Any]:
+        await self.rate_limiter.acquire(host)
+        metrics = self.metrics
+        if metrics is None:
+            return await self._exchange(session, host, method, url, data, params, headers)
+
+        if isinstance(data, FormData):
+            # Serialized here so the size of the multipart body is known.
+            data = data()
+        sent = len(data) if isinstance(data, bytes) else getattr(data, "size", None) or 0
+        sample: List[Any] = [None, 0]
+        error: Optional[BaseException] = None
+        started = time.perf_counter()
+        try:
+            return await self._exchange(
+                session, host, method, url, data, params, headers, sample
+            )
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            metrics.observe(
+                endpoint_name(method, url),
+                host,
+                time.perf_counter() - started,
+                status=sample[0],
+                error=error,
+                bytes_sent=sent,
+                bytes_received=sample[1],
+            )
 
+    async def _exchange(
+        self,
+        session: ClientSession,
+        host: str,
+        method: str,
+        url: str,
+        data: Any,
+        params: Optional[dict],
+        headers: Dict[str, str],
+        sample: Optional[List[Any]] = None,
+    ) -> Dict[str, Any]:
+        # Sends one request and parses the API response. The status and
+        # response size are stored in `sample` for the metrics.
         async with session.request(
-            method, url, json=json, data=data, params=params, headers=headers
+            method, url, data=data, params=params, headers=headers
         ) as resp:
-            if resp.status == 429:
+            code = resp.status
+            if sample is not None:
+                sample[0] = code
+            if code == 429:
+                self.rate_limiter.on_rate_limited(
+                    host, RateLimiter.parse_retry_after(resp.headers.get("Retry-After"))
+                )
                 raise RateLimitError()
+            if code < 400:
+                self.rate_limiter.on_success(host)
+            # A dropped body raises ClientPayloadError, which is retryable.
+            body = await resp.read()
+            if sample is not None:
+                sample[1] = len(body)
             try:
-                result = await resp.json(content_type=None)
+                result = self.json_codec.loads(body)
             except Exception as e:
-                raise ResponseError("Invalid API response") from e
+                raise ResponseError("Invalid API response", code) from e
+            if not isinstance(result, dict):
+                raise ResponseError("Invalid API response", code)
 
         status = result.get("status")
         if status == "ok":
             return result.get("data", {})
 
-        raise ResponseError(status or "unknown error")
+        raise ResponseError(status or "unknown error", code)
 
     async def upload(
         self,
@@ -107,6 +418,7 @@ class Gofile:
         folderId: Optional[str] = None,
         server: Optional[str] = None,
         token: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """
         Upload a file to Gofile storage.
@@ -116,59 +428,312 @@ class Gofile:
             folderId: Destination folder ID. If omitted, a new folder is created.
             server: Regional upload server (e.g. 'upload-eu-par' for Paris).
                     Defaults to automatic server selection via 'upload'.
+                    'auto' uses the regional server picked by :meth:`select_server`.
             token: Optional per-request token. Overrides the instance token.
+            progress: Callback receiving an :class:`UploadProgress` with bytes
+                      sent, total bytes, throughput and elapsed time while the
+                      file is sent.
 
         Returns:
             Upload result containing file info, parentFolder, and (for guest
-            uploads) guestToken.
+            uploads) guestToken. If the client has a dedup index and the file's
+            content was uploaded before, the existing content is copied into
+            ``folderId`` instead, renamed to the file's name if needed, and
+            the copy's 'id', 'name', 'size' and 'parentFolder' are returned
+            with 'duplicateOf' set to the source content ID. A failed rename
+            does not fail the upload; 'name' is then the name the copy kept,
+            if the API reported it.
         """
-        if not os.path.isfile(file):
+        result, _ = await self._upload(file, folderId, server, token, progress)
+        return result
+
+    async def _upload(
+        self,
+        file: str,
+        folderId: Optional[str],
+        server: Optional[str],
+        token: Optional[str],
+        progress: Optional[ProgressCallback],
+    ) -> Tuple[Dict[str, Any], os.stat_result]:
+        # Returns the upload result and the stat of the file taken before it
+        # was sent, which upload_folder records in its journal.
+        try:
+            st = await get_running_loop().run_in_executor(None, os.stat, file)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise InvalidPath(f"{file} is not a valid file path")
 
-        if server:
-            if server not in self.VALID_SERVERS:
-                raise InvalidOption(server)
-            url = f"https://{server}.gofile.io/uploadfile"
-        else:
-            url = "https://upload.gofile.io/uploadfile"
+        auto = server == "auto"
+        if server and not auto and server not in self.VALID_SERVERS:
+            raise InvalidOption(server)
 
-        fh = open(file, "rb")
-        try:
+        digest = None
+        index = self.dedup_index
+        if index is not None:
+            digest = await get_running_loop().run_in_executor(
+                None, index.hash_file, file, self.chunk_size
+            )
+            contentId = index.get(digest)
+            # Copying needs an authenticated destination folder; otherwise
+            # the file is uploaded as usual.
+            if contentId and folderId and (token or self.token):
+                try:
+                    copied = await self.copy_content(contentId, folderId, token=token)
+                except ResponseError:
+                    index.discard(digest)
+                else:
+                    # The copy result maps the source ID to the new content.
+                    entry = copied.get(contentId)
+                    if not isinstance(entry, dict):
+                        entry = copied
+                    newId = entry.get("id")
+                    if newId and newId != contentId:
+                        name = os.path.basename(file)
+                        if entry.get("name") != name:
+                            try:
+                                await self.update_content(newId, "name", name, token=token)
+                            except Exception:
+                                # The copy exists either way; failing here
+                                # would make a retry copy the content again.
+                                name = entry.get("name")
+                        copy: Dict[str, Any] = {"id": newId}
+                        if name is not None:
+                            copy["name"] = name
+                        copy.update(
+                            size=st.st_size, parentFolder=folderId, duplicateOf=contentId
+                        )
+                        return self._model(UploadResult.from_dict, copy), st
+                    # No usable copy ID; upload the file as usual.
+                    index.discard(digest)
+
+        if auto:
+            server = await self.select_server()
+        url = self.upload_url.format(server=server or "upload") + "/uploadfile"
+
+        # The form is rebuilt for every attempt so a retried upload streams
+        # the whole file again.
+        def build_form() -> FormData:
             data = FormData()
             data.add_field(
-                "file", fh, filename=os.path.basename(file)
+                "file",
+                FilePayload(
+                    file,
+                    st.st_size,
+                    self.chunk_size,
+                    progress=progress,
+                    progress_interval=self.progress_interval,
+                ),
+                filename=os.path.basename(file),
             )
             if folderId:
                 data.add_field("folderId", folderId)
+            return data
 
-            return await self._api_request(
-                "POST", url, data=data, need_token=False, token=token
+        started = time.monotonic()
+        result = await self._api_request(
+            "POST", url, data=build_form, need_token=False, token=token
+        )
+        if auto and st.st_size >= self.AUTO_SERVER_MIN_SAMPLE:
+            self._record_auto_server_speed(
+                server, st.st_size / max(time.monotonic() - started, 1e-6)
             )
-        finally:
-            fh.close()
+        if digest is not None:
+            uploadedId = result.get("fileId") or result.get("id")
+            if uploadedId:
+                index.add(digest, uploadedId)
+        self._invalidate(folderId or result.get("parentFolder"))
+        return self._model(UploadResult.from_dict, result), st
+
+    async def select_server(self, refresh: bool = False) -> str:
+        """
+        Pick the regional upload server with the lowest latency.
+
+        All regional servers are probed concurrently and the fastest one is
+        cached for :attr:`AUTO_SERVER_TTL` seconds. The cache is also dropped
+        when an upload through the chosen server runs much slower than
+        earlier ones. Falls back to 'upload' if no server answers.
+
+        Args:
+            refresh: Probe again even if a cached choice is still valid.
+
+        Returns:
+            Name of the selected upload server.
+        """
+        if self._auto_server_lock is None:
+            self._auto_server_lock = Lock()
+        async with self._auto_server_lock:
+            if (
+                refresh
+                or self._auto_server is None
+                or time.monotonic() >= self._auto_server_expires
+            ):
+                servers = sorted(self.VALID_SERVERS - {"upload"})
+                # A throwaway pool keeps warm connections from favouring the
+                # server that is already in use.
+                async with ClientSession(
+                    connector=self.connection_options.create_connector()
+                ) as session:
+                    latencies = await gather(
+                        *(self._probe_server(session, s) for s in servers)
+                    )
+                latency, best = min(zip(latencies, servers))
+                self._auto_server = best if latency != float("inf") else "upload"
+                self._auto_server_expires = time.monotonic() + self.AUTO_SERVER_TTL
+                self._auto_server_speed = None
+            return self._auto_server
+
+    async def _probe_server(self, session: ClientSession, server: str) -> float:
+        # Time a HEAD request on a new connection, which covers DNS, TCP and
+        # TLS setup as well as one round trip.
+        started = time.monotonic()
+        try:
+            async with session.head(
+                self.upload_url.format(server=server) + "/",
+                timeout=ClientTimeout(total=self.AUTO_SERVER_PROBE_TIMEOUT),
+            ):
+                pass
+        except Exception:
+            return float("inf")
+        return time.monotonic() - started
+
+    def _record_auto_server_speed(self, server: str, speed: float) -> None:
+        if server != self._auto_server:
+            return
+        baseline = self._auto_server_speed
+        if baseline is not None and speed < baseline * self.AUTO_SERVER_SLOWDOWN:
+            self._auto_server_expires = 0.0
+            self._auto_server_speed = None
+            return
+        self._auto_server_speed = speed if baseline is None else 0.8 * baseline + 0.2 * speed
 
     async def upload_folder(
         self,
         path: str,
         folderId: Optional[str] = None,
-        delay: int = 3,
+        delay: float = 0,
         server: Optional[str] = None,
         token: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        journal: Optional[Union[str, UploadJournal]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Upload all files in a folder to Gofile storage.
+        Upload all files in a folder to Gofile storage, one at a time.
+
+        Stops at the first failed upload. Use :meth:`upload_folder_concurrently`
+        to upload with several workers and collect per-file failures instead.
 
         Args:
             path: Path to the folder to upload.
             folderId: Destination folder ID. If omitted, a new folder is created
                       from the first upload's response.
-            delay: Time interval between file uploads in seconds (to avoid rate limits).
+            delay: Extra time interval between file uploads in seconds. Requests
+                   are already paced by the client's rate limiter.
             server: Regional upload server.
             token: Optional per-request token. Overrides the instance token.
+            progress: Callback receiving an :class:`UploadProgress` for each
+                      file as it is sent.
+            journal: Path to an :class:`UploadJournal` file, or a journal
+                     instance. Completed uploads are recorded in it, and files
+                     already recorded in the destination folder with the same
+                     size and mtime are skipped (their recorded result is
+                     returned). If ``folderId`` is omitted, the recorded
+                     parentFolder is reused.
 
         Returns:
             List of upload results for each file.
         """
+
+        async def run(
+            files: List[str],
+            folderId: Optional[str],
+            journal: Optional[UploadJournal],
+            completed: Dict[str, Dict[str, Any]],
+        ) -> List[Dict[str, Any]]:
+            uploaded: List[Dict[str, Any]] = []
+            sent = 0
+            for file_path in files:
+                if file_path in completed:
+                    uploaded.append(
+                        self._model(UploadResult.from_dict, completed[file_path])
+                    )
+                    continue
+                if delay and sent:
+                    await asleep(delay)
+                result, st = await self._upload(
+                    file_path, folderId, server, token, progress
+                )
+                sent += 1
+                if journal is not None:
+                    journal.record(file_path, result, st)
+                uploaded.append(result)
+                if folderId is None:
+                    folderId = result.get("parentFolder")
+            return uploaded
+
+        return await self._upload_folder_files(path, folderId, journal, run)
+
+    async def upload_folder_concurrently(
+        self,
+        path: str,
+        folderId: Optional[str] = None,
+        delay: float = 0,
+        server: Optional[str] = None,
+        token: Optional[str] = None,
+        concurrency: int = 4,
+        progress: Optional[ProgressCallback] = None,
+        journal: Optional[Union[str, UploadJournal]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload all files in a folder with a pool of parallel workers.
+
+        The workers pull files from a shared queue. A failed upload does not
+        stop the others; its exception is returned in place of its result.
+
+        Args:
+            path: Path to the folder to upload.
+            folderId: Destination folder ID. If omitted, files are uploaded one
+                      at a time until one succeeds, and the rest go into the
+                      folder created by that upload.
+            delay: Extra time interval between the uploads of each worker in
+                   seconds.
+            server: Regional upload server.
+            token: Optional per-request token. Overrides the instance token.
+            concurrency: Number of parallel upload workers.
+            progress: Callback receiving an :class:`UploadProgress` for each
+                      file as it is sent.
+            journal: Path to an :class:`UploadJournal` file, or a journal
+                     instance, as for :meth:`upload_folder`.
+
+        Returns:
+            Dict mapping each file path to its upload result, or to the
+            exception raised while uploading it.
+        """
+        if concurrency < 1:
+            raise InvalidOption(f"concurrency={concurrency}")
+
+        async def run(
+            files: List[str],
+            folderId: Optional[str],
+            journal: Optional[UploadJournal],
+            completed: Dict[str, Dict[str, Any]],
+        ) -> Dict[str, Any]:
+            return await self._upload_files_concurrently(
+                files, folderId, delay, server, token, concurrency, progress,
+                journal, completed,
+            )
+
+        return await self._upload_folder_files(path, folderId, journal, run)
+
+    async def _upload_folder_files(
+        self,
+        path: str,
+        folderId: Optional[str],
+        journal: Optional[Union[str, UploadJournal]],
+        run: Callable[..., Awaitable[Any]],
+    ) -> Any:
+        # Lists the files of a folder upload and loads its journal, then
+        # hands both to `run`.
         if not os.path.isdir(path):
             raise InvalidPath(f"{path} is not a valid directory")
 
@@ -178,21 +743,81 @@ class Gofile:
             for name in names
         ]
 
-        if not files:
-            return []
+        own_journal = isinstance(journal, str)
+        if own_journal:
+            journal = UploadJournal(journal)
+        try:
+            completed: Dict[str, Dict[str, Any]] = {}
+            if journal is not None:
+                if folderId is None:
+                    folderId = journal.parent_folder
+                completed = await get_running_loop().run_in_executor(
+                    None, journal.completed, files, folderId
+                )
+            return await run(files, folderId, journal, completed)
+        finally:
+            if own_journal:
+                journal.close()
 
-        uploaded: List[Dict[str, Any]] = []
-        for i, file_path in enumerate(files):
-            result = await self.upload(
-                file_path, folderId=folderId, server=server, token=token
-            )
-            uploaded.append(result)
-            if folderId is None:
+    async def _upload_files_concurrently(
+        self,
+        files: List[str],
+        folderId: Optional[str],
+        delay: float,
+        server: Optional[str],
+        token: Optional[str],
+        concurrency: int,
+        progress: Optional[ProgressCallback],
+        journal: Optional[UploadJournal],
+        completed: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        results: Dict[str, Any] = {
+            file_path: self._model(UploadResult.from_dict, result)
+            for file_path, result in completed.items()
+        }
+        pending = [file_path for file_path in files if file_path not in completed]
+
+        async def upload_one(file_path: str) -> Optional[Dict[str, Any]]:
+            result = None
+            try:
+                result, st = await self._upload(
+                    file_path, folderId, server, token, progress
+                )
+                if journal is not None:
+                    journal.record(file_path, result, st)
+            except Exception as e:
+                results[file_path] = e
+            else:
+                results[file_path] = result
+            # A file that uploaded but failed to be journaled still provides
+            # the parentFolder for the rest.
+            return result
+
+        # Without a destination folder the first upload creates one, so
+        # files are sent one by one until a parentFolder is known.
+        while folderId is None and pending:
+            result = await upload_one(pending.pop(0))
+            if result is not None:
                 folderId = result.get("parentFolder")
-            if i < len(files) - 1:
-                await asleep(delay)
 
-        return uploaded
+        queue: "Queue[str]" = Queue()
+        for file_path in pending:
+            queue.put_nowait(file_path)
+
+        async def worker() -> None:
+            first = True
+            while True:
+                try:
+                    file_path = queue.get_nowait()
+                except QueueEmpty:
+                    return
+                if delay and not first:
+                    await asleep(delay)
+                first = False
+                await upload_one(file_path)
+
+        await gather(*(worker() for _ in range(min(concurrency, len(pending)))))
+        return {file_path: results[file_path] for file_path in files}
 
     async def create_folder(
         self,
@@ -221,7 +846,9 @@ class Gofile:
             payload["folderName"] = folderName
         if public is not None:
             payload["public"] = public
-        return await self._api_request("POST", url, json=payload, token=token)
+        result = await self._api_request("POST", url, json=payload, token=token)
+        self._invalidate(parentFolderId)
+        return self._model(Folder.from_dict, result)
 
     async def update_content(
         self,
@@ -243,15 +870,7 @@ class Gofile:
         Returns:
             Update result.
         """
-        valid_attributes = {
-            "name",
-            "description",
-            "tags",
-            "public",
-            "expiry",
-            "password",
-        }
-        if attribute not in valid_attributes:
+        if attribute not in self.VALID_ATTRIBUTES:
             raise InvalidOption(attribute)
 
         url = f"{self.api_url}/contents/{contentId}/update"
@@ -259,7 +878,63 @@ class Gofile:
             "attribute": attribute,
             "attributeValue": attributeValue,
         }
-        return await self._api_request("PUT", url, json=payload, token=token)
+        result = await self._api_request("PUT", url, json=payload, token=token)
+        self._invalidate(contentId)
+        return result
+
+    async def bulk_update_content(
+        self,
+        updates: Iterable[Tuple[str, str, Any]],
+        concurrency: int = 4,
+        token: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, str, Any]]:
+        """
+        Update attributes of many files or folders concurrently.
+
+        Every attribute is checked before any request is sent. Up to
+        ``concurrency`` updates run at a time, paced by the client's rate
+        limiter (and retried per its retry policy), and each outcome is
+        yielded as soon as it is known so progress can be checkpointed.
+        Leaving the loop early cancels the remaining updates.
+
+        Args:
+            updates: (contentId, attribute, attributeValue) tuples. Attributes
+                     must be one of :attr:`VALID_ATTRIBUTES`.
+            concurrency: Maximum number of requests in flight.
+            token: Optional per-request token. Overrides the instance token.
+
+        Yields:
+            (contentId, attribute, result) tuples in completion order, where
+            result is the update result or the exception raised for it.
+        """
+        if concurrency < 1:
+            raise InvalidOption(f"concurrency={concurrency}")
+
+        items = list(updates)
+        for _, attribute, _ in items:
+            if attribute not in self.VALID_ATTRIBUTES:
+                raise InvalidOption(attribute)
+
+        results: "Queue[Tuple[str, str, Any]]" = Queue()
+        remaining = iter(items)
+
+        async def worker() -> None:
+            for contentId, attribute, attributeValue in remaining:
+                try:
+                    result = await self.update_content(
+                        contentId, attribute, attributeValue, token=token
+                    )
+                except Exception as e:
+                    result = e
+                results.put_nowait((contentId, attribute, result))
+
+        workers = [ensure_future(worker()) for _ in range(min(concurrency, len(items)))]
+        try:
+            for _ in range(len(items)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
 
     async def delete_content(self, contentId: str, token: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -274,7 +949,93 @@ class Gofile:
         """
         url = f"{self.api_url}/contents"
         payload = {"contentsId": contentId}
-        return await self._api_request("DELETE", url, json=payload, token=token)
+        result = await self._api_request("DELETE", url, json=payload, token=token)
+        self._invalidate(contentId)
+        return result
+
+    async def bulk_delete_content(
+        self,
+        contentIds: Iterable[str],
+        batch_size: int = 100,
+        concurrency: int = 4,
+        token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Delete many files or folders in concurrent batches.
+
+        IDs are sent ``batch_size`` at a time with up to ``concurrency``
+        batches in flight. If the server rejects a batch with an error a
+        single ID can cause (such as not found), it is split in half and each
+        half is retried, so a bad ID only fails on its own. Errors rejecting
+        the request as a whole (authentication, rate limits, server errors)
+        fail the batch right away.
+
+        Args:
+            contentIds: Content IDs to delete. Duplicates are removed.
+            batch_size: Maximum number of IDs per request.
+            concurrency: Maximum number of requests in flight.
+            token: Optional per-request token. Overrides the instance token.
+
+        Returns:
+            Dict mapping each content ID to its deletion result, or to the
+            exception raised while deleting it.
+        """
+        if batch_size < 1:
+            raise InvalidOption(f"batch_size={batch_size}")
+        if concurrency < 1:
+            raise InvalidOption(f"concurrency={concurrency}")
+
+        ids = list(dict.fromkeys(contentIds))
+        report: Dict[str, Any] = {}
+        semaphore = Semaphore(concurrency)
+
+        async def delete_batch(batch: List[str]) -> None:
+            try:
+                async with semaphore:
+                    result = await self.delete_content(",".join(batch), token=token)
+            except ResponseError as e:
+                if len(batch) > 1 and self._is_per_id_error(e):
+                    middle = len(batch) // 2
+                    await gather(delete_batch(batch[:middle]), delete_batch(batch[middle:]))
+                    return
+                for contentId in batch:
+                    report[contentId] = e
+                return
+            except Exception as e:
+                for contentId in batch:
+                    report[contentId] = e
+                return
+            for contentId in batch:
+                item = result.get(contentId) if isinstance(result, dict) else None
+                if isinstance(item, dict) and item.get("status", "ok") != "ok":
+                    report[contentId] = ResponseError(item["status"])
+                elif isinstance(item, dict):
+                    report[contentId] = item.get("data", item)
+                else:
+                    report[contentId] = {}
+
+        await gather(
+            *(
+                delete_batch(ids[i:i + batch_size])
+                for i in range(0, len(ids), batch_size)
+            )
+        )
+        return {contentId: report[contentId] for contentId in ids}
+
+    # API statuses that reject a request whatever content IDs it holds.
+    BATCH_ERROR_STATUSES = frozenset({
+        "error-notAuthenticated",
+        "error-notPremium",
+        "error-rateLimit",
+        "error-token",
+    })
+
+    def _is_per_id_error(self, error: ResponseError) -> bool:
+        # Whether a failed batch request may succeed for part of its IDs.
+        if error.status in self.BATCH_ERROR_STATUSES:
+            return False
+        code = error.code
+        return code is None or (code < 500 and code not in (401, 429))
 
     async def get_content(
         self,
@@ -293,11 +1054,135 @@ class Gofile:
         Returns:
             Content information including metadata and file listings.
         """
+        cache = self.metadata_cache
+        if cache is not None:
+            cached = cache.get(contentId, password, token or self.token)
+            if cached is not None:
+                return cached
+
         url = f"{self.api_url}/contents/{contentId}"
         params: Optional[Dict[str, str]] = None
         if password is not None:
             params = {"password": password}
-        return await self._api_request("GET", url, params=params, token=token)
+        result = self._model(
+            parse_content,
+            await self._api_request(
+                "GET", url, params=params, token=token, coalesce=True
+            ),
+        )
+        if cache is not None:
+            cache.set(contentId, result, password, token or self.token)
+        return result
+
+    async def iter_content(
+        self,
+        contentId: str,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the children of a folder while its listing is downloaded.
+
+        Unlike :meth:`get_content`, the response is parsed incrementally and
+        each child is yielded as soon as it has been decoded, so memory use
+        stays bounded however large the folder is. The metadata cache is not
+        used. Only opening the response is retried; a failure while reading
+        it is raised to the caller.
+
+        Args:
+            contentId: The folder ID.
+            password: SHA-256 hash of the password for password-protected content.
+            token: Optional per-request token. Overrides the instance token.
+
+        Yields:
+            Every direct child of the folder, in listing order.
+        """
+        auth_token = token or self.token
+        if auth_token is None:
+            raise InvalidToken()
+
+        url = f"{self.api_url}/contents/{contentId}"
+        params = {"password": password} if password is not None else None
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        session = await self._get_session()
+        host = urlsplit(url).hostname or ""
+
+        async def open_listing() -> ClientResponse:
+            await self.rate_limiter.acquire(host)
+            resp = await session.get(url, params=params, headers=headers)
+            # 4xx bodies carry the API's error status, which is raised
+            # while parsing; 429 and 5xx are raised here so they are retried.
+            try:
+                if resp.status == 429 or resp.status >= 500:
+                    self._check_download_status(host, resp)
+                if resp.status < 400:
+                    self.rate_limiter.on_success(host)
+            except Exception:
+                resp.release()
+                raise
+            return resp
+
+        resp = await self._retrying(open_listing)
+        try:
+            async for kind, value in iter_children(resp.content, self.chunk_size):
+                if kind == "child":
+                    yield self._model(parse_content, value)
+                elif kind == "status" and value != "ok":
+                    raise ResponseError(value or "unknown error", resp.status)
+        except ValueError as e:
+            raise ResponseError("Invalid API response", resp.status) from e
+        finally:
+            resp.release()
+
+    async def walk(
+        self,
+        contentId: str,
+        concurrency: int = 4,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Recursively list a folder tree.
+
+        Folders are expanded breadth-first with up to ``concurrency``
+        :meth:`get_content` calls in flight. Entries are yielded as soon as
+        their parent folder's listing arrives, so the tree is never held in
+        memory as a whole. Leaving the loop early cancels pending requests.
+
+        Args:
+            contentId: The root folder ID.
+            concurrency: Maximum number of concurrent :meth:`get_content` calls.
+            password: SHA-256 hash of the password for password-protected content.
+            token: Optional per-request token. Overrides the instance token.
+
+        Yields:
+            Every file and folder below the root folder.
+        """
+        if concurrency < 1:
+            raise InvalidOption(f"concurrency={concurrency}")
+
+        pending = deque([contentId])
+        running: Set["Task[Dict[str, Any]]"] = set()
+        try:
+            while pending or running:
+                while pending and len(running) < concurrency:
+                    running.add(
+                        ensure_future(
+                            self.get_content(pending.popleft(), password, token=token)
+                        )
+                    )
+                done, running = await wait(running, return_when=FIRST_COMPLETED)
+                for task in done:
+                    children = task.result().get("children") or {}
+                    if isinstance(children, dict):
+                        children = children.values()
+                    for child in children:
+                        if child.get("type") == "folder":
+                            pending.append(child["id"])
+                        yield child
+        finally:
+            for task in running:
+                task.cancel()
 
     async def search_content(
         self,
@@ -318,7 +1203,9 @@ class Gofile:
         """
         url = f"{self.api_url}/contents/search"
         params = {"contentId": contentId, "searchedString": searchedString}
-        return await self._api_request("GET", url, params=params, token=token)
+        return await self._api_request(
+            "GET", url, params=params, token=token, coalesce=True
+        )
 
     async def copy_content(
         self,
@@ -343,7 +1230,9 @@ class Gofile:
         payload: Dict[str, str] = {"contentsId": contentsId, "folderId": folderId}
         if password is not None:
             payload["password"] = password
-        return await self._api_request("POST", url, json=payload, token=token)
+        result = await self._api_request("POST", url, json=payload, token=token)
+        self._invalidate(folderId)
+        return result
 
     async def move_content(
         self,
@@ -364,7 +1253,9 @@ class Gofile:
         """
         url = f"{self.api_url}/contents/move"
         payload = {"contentsId": contentsId, "folderId": folderId}
-        return await self._api_request("PUT", url, json=payload, token=token)
+        result = await self._api_request("PUT", url, json=payload, token=token)
+        self._invalidate(contentsId, folderId)
+        return result
 
     async def import_content(
         self,
@@ -441,7 +1332,10 @@ class Gofile:
         payload = self._build_direct_link_payload(
             expireTime, sourceIpsAllowed, domainsAllowed, domainsBlocked, auth
         )
-        return await self._api_request("POST", url, json=payload, token=token)
+        return self._model(
+            DirectLink.from_dict,
+            await self._api_request("POST", url, json=payload, token=token),
+        )
 
     async def update_direct_link(
         self,
@@ -474,7 +1368,10 @@ class Gofile:
         payload = self._build_direct_link_payload(
             expireTime, sourceIpsAllowed, domainsAllowed, domainsBlocked, auth
         )
-        return await self._api_request("PUT", url, json=payload, token=token)
+        return self._model(
+            DirectLink.from_dict,
+            await self._api_request("PUT", url, json=payload, token=token),
+        )
 
     async def delete_direct_link(
         self,
@@ -496,6 +1393,169 @@ class Gofile:
         url = f"{self.api_url}/contents/{contentId}/directlinks/{directLinkId}"
         return await self._api_request("DELETE", url, token=token)
 
+    # --- Downloads ---
+
+    async def download(
+        self,
+        contentId: str,
+        dest: str,
+        segments: int = 4,
+        min_segment_size: int = 8 * 1024 * 1024,
+        token: Optional[str] = None,
+    ) -> str:
+        """
+        Download a file to disk.
+
+        The download link is taken from :meth:`get_content`, or created with
+        :meth:`create_direct_link` if the content has none. The body is streamed
+        to disk in chunks. If the server accepts byte ranges and the file is at
+        least two segments long, up to ``segments`` HTTP Range requests run in
+        parallel, each writing its part of a preallocated file; if the server
+        answers them with the whole file, it is downloaded in one stream
+        instead. Data is written to ``<dest>.part``, which is renamed once the
+        download completes.
+
+        Args:
+            contentId: The content ID of the file.
+            dest: Destination file path, or an existing directory to save the
+                  file under its Gofile name.
+            segments: Maximum number of parallel ranged requests.
+            min_segment_size: Minimum size of a segment in bytes.
+            token: Optional per-request token. Overrides the instance token.
+
+        Returns:
+            Path of the downloaded file.
+        """
+        info = await self.get_content(contentId, token=token)
+        link = info.get("link")
+        if not link:
+            link = (await self.create_direct_link(contentId, token=token)).get("directLink")
+        if not link:
+            raise ResponseError("No download link available")
+
+        if os.path.isdir(dest):
+            dest = os.path.join(dest, os.path.basename(info.get("name") or contentId))
+
+        auth_token = token or self.token
+        headers: Dict[str, str] = {}
+        if auth_token:
+            headers["Cookie"] = f"accountToken={auth_token}"
+
+        session = await self._get_session()
+        host = urlsplit(link).hostname or ""
+        size, ranges = await self._retrying(
+            lambda: self._probe_download(session, host, link, headers)
+        )
+
+        part = dest + ".part"
+        loop = get_running_loop()
+        try:
+            segmented = ranges and segments > 1 and size >= 2 * min_segment_size
+            if segmented:
+                count = min(segments, size // min_segment_size)
+                step = -(-size // count)
+                bounds = [(i, min(i + step, size) - 1) for i in range(0, size, step)]
+                await loop.run_in_executor(None, self._preallocate, part, size)
+                tasks = [
+                    ensure_future(
+                        self._retrying(
+                            lambda b=b: self._download_range(
+                                session, host, link, headers, part, b
+                            )
+                        )
+                    )
+                    for b in bounds
+                ]
+                try:
+                    await gather(*tasks)
+                except _RangeIgnored:
+                    # HEAD advertised byte ranges but the GET did not honour
+                    # them; download the file in one stream instead.
+                    segmented = False
+                finally:
+                    # Stop the other segments before the part file is
+                    # rewritten or removed.
+                    for task in tasks:
+                        task.cancel()
+                    await gather(*tasks, return_exceptions=True)
+            if not segmented:
+                await self._retrying(
+                    lambda: self._download_range(session, host, link, headers, part)
+                )
+            await loop.run_in_executor(None, os.replace, part, dest)
+        except BaseException:
+            await loop.run_in_executor(None, self._remove_quietly, part)
+            raise
+        return dest
+
+    async def _probe_download(
+        self,
+        session: ClientSession,
+        host: str,
+        link: str,
+        headers: Dict[str, str],
+    ) -> Tuple[int, bool]:
+        # Returns the file size (0 if unknown) and whether ranges are accepted.
+        await self.rate_limiter.acquire(host)
+        async with session.head(link, headers=headers, allow_redirects=True) as resp:
+            if resp.status != 429 and resp.status >= 400:
+                # HEAD not supported; fall back to a single streamed GET.
+                return 0, False
+            self._check_download_status(host, resp)
+            size = int(resp.headers.get("Content-Length") or 0)
+            ranges = resp.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return size, ranges
+
+    async def _download_range(
+        self,
+        session: ClientSession,
+        host: str,
+        link: str,
+        headers: Dict[str, str],
+        part: str,
+        bounds: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        loop = get_running_loop()
+        if bounds is None:
+            fh = await loop.run_in_executor(None, open, part, "wb")
+        else:
+            headers = dict(headers, Range=f"bytes={bounds[0]}-{bounds[1]}")
+            fh = await loop.run_in_executor(None, open, part, "r+b")
+        try:
+            if bounds is not None:
+                await loop.run_in_executor(None, fh.seek, bounds[0])
+            await self.rate_limiter.acquire(host)
+            async with session.get(link, headers=headers) as resp:
+                self._check_download_status(host, resp)
+                if bounds is not None and resp.status != 206:
+                    raise _RangeIgnored()
+                async for chunk in resp.content.iter_chunked(self.chunk_size):
+                    await loop.run_in_executor(None, fh.write, chunk)
+        finally:
+            await loop.run_in_executor(None, fh.close)
+
+    def _check_download_status(self, host: str, resp: ClientResponse) -> None:
+        if resp.status == 429:
+            self.rate_limiter.on_rate_limited(
+                host, RateLimiter.parse_retry_after(resp.headers.get("Retry-After"))
+            )
+            raise RateLimitError()
+        if resp.status >= 400:
+            raise ResponseError(f"HTTP {resp.status}", resp.status)
+        self.rate_limiter.on_success(host)
+
+    @staticmethod
+    def _preallocate(path: str, size: int) -> None:
+        with open(path, "wb") as fh:
+            fh.truncate(size)
+
+    @staticmethod
+    def _remove_quietly(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     # --- Account ---
 
     async def get_account_id(self, token: Optional[str] = None) -> Dict[str, Any]:
@@ -509,7 +1569,10 @@ class Gofile:
             Account ID information.
         """
         url = f"{self.api_url}/accounts/getid"
-        return await self._api_request("GET", url, token=token)
+        return self._model(
+            Account.from_dict,
+            await self._api_request("GET", url, token=token, coalesce=True),
+        )
 
     async def get_account(self, accountId: str, token: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -523,7 +1586,10 @@ class Gofile:
             Account information.
         """
         url = f"{self.api_url}/accounts/{accountId}"
-        return await self._api_request("GET", url, token=token)
+        return self._model(
+            Account.from_dict,
+            await self._api_request("GET", url, token=token, coalesce=True),
+        )
 
     async def reset_token(self, accountId: str, token: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -540,8 +1606,8 @@ class Gofile:
         return await self._api_request("POST", url, token=token)
 
     async def done(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
+        """Close the HTTP session, unless it was shared with the client."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
     async def __aenter__(self):
@@ -2,48 +2,262 @@
 # Author: https://github.com/Itz-fork
 # Project: https://github.com/Itz-fork/Gofile2
 import asyncio
-from typing import Any, Dict, List, Optional
-
+import inspect
+import threading
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .cache import MetadataCache
+from .codec import JsonCodec
+from .connection import ConnectionOptions
+from .dedup import DedupIndex
+from .errors import InvalidOption
 from .gofile2 import Gofile
+from .journal import UploadJournal
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import ProgressCallback
+from .tracing import RequestTracer
+
+T = TypeVar("T")
+
+
+async def _shutdown(client: Gofile) -> None:
+    # Cancel requests that were submitted but never waited for.
+    current = asyncio.current_task()
+    tasks = [t for t in asyncio.all_tasks() if t is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await client.done()
+
+
+def _close(
+    loop: asyncio.AbstractEventLoop, thread: threading.Thread, client: Gofile
+) -> None:
+    # Closes the client and stops its loop thread. Used by done() and as
+    # the finalizer of instances dropped without calling it, so it must not
+    # reference the Sync_Gofile itself.
+    if threading.current_thread() is thread:
+        # Collected on the loop thread, which cannot wait for itself.
+        loop.call_soon(loop.stop)
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_shutdown(client), loop).result()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
 
 
 class Sync_Gofile:
     """
     Synchronous API wrapper for the Gofile REST API.
 
-    Wraps the async :class:`Gofile` client using an internal event loop.
+    Wraps the async :class:`Gofile` client. The client runs on a private
+    event loop in a background thread, and every call is handed to it with
+    :func:`asyncio.run_coroutine_threadsafe`. Any number of threads can share
+    one instance (and its connection pool) concurrently, and it can be used
+    from code that already runs an event loop, such as Jupyter notebooks.
+    Progress callbacks are invoked on the background thread. The thread is
+    stopped by :meth:`done`, or when the instance is garbage collected.
+
+    :meth:`submit` and :meth:`map_upload` start requests without waiting for
+    them, so a single thread can keep many requests in flight.
 
     Args:
         token: API token for authentication.
+        rate_limiter: Adaptive per-host rate limiter used to pace requests.
+        retry_policy: Retry policy for transient failures.
+        connection_options: Connection pool settings.
+        chunk_size: Number of bytes read from disk at a time when uploading.
+        progress_interval: Minimum number of seconds between progress reports.
+        dedup_index: Content-hash index used to copy already uploaded files
+                     instead of uploading them again.
+        metadata_cache: Cache for :meth:`get_content` results.
+        json_codec: JSON encoder/decoder for API bodies.
+        response_models: Return typed models instead of dicts.
+        metrics: Request metrics recorder.
+        tracer: Connection-phase tracer.
+        coalesce_reads: Share in-flight requests of identical concurrent reads.
 
     Supports use as a context manager:
 
         with Sync_Gofile(token="...") as g:
             g.upload("file.txt")
-
-    Note:
-        Cannot be used inside a running async event loop
-        (e.g. Jupyter notebooks or async frameworks).
-        Use :class:`Gofile` directly in those contexts.
     """
 
-    def __init__(self, token: Optional[str] = None):
-        try:
-            running_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            running_loop = None
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        chunk_size: int = 256 * 1024,
+        progress_interval: float = 0.5,
+        dedup_index: Optional[DedupIndex] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        json_codec: Optional[JsonCodec] = None,
+        response_models: bool = False,
+        metrics: Optional[Metrics] = None,
+        tracer: Optional[RequestTracer] = None,
+        coalesce_reads: bool = False,
+    ):
+        self._async_client = Gofile(
+            token,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            connection_options=connection_options,
+            chunk_size=chunk_size,
+            progress_interval=progress_interval,
+            dedup_index=dedup_index,
+            metadata_cache=metadata_cache,
+            json_codec=json_codec,
+            response_models=response_models,
+            metrics=metrics,
+            tracer=tracer,
+            coalesce_reads=coalesce_reads,
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="Sync_Gofile", daemon=True
+        )
+        self._thread.start()
+        self._close_lock = threading.Lock()
+        self._finalizer = weakref.finalize(
+            self, _close, self._loop, self._thread, self._async_client
+        )
 
-        if running_loop is not None:
+    def _submit(self, coro: Awaitable[T]) -> "Future[T]":
+        if self._loop.is_closed() or not self._loop.is_running():
+            coro.close()
+            raise RuntimeError("Sync_Gofile is closed")
+        if threading.current_thread() is self._thread:
+            coro.close()
             raise RuntimeError(
-                "Sync_Gofile cannot be used inside an already running "
-                "event loop. Use the async Gofile client instead."
+                "Sync_Gofile methods cannot be called from its own event loop "
+                "thread (e.g. inside a progress callback)"
             )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
-        self._async_client = Gofile(token)
-        self._loop = asyncio.new_event_loop()
+    def _run(self, coro: Awaitable[T]) -> T:
+        future = self._submit(coro)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _iterate(self, agen: AsyncIterator[T]) -> Iterator[T]:
+        try:
+            while True:
+                try:
+                    yield self._run(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if self._loop.is_running():
+                self._run(agen.aclose())
+
+    def submit(self, method: str, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """
+        Start a request without waiting for it to finish.
 
-    def _run(self, coro):
-        return self._loop.run_until_complete(coro)
+        Args:
+            method: Name of a :class:`Gofile` method, e.g. ``"get_content"``.
+                    Iterator methods such as :meth:`walk` cannot be submitted.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            A :class:`concurrent.futures.Future` resolving to the method's
+            result. Cancelling it cancels the request.
+        """
+        func = None if method.startswith("_") or method == "done" else getattr(
+            self._async_client, method, None
+        )
+        if not inspect.iscoroutinefunction(func):
+            raise InvalidOption(f"method={method!r}")
+        return self._submit(func(*args, **kwargs))
+
+    def map_upload(
+        self,
+        paths: Iterable[str],
+        folderId: Optional[str] = None,
+        server: Optional[str] = None,
+        token: Optional[str] = None,
+        concurrency: int = 4,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Upload many files, keeping up to ``concurrency`` uploads in flight.
+
+        Args:
+            paths: Paths of the files to upload.
+            folderId: Destination folder ID. If omitted, the first upload
+                      creates a folder and the other files are uploaded into
+                      it; files are sent one at a time until that succeeds.
+            server: Regional upload server.
+            token: Optional per-request token. Overrides the instance token.
+            concurrency: Maximum number of uploads in flight.
+            progress: Callback receiving an :class:`UploadProgress` for each file.
+
+        Yields:
+            (path, result) tuples in completion order. ``result`` is the
+            exception if that upload failed.
+        """
+        if concurrency < 1:
+            raise InvalidOption(f"concurrency={concurrency}")
+        paths = iter(paths)
+        # Every upload without a folderId would create its own folder.
+        while folderId is None:
+            path = next(paths, None)
+            if path is None:
+                return
+            try:
+                result = self.upload(path, None, server, token=token, progress=progress)
+            except Exception as e:
+                result = e
+            else:
+                folderId = result.get("parentFolder")
+            yield path, result
+        pending: Dict["Future[Dict[str, Any]]", str] = {}
+        try:
+            while True:
+                for path in paths:
+                    future = self.submit(
+                        "upload", path, folderId, server, token=token, progress=progress
+                    )
+                    pending[future] = path
+                    if len(pending) >= concurrency:
+                        break
+                if not pending:
+                    return
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    path = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    yield path, result
+        finally:
+            for future in pending:
+                future.cancel()
 
     def upload(
         self,
@@ -51,6 +265,7 @@ class Sync_Gofile:
         folderId: Optional[str] = None,
         server: Optional[str] = None,
         token: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """
         Upload a file to Gofile storage.
@@ -60,35 +275,106 @@ class Sync_Gofile:
             folderId: Destination folder ID.
             server: Regional upload server.
             token: Optional per-request token. Overrides the instance token.
+            progress: Callback receiving an :class:`UploadProgress` while the
+                      file is sent.
 
         Returns:
             Upload result dict.
         """
-        return self._run(self._async_client.upload(file, folderId, server, token=token))
+        return self._run(
+            self._async_client.upload(file, folderId, server, token=token, progress=progress)
+        )
+
+    def select_server(self, refresh: bool = False) -> str:
+        """
+        Pick the regional upload server with the lowest latency.
+
+        Args:
+            refresh: Probe again even if a cached choice is still valid.
+
+        Returns:
+            Name of the selected upload server.
+        """
+        return self._run(self._async_client.select_server(refresh))
 
     def upload_folder(
         self,
         path: str,
         folderId: Optional[str] = None,
-        delay: int = 3,
+        delay: float = 0,
         server: Optional[str] = None,
         token: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        journal: Optional[Union[str, UploadJournal]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Upload all files in a folder to Gofile storage.
+        Upload all files in a folder to Gofile storage, one at a time.
 
         Args:
             path: Path to the folder to upload.
             folderId: Destination folder ID.
-            delay: Time interval between file uploads in seconds.
+            delay: Extra time interval between file uploads in seconds.
             server: Regional upload server.
             token: Optional per-request token. Overrides the instance token.
+            progress: Callback receiving an :class:`UploadProgress` for each file.
+            journal: Path to an :class:`UploadJournal` file, or a journal
+                     instance, used to skip files uploaded by an earlier run.
 
         Returns:
-            List of upload results for each file.
+            List of upload results for each file. Stops at the first failure.
         """
         return self._run(
-            self._async_client.upload_folder(path, folderId, delay, server, token=token)
+            self._async_client.upload_folder(
+                path,
+                folderId,
+                delay,
+                server,
+                token=token,
+                progress=progress,
+                journal=journal,
+            )
+        )
+
+    def upload_folder_concurrently(
+        self,
+        path: str,
+        folderId: Optional[str] = None,
+        delay: float = 0,
+        server: Optional[str] = None,
+        token: Optional[str] = None,
+        concurrency: int = 4,
+        progress: Optional[ProgressCallback] = None,
+        journal: Optional[Union[str, UploadJournal]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload all files in a folder with a pool of parallel workers.
+
+        Args:
+            path: Path to the folder to upload.
+            folderId: Destination folder ID.
+            delay: Extra time interval between the uploads of each worker.
+            server: Regional upload server.
+            token: Optional per-request token. Overrides the instance token.
+            concurrency: Number of parallel upload workers.
+            progress: Callback receiving an :class:`UploadProgress` for each file.
+            journal: Path to an :class:`UploadJournal` file, or a journal
+                     instance, used to skip files uploaded by an earlier run.
+
+        Returns:
+            Dict mapping each file path to its upload result, or to the
+            exception raised while uploading it.
+        """
+        return self._run(
+            self._async_client.upload_folder_concurrently(
+                path,
+                folderId,
+                delay,
+                server,
+                token=token,
+                concurrency=concurrency,
+                progress=progress,
+                journal=journal,
+            )
         )
 
     def create_folder(
@@ -139,6 +425,27 @@ class Sync_Gofile:
             )
         )
 
+    def bulk_update_content(
+        self,
+        updates: Iterable[Tuple[str, str, Any]],
+        concurrency: int = 4,
+        token: Optional[str] = None,
+    ) -> Iterator[Tuple[str, str, Any]]:
+        """
+        Update attributes of many files or folders concurrently.
+
+        Args:
+            updates: (contentId, attribute, attributeValue) tuples.
+            concurrency: Maximum number of requests in flight.
+            token: Optional per-request token. Overrides the instance token.
+
+        Yields:
+            (contentId, attribute, result) tuples in completion order.
+        """
+        return self._iterate(
+            self._async_client.bulk_update_content(updates, concurrency, token=token)
+        )
+
     def delete_content(self, contentId: str, token: Optional[str] = None) -> Dict[str, Any]:
         """
         Delete files or folders.
@@ -152,6 +459,31 @@ class Sync_Gofile:
         """
         return self._run(self._async_client.delete_content(contentId, token=token))
 
+    def bulk_delete_content(
+        self,
+        contentIds: Iterable[str],
+        batch_size: int = 100,
+        concurrency: int = 4,
+        token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Delete many files or folders in concurrent batches.
+
+        Args:
+            contentIds: Content IDs to delete.
+            batch_size: Maximum number of IDs per request.
+            concurrency: Maximum number of requests in flight.
+            token: Optional per-request token. Overrides the instance token.
+
+        Returns:
+            Dict mapping each content ID to its deletion result or exception.
+        """
+        return self._run(
+            self._async_client.bulk_delete_content(
+                contentIds, batch_size, concurrency, token=token
+            )
+        )
+
     def get_content(
         self,
         contentId: str,
@@ -171,6 +503,50 @@ class Sync_Gofile:
         """
         return self._run(self._async_client.get_content(contentId, password, token=token))
 
+    def iter_content(
+        self,
+        contentId: str,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the children of a folder while its listing is downloaded.
+
+        Args:
+            contentId: The folder ID.
+            password: SHA-256 hash of the password for password-protected content.
+            token: Optional per-request token. Overrides the instance token.
+
+        Yields:
+            Every direct child of the folder, in listing order.
+        """
+        return self._iterate(
+            self._async_client.iter_content(contentId, password, token=token)
+        )
+
+    def walk(
+        self,
+        contentId: str,
+        concurrency: int = 4,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Recursively list a folder tree.
+
+        Args:
+            contentId: The root folder ID.
+            concurrency: Maximum number of concurrent folder listings.
+            password: SHA-256 hash of the password for password-protected content.
+            token: Optional per-request token. Overrides the instance token.
+
+        Yields:
+            Every file and folder below the root folder.
+        """
+        return self._iterate(
+            self._async_client.walk(contentId, concurrency, password, token=token)
+        )
+
     def search_content(
         self,
         contentId: str,
@@ -342,6 +718,33 @@ class Sync_Gofile:
             self._async_client.delete_direct_link(contentId, directLinkId, token=token)
         )
 
+    def download(
+        self,
+        contentId: str,
+        dest: str,
+        segments: int = 4,
+        min_segment_size: int = 8 * 1024 * 1024,
+        token: Optional[str] = None,
+    ) -> str:
+        """
+        Download a file to disk.
+
+        Args:
+            contentId: The content ID of the file.
+            dest: Destination file path, or an existing directory.
+            segments: Maximum number of parallel ranged requests.
+            min_segment_size: Minimum size of a segment in bytes.
+            token: Optional per-request token. Overrides the instance token.
+
+        Returns:
+            Path of the downloaded file.
+        """
+        return self._run(
+            self._async_client.download(
+                contentId, dest, segments, min_segment_size, token=token
+            )
+        )
+
     def get_account_id(self, token: Optional[str] = None) -> Dict[str, Any]:
         """
         Get the account ID associated with the current API token.
@@ -381,10 +784,17 @@ class Sync_Gofile:
         return self._run(self._async_client.reset_token(accountId, token=token))
 
     def done(self) -> None:
-        """Close the HTTP session and event loop."""
-        if not self._loop.is_closed():
-            self._run(self._async_client.done())
-            self._loop.close()
+        """
+        Close the HTTP session and stop the event loop thread.
+
+        Requests still in flight are cancelled.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "Sync_Gofile.done() cannot be called from its own event loop thread"
+            )
+        with self._close_lock:
+            self._finalizer()
 
     def __enter__(self):
         return self
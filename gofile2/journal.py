@@ -0,0 +1,126 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import json
+import os
+from typing import IO, Any, Dict, Iterable, Optional
+
+
+def _open_append(path: str) -> IO[str]:
+    # Opens a JSON Lines file for appending. A partial last line left by a
+    # crash is ended first, so it does not swallow the next entry.
+    fh = open(path, "a", encoding="utf-8")
+    if os.path.getsize(path):
+        with open(path, "rb") as tail:
+            tail.seek(-1, os.SEEK_END)
+            if tail.read(1) != b"\n":
+                fh.write("\n")
+                fh.flush()
+    return fh
+
+
+class UploadJournal:
+    """
+    Append-only JSON Lines record of completed uploads.
+
+    Every uploaded file is written as one line holding its path, size, mtime,
+    fileId, parentFolder and the full upload result. Lines are flushed as soon
+    as they are written, so an interrupted folder upload can be resumed by
+    running it again with the same journal: files whose size and mtime did not
+    change are skipped and the recorded parentFolder is reused.
+
+    A partially written last line (e.g. after a crash) is ignored on load.
+
+    Args:
+        path: Path to the journal file. Created if it does not exist.
+
+    Supports use as a context manager.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.parent_folder: Optional[str] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._entries[entry["path"]] = entry
+                    if entry.get("parentFolder"):
+                        self.parent_folder = entry["parentFolder"]
+        self._fh = _open_append(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def completed(
+        self, files: Iterable[str], folderId: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the recorded upload results of files that are unchanged on disk.
+
+        Args:
+            files: Paths of the files to look up.
+            folderId: Only count uploads into this folder. Files recorded in
+                      another folder are left out, so they are uploaded again.
+
+        Returns:
+            Dict mapping each completed path to its recorded upload result.
+        """
+        done: Dict[str, Dict[str, Any]] = {}
+        for file in files:
+            entry = self._entries.get(os.path.abspath(file))
+            if entry is None:
+                continue
+            if folderId is not None and entry["parentFolder"] != folderId:
+                continue
+            try:
+                st = os.stat(file)
+            except OSError:
+                continue
+            if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime"]:
+                done[file] = entry["result"]
+        return done
+
+    def record(
+        self, file: str, result: Dict[str, Any], st: Optional[os.stat_result] = None
+    ) -> None:
+        """
+        Record a completed upload.
+
+        Args:
+            file: Path of the uploaded file.
+            result: Upload result returned by :meth:`Gofile.upload`.
+            st: ``os.stat`` result of the file taken before it was sent. A
+                file modified during the upload then no longer matches its
+                entry and is uploaded again on resume. Stats the file now if
+                omitted.
+        """
+        if st is None:
+            st = os.stat(file)
+        entry = {
+            "path": os.path.abspath(file),
+            "size": st.st_size,
+            "mtime": st.st_mtime_ns,
+            "fileId": result.get("fileId") or result.get("id"),
+            "parentFolder": result.get("parentFolder"),
+            "result": dict(result),
+        }
+        self._fh.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._fh.flush()
+        self._entries[entry["path"]] = entry
+        if entry["parentFolder"]:
+            self.parent_folder = entry["parentFolder"]
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,245 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Path segments of the API that are kept in endpoint names; every other
+# segment is an ID and is replaced by {id} to bound the number of series.
+_STATIC_SEGMENTS = frozenset({
+    "accounts",
+    "contents",
+    "copy",
+    "createFolder",
+    "directlinks",
+    "getid",
+    "import",
+    "move",
+    "resettoken",
+    "search",
+    "update",
+    "uploadfile",
+})
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Low-cardinality name of a request, e.g. ``"GET /contents/{id}"``."""
+    path = urlsplit(url).path.strip("/")
+    segments = [s if s in _STATIC_SEGMENTS else "{id}" for s in path.split("/") if s]
+    return f"{method} /" + "/".join(segments)
+
+
+class _Series:
+    # Counters of one (endpoint, host) pair.
+    __slots__ = (
+        "requests",
+        "statuses",
+        "errors",
+        "bytes_sent",
+        "bytes_received",
+        "buckets",
+        "latency_sum",
+    )
+
+    def __init__(self, buckets: int) -> None:
+        self.requests = 0
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.buckets = [0] * (buckets + 1)
+        self.latency_sum = 0.0
+
+    def merge(self, other: "_Series") -> None:
+        self.requests += other.requests
+        for status, n in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + n
+        for error, n in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + n
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.latency_sum += other.latency_sum
+
+
+class Metrics:
+    """
+    Request metrics of one or more :class:`Gofile` clients.
+
+    Every attempt of an API request is recorded under its endpoint (the HTTP
+    method and path with IDs replaced by ``{id}``, e.g. ``"GET
+    /contents/{id}"``) and host: the number of attempts, response statuses,
+    errors by exception type, bytes sent and received, and the latency in a
+    histogram with fixed buckets. Recording an attempt only updates a few
+    counters, so metrics can stay enabled in production.
+
+    Args:
+        buckets: Upper bounds of the latency histogram buckets in seconds, in
+                 increasing order. A ``+Inf`` bucket is always added.
+
+    A single instance can be shared by several clients, also from different
+    threads.
+    """
+
+    DEFAULT_BUCKETS = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0
+    )
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        if list(self.buckets) != sorted(set(self.buckets)):
+            raise ValueError("buckets must be strictly increasing")
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        endpoint: str,
+        host: str,
+        seconds: float,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record one request attempt.
+
+        Args:
+            endpoint: Endpoint name (see :func:`endpoint_name`).
+            host: Host the request was sent to.
+            seconds: Time from sending the request to reading the response.
+            status: HTTP status of the response, if one was received.
+            error: Exception the attempt failed with, if any.
+            bytes_sent: Size of the request body.
+            bytes_received: Size of the response body.
+        """
+        bucket = bisect_left(self.buckets, seconds)
+        with self._lock:
+            key = (endpoint, host)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.buckets))
+            series.requests += 1
+            if status is not None:
+                series.statuses[status] = series.statuses.get(status, 0) + 1
+            if error is not None:
+                name = type(error).__name__
+                series.errors[name] = series.errors.get(name, 0) + 1
+            series.bytes_sent += bytes_sent
+            series.bytes_received += bytes_received
+            series.buckets[bucket] += 1
+            series.latency_sum += seconds
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._series.clear()
+
+    def _copy(self) -> List[Tuple[Tuple[str, str], _Series]]:
+        size = len(self.buckets)
+        with self._lock:
+            copies = []
+            for key, series in self._series.items():
+                copy = _Series(size)
+                copy.merge(series)
+                copies.append((key, copy))
+        copies.sort(key=lambda item: item[0])
+        return copies
+
+    def _summary(self, series: _Series) -> Dict[str, Any]:
+        cumulative: Dict[str, int] = {}
+        total = 0
+        for bound, n in zip(self.buckets + (float("inf"),), series.buckets):
+            total += n
+            cumulative["+Inf" if bound == float("inf") else f"{bound:g}"] = total
+        return {
+            "requests": series.requests,
+            "statuses": dict(sorted(series.statuses.items())),
+            "errors": dict(sorted(series.errors.items())),
+            "bytes_sent": series.bytes_sent,
+            "bytes_received": series.bytes_received,
+            "latency": {
+                "count": series.requests,
+                "sum": series.latency_sum,
+                "buckets": cumulative,
+            },
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Current metrics as plain dicts.
+
+        Returns:
+            ``{"endpoints": {...}, "hosts": {...}}``, mapping every endpoint
+            and every host to its ``requests``, ``statuses``, ``errors``,
+            ``bytes_sent``, ``bytes_received`` and ``latency`` (``count``,
+            ``sum`` and cumulative ``buckets`` keyed by upper bound).
+        """
+        size = len(self.buckets)
+        endpoints: Dict[str, _Series] = {}
+        hosts: Dict[str, _Series] = {}
+        for (endpoint, host), series in self._copy():
+            endpoints.setdefault(endpoint, _Series(size)).merge(series)
+            hosts.setdefault(host, _Series(size)).merge(series)
+        return {
+            "endpoints": {k: self._summary(v) for k, v in sorted(endpoints.items())},
+            "hosts": {k: self._summary(v) for k, v in sorted(hosts.items())},
+        }
+
+    def prometheus(self, prefix: str = "gofile2") -> str:
+        """
+        Current metrics in the Prometheus text exposition format.
+
+        Series are labelled with ``endpoint`` and ``host``.
+
+        Args:
+            prefix: Prefix of the metric names.
+        """
+        series = self._copy()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help: str) -> str:
+            name = f"{prefix}_{name}"
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            return name
+
+        name = family("requests_total", "counter", "Request attempts sent.")
+        for key, s in series:
+            lines.append(f"{name}{{{_labels(key)}}} {s.requests}")
+        name = family("responses_total", "counter", "Responses received by HTTP status.")
+        for key, s in series:
+            for status, n in sorted(s.statuses.items()):
+                lines.append(f'{name}{{{_labels(key)},status="{status}"}} {n}')
+        name = family("errors_total", "counter", "Failed request attempts by error type.")
+        for key, s in series:
+            for error, n in sorted(s.errors.items()):
+                lines.append(f'{name}{{{_labels(key)},type="{_escape(error)}"}} {n}')
+        name = family("request_bytes_total", "counter", "Request body bytes sent.")
+        for key, s in series:
+            lines.append(f"{name}{{{_labels(key)}}} {s.bytes_sent}")
+        name = family("response_bytes_total", "counter", "Response body bytes received.")
+        for key, s in series:
+            lines.append(f"{name}{{{_labels(key)}}} {s.bytes_received}")
+        name = family("request_duration_seconds", "histogram", "Request latency.")
+        for key, s in series:
+            labels = _labels(key)
+            total = 0
+            for bound, n in zip(self.buckets, s.buckets):
+                total += n
+                lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {total}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {s.requests}')
+            lines.append(f"{name}_sum{{{labels}}} {s.latency_sum!r}")
+            lines.append(f"{name}_count{{{labels}}} {s.requests}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: Tuple[str, str]) -> str:
+    return f'endpoint="{_escape(key[0])}",host="{_escape(key[1])}"'
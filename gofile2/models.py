@@ -0,0 +1,249 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+class Model:
+    """
+    Base class of the typed API results returned when a client is created
+    with ``response_models=True``.
+
+    Known keys are stored as attributes in ``__slots__``; keys the model does
+    not know about are kept in :attr:`extra`. Models also support read-only
+    dict-style access (``result["id"]``, ``result.get("id")``, ``"id" in
+    result``, ``dict(result)``) so code written for the dict results keeps
+    working. Keys whose value is None count as missing.
+
+    Attributes:
+        extra: API keys without a dedicated attribute, or None.
+    """
+
+    __slots__ = ("extra",)
+
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, **values: Any) -> None:
+        for field in self._fields:
+            setattr(self, field, values.pop(field, None))
+        self.extra: Optional[Dict[str, Any]] = values or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Model":
+        """Build a model from an API result dict."""
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the model back to a plain (nested) dict."""
+        return {key: _plain(value) for key, value in self.items()}
+
+    def keys(self) -> List[str]:
+        keys = [field for field in self._fields if getattr(self, field) is not None]
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for key in self.keys():
+            yield key, self[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None) if key in self._fields else None
+        if value is None and self.extra is not None:
+            value = self.extra.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Model):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        shown = ", ".join(
+            f"{field}={getattr(self, field)!r}"
+            for field in self._fields[:3]
+            if getattr(self, field) is not None
+        )
+        return f"{type(self).__name__}({shown})"
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _plain(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+class UploadResult(Model):
+    """Result of :meth:`Gofile.upload`."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "parentFolder",
+        "parentFolderCode",
+        "guestToken",
+        "downloadPage",
+        "size",
+        "md5",
+        "mimetype",
+        "type",
+        "servers",
+        "createTime",
+        "modTime",
+        "duplicateOf",
+    )
+    _fields = __slots__
+
+    @property
+    def fileId(self) -> Optional[str]:
+        """ID of the uploaded file (older API versions call it ``fileId``)."""
+        return self.id or (self.extra or {}).get("fileId")
+
+
+class File(Model):
+    """A file listed by :meth:`Gofile.get_content`."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "parentFolder",
+        "size",
+        "md5",
+        "mimetype",
+        "link",
+        "downloadCount",
+        "servers",
+        "createTime",
+        "modTime",
+    )
+    _fields = __slots__
+
+
+class Folder(Model):
+    """
+    A folder returned by :meth:`Gofile.get_content` or :meth:`Gofile.create_folder`.
+
+    The ``children`` listing is kept as received and only turned into
+    :class:`File` and :class:`Folder` models the first time it is accessed.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "parentFolder",
+        "code",
+        "public",
+        "childrenCount",
+        "totalSize",
+        "totalDownloadCount",
+        "createTime",
+        "modTime",
+        "_children",
+        "_parsed",
+    )
+    _fields = __slots__[:-2]
+
+    def __init__(self, **values: Any) -> None:
+        self._children = values.pop("children", None)
+        self._parsed: Optional[Dict[str, Union[File, "Folder"]]] = None
+        super().__init__(**values)
+
+    def keys(self) -> List[str]:
+        keys = super().keys()
+        if self._children is not None or self._parsed is not None:
+            keys.append("children")
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "children":
+            children = self.children
+            if children is None:
+                raise KeyError(key)
+            return children
+        return super().__getitem__(key)
+
+    @property
+    def children(self) -> Optional[Dict[str, Union[File, "Folder"]]]:
+        """Child files and folders keyed by content ID, parsed on first access."""
+        if self._parsed is None and self._children is not None:
+            raw = self._children
+            if not isinstance(raw, dict):
+                raw = {child["id"]: child for child in raw}
+            self._parsed = {
+                childId: parse_content(child) for childId, child in raw.items()
+            }
+            self._children = None
+        return self._parsed
+
+    def child_ids(self) -> List[str]:
+        """IDs of the children, without parsing them."""
+        if self._parsed is not None:
+            return list(self._parsed)
+        raw = self._children
+        if raw is None:
+            return []
+        if isinstance(raw, dict):
+            return list(raw)
+        return [child["id"] for child in raw if child.get("id")]
+
+
+class DirectLink(Model):
+    """Result of :meth:`Gofile.create_direct_link` and :meth:`Gofile.update_direct_link`."""
+
+    __slots__ = (
+        "id",
+        "directLink",
+        "expireTime",
+        "sourceIpsAllowed",
+        "domainsAllowed",
+        "domainsBlocked",
+        "auth",
+        "isReqLink",
+    )
+    _fields = __slots__
+
+
+class Account(Model):
+    """Result of :meth:`Gofile.get_account` and :meth:`Gofile.get_account_id`."""
+
+    __slots__ = (
+        "id",
+        "email",
+        "tier",
+        "token",
+        "rootFolder",
+        "statsCurrent",
+        "createTime",
+    )
+    _fields = __slots__
+
+
+def parse_content(data: Dict[str, Any]) -> Union[File, Folder]:
+    """Build a :class:`Folder` or :class:`File` depending on the ``type`` key."""
+    if data.get("type") == "folder":
+        return Folder.from_dict(data)
+    return File.from_dict(data)
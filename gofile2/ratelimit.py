@@ -0,0 +1,125 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import time
+from asyncio import sleep as asleep
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class _HostState:
+    __slots__ = ("rate", "issued", "released", "base", "since")
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        # Requests get numbered tickets in arrival order. Ticket n may be
+        # sent once the clock, which counts `rate` per second up from `base`
+        # at time `since`, reaches n. `since` lies in the future while the
+        # host is paused.
+        self.issued = 0
+        self.released = 0
+        self.base = 0.0
+        self.since = 0.0
+
+    def clock(self, now: float) -> float:
+        return self.base + (now - self.since) * self.rate
+
+    def anchor(self, now: float) -> None:
+        # Restart the clock at `now` so a rate change only affects later
+        # tickets. Time the host sat idle is not banked for bursts.
+        if now >= self.since:
+            self.base = min(self.clock(now), self.issued)
+            self.since = now
+
+
+class RateLimiter:
+    """
+    Adaptive per-host request rate limiter.
+
+    Requests to each host are spaced ``1 / rate`` seconds apart. The rate grows
+    additively while requests succeed and is cut multiplicatively when the
+    server answers with HTTP 429, so throughput settles just under the real
+    server limit. Requests already waiting follow rate changes. A
+    ``Retry-After`` header pauses the host for the given time.
+
+    Args:
+        initial_rate: Starting requests per second for a new host.
+        min_rate: Lower bound for the rate after repeated 429s.
+        max_rate: Upper bound the rate can grow to.
+        increase: Requests per second added after each successful request.
+        decrease: Factor the rate is multiplied by after a 429.
+
+    A single instance can be shared by several :class:`Gofile` clients.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 100.0,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ) -> None:
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._hosts: Dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.initial_rate)
+        return state
+
+    def rate(self, host: str) -> float:
+        """Current requests per second allowed for ``host``."""
+        return self._state(host).rate
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to ``host`` may be sent."""
+        state = self._state(host)
+        now = time.monotonic()
+        state.anchor(now)
+        ticket = state.issued
+        state.issued += 1
+        while True:
+            wait = (ticket - state.clock(now)) / state.rate
+            if wait <= 0:
+                state.released = max(state.released, ticket + 1)
+                return
+            # Waking at least once per interval lets waiting requests go
+            # sooner when the rate grows, and later after a 429.
+            await asleep(min(wait, 1.0 / state.rate))
+            now = time.monotonic()
+
+    def on_success(self, host: str) -> None:
+        """Record a successful request and raise the rate for ``host``."""
+        state = self._state(host)
+        state.anchor(time.monotonic())
+        state.rate = min(self.max_rate, state.rate + self.increase)
+
+    def on_rate_limited(self, host: str, retry_after: Optional[float] = None) -> None:
+        """Record a 429 response and back off ``host``."""
+        state = self._state(host)
+        state.rate = max(self.min_rate, state.rate * self.decrease)
+        pause = retry_after if retry_after is not None else 1.0 / state.rate
+        # Requests not sent yet, including those already waiting, queue
+        # again behind the pause.
+        state.base = state.released
+        state.since = max(state.since, time.monotonic() + pause)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
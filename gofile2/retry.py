@@ -0,0 +1,58 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import random
+from asyncio import TimeoutError as AsyncTimeoutError
+from typing import FrozenSet, Iterable
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+from .errors import RateLimitError, ResponseError
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient request failures.
+
+    Failed attempts are retried after an exponential backoff with full jitter:
+    the n-th retry waits a random time between 0 and
+    ``min(max_delay, base_delay * 2 ** (n - 1))`` seconds, so concurrent
+    callers do not retry in lockstep.
+
+    Args:
+        max_attempts: Total number of attempts, including the first one.
+        base_delay: Backoff ceiling for the first retry in seconds.
+        max_delay: Upper bound for the backoff ceiling in seconds.
+        retry_statuses: HTTP status codes that are retried.
+
+    Connection errors, dropped response bodies and timeouts are always retried.
+    """
+
+    DEFAULT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: Iterable[int] = DEFAULT_STATUSES,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait after the given failed attempt (starting at 1)."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether a request that failed with ``error`` may be sent again."""
+        if isinstance(error, RateLimitError):
+            return 429 in self.retry_statuses
+        if isinstance(error, ResponseError):
+            return error.code in self.retry_statuses
+        return isinstance(
+            error, (ClientConnectionError, ClientPayloadError, AsyncTimeoutError)
+        )
@@ -0,0 +1,265 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import codecs
+import json
+import os
+import time
+from asyncio import get_running_loop
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from aiohttp import StreamReader
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.payload import Payload
+
+
+class UploadProgress:
+    """
+    Snapshot of an upload's progress passed to progress callbacks.
+
+    Attributes:
+        file: Path of the file being uploaded.
+        bytes_sent: Bytes of the file sent so far.
+        total_bytes: Size of the file in bytes.
+        speed: Throughput since the previous report in bytes per second.
+        average_speed: Throughput since the upload started in bytes per second.
+        elapsed: Seconds since the upload started.
+    """
+
+    __slots__ = ("file", "bytes_sent", "total_bytes", "speed", "average_speed", "elapsed")
+
+    def __init__(
+        self,
+        file: str,
+        bytes_sent: int,
+        total_bytes: int,
+        speed: float,
+        average_speed: float,
+        elapsed: float,
+    ) -> None:
+        self.file = file
+        self.bytes_sent = bytes_sent
+        self.total_bytes = total_bytes
+        self.speed = speed
+        self.average_speed = average_speed
+        self.elapsed = elapsed
+
+    @property
+    def done(self) -> bool:
+        return self.bytes_sent >= self.total_bytes
+
+    def __repr__(self) -> str:
+        return (
+            f"UploadProgress(file={self.file!r}, bytes_sent={self.bytes_sent}, "
+            f"total_bytes={self.total_bytes}, speed={self.speed:.0f}, "
+            f"average_speed={self.average_speed:.0f}, elapsed={self.elapsed:.3f})"
+        )
+
+
+ProgressCallback = Callable[[UploadProgress], Any]
+
+
+class FilePayload(Payload):
+    """
+    Request body that streams a file from disk without blocking the event loop.
+
+    The file is opened, read and closed in the loop's default thread pool, one
+    chunk at a time, so memory use stays at ``chunk_size`` bytes regardless of
+    the file size. Every :meth:`write` reads the file from the start, which
+    lets a failed upload be sent again.
+
+    Args:
+        path: Path to the file.
+        size: File size in bytes, used for the Content-Length header.
+        chunk_size: Number of bytes read per chunk.
+        progress: Callback receiving an :class:`UploadProgress` as chunks are
+                  sent. It is called at most once per ``progress_interval``
+                  seconds, plus once when the whole file has been sent.
+        progress_interval: Minimum number of seconds between progress reports.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        chunk_size: int,
+        progress: Optional[ProgressCallback] = None,
+        progress_interval: float = 0.5,
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("filename", os.path.basename(path))
+        super().__init__(path, **kwargs)
+        self._size = size
+        self._chunk_size = chunk_size
+        self._progress = progress
+        self._progress_interval = progress_interval
+
+    async def write(self, writer: AbstractStreamWriter) -> None:
+        loop = get_running_loop()
+        fh = await loop.run_in_executor(None, open, self._value, "rb")
+        progress = self._progress
+        sent = 0
+        start = last_time = time.monotonic()
+        last_sent = 0
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, fh.read, self._chunk_size)
+                if not chunk:
+                    break
+                await writer.write(chunk)
+                if progress is None:
+                    continue
+                sent += len(chunk)
+                now = time.monotonic()
+                if now - last_time < self._progress_interval and sent < self._size:
+                    continue
+                elapsed = now - start
+                progress(
+                    UploadProgress(
+                        self._value,
+                        sent,
+                        self._size,
+                        (sent - last_sent) / (now - last_time) if now > last_time else 0.0,
+                        sent / elapsed if elapsed > 0 else 0.0,
+                        elapsed,
+                    )
+                )
+                last_time, last_sent = now, sent
+        finally:
+            await loop.run_in_executor(None, fh.close)
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        with open(self._value, "rb") as fh:
+            return fh.read().decode(encoding, errors)
+
+
+_WHITESPACE = " \t\r\n"
+
+
+class _JsonReader:
+    # Pull parser over a byte stream. Scalars and whole sub-values are
+    # decoded with json.JSONDecoder.raw_decode once they are complete, and
+    # consumed text is dropped so the buffer only ever holds about one
+    # chunk plus the value being decoded.
+
+    def __init__(self, content: StreamReader, chunk_size: int) -> None:
+        self._content = content
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = await self._content.read(self._chunk_size)
+        self._eof = not chunk
+        text = self._utf8.decode(chunk, final=self._eof)
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+        return bool(text) or not self._eof
+
+    async def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not await self._fill():
+                return ""
+
+    async def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of ``chars``."""
+        char = await self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} at {char!r}")
+        self._pos += 1
+        return char
+
+    async def value(self) -> Any:
+        """Decode and consume one complete JSON value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                value, end = None, -1
+            # A number at the very end of the buffer may continue in the
+            # next chunk, so it is only accepted once more text follows.
+            if end != -1 and (
+                end < len(self._buf) or self._eof or not self._buf[end - 1].isdigit()
+            ):
+                self._pos = end
+                return value
+            if not await self._fill():
+                raise ValueError("Truncated JSON document")
+
+
+async def _members(reader: _JsonReader) -> AsyncIterator[Any]:
+    # Yields the keys of an object; the caller consumes each value.
+    await reader.expect("{")
+    if await reader.peek() == "}":
+        await reader.expect("}")
+        return
+    while True:
+        key = await reader.value()
+        await reader.expect(":")
+        yield key
+        if await reader.expect(",}") == "}":
+            return
+
+
+async def _elements(reader: _JsonReader) -> AsyncIterator[None]:
+    # Yields once per array element; the caller consumes each value.
+    await reader.expect("[")
+    if await reader.peek() == "]":
+        await reader.expect("]")
+        return
+    while True:
+        yield None
+        if await reader.expect(",]") == "]":
+            return
+
+
+async def iter_children(
+    content: StreamReader, chunk_size: int = 64 * 1024
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Incrementally parse a ``get_content`` response body.
+
+    Yields ``("child", entry)`` for every entry of ``data.children`` as soon
+    as it has been decoded, ``("status", value)`` for the top-level status
+    and ``("info", dict)`` with the folder's other fields once ``data`` has
+    been read. Memory use is bounded by ``chunk_size`` plus the size of the
+    largest single entry, however many children the folder has.
+
+    Raises:
+        ValueError: If the body is not valid JSON of the expected shape.
+    """
+    reader = _JsonReader(content, chunk_size)
+    async for key in _members(reader):
+        if key != "data" or await reader.peek() != "{":
+            value = await reader.value()
+            if key == "status":
+                yield "status", value
+            continue
+        info: Dict[str, Any] = {}
+        async for field in _members(reader):
+            kind = await reader.peek() if field == "children" else ""
+            if kind == "{":
+                async for childId in _members(reader):
+                    child = await reader.value()
+                    if isinstance(child, dict):
+                        child.setdefault("id", childId)
+                    yield "child", child
+            elif kind == "[":
+                async for _ in _elements(reader):
+                    yield "child", await reader.value()
+            else:
+                info[field] = await reader.value()
+        yield "info", info
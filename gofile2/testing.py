@@ -0,0 +1,760 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+"""
+Local Gofile API emulator for tests and load tests.
+
+:class:`GofileEmulator` serves the content, upload, direct link, account and
+download endpoints from an in-memory store, and :class:`Faults` injects
+latency, 429 bursts, server errors and dropped connections into its
+responses::
+
+    async with GofileEmulator() as emulator:
+        account = emulator.add_account()
+        emulator.faults.append(Faults(latency=0.05).rate_limit(3, retry_after=1))
+        async with emulator.client(account["token"]) as g:
+            await g.upload("file.txt", folderId=account["rootFolder"])
+"""
+import asyncio
+import hashlib
+import itertools
+import json
+import mimetypes
+import random
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Union
+from urllib.parse import quote, unquote
+
+from aiohttp import web
+
+from .gofile2 import Gofile
+
+
+class Faults:
+    """
+    Faults injected into the emulator's responses.
+
+    Probabilistic faults are drawn for every matching request. Scripted
+    faults added with :meth:`rate_limit`, :meth:`fail` and :meth:`disconnect`
+    hit the next matching requests in the order they were added, before any
+    probabilistic fault is considered.
+
+    Args:
+        latency: Seconds added before each response, or a callable returning
+                 them for a latency distribution (e.g.
+                 ``lambda: random.lognormvariate(-3, 0.5)``).
+        error_rate: Probability that a request fails with ``error_status``.
+        error_status: HTTP status of failed requests.
+        disconnect_rate: Probability that the connection is dropped halfway
+                         through the response body.
+        endpoints: Names of the endpoints the faults apply to (see
+                   :attr:`GofileEmulator.ENDPOINTS`); all if omitted.
+        seed: Seed for the random decisions.
+    """
+
+    def __init__(
+        self,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        disconnect_rate: float = 0.0,
+        endpoints: Optional[Iterable[str]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.disconnect_rate = disconnect_rate
+        self.endpoints: Optional[Set[str]] = set(endpoints) if endpoints is not None else None
+        self._random = random.Random(seed)
+        self._script: Deque[List[Any]] = deque()
+
+    def rate_limit(self, count: int, retry_after: float = 1.0) -> "Faults":
+        """Answer the next ``count`` requests with 429 and a ``Retry-After`` header."""
+        self._script.append(["rate_limit", count, retry_after])
+        return self
+
+    def fail(self, count: int, status: Optional[int] = None) -> "Faults":
+        """Fail the next ``count`` requests with ``status`` (default ``error_status``)."""
+        self._script.append(["fail", count, status or self.error_status])
+        return self
+
+    def disconnect(self, count: int) -> "Faults":
+        """Drop the connection halfway through the next ``count`` responses."""
+        self._script.append(["disconnect", count, None])
+        return self
+
+    def applies_to(self, endpoint: str) -> bool:
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def delay(self) -> float:
+        """Seconds to wait before answering a request."""
+        latency = self.latency
+        return max(0.0, latency() if callable(latency) else latency)
+
+    def draw(self) -> Optional[List[Any]]:
+        """The fault for the next request as ``[kind, _, arg]``, or None."""
+        if self._script:
+            step = self._script[0]
+            step[1] -= 1
+            if step[1] <= 0:
+                self._script.popleft()
+            return step
+        if self.error_rate and self._random.random() < self.error_rate:
+            return ["fail", 0, self.error_status]
+        if self.disconnect_rate and self._random.random() < self.disconnect_rate:
+            return ["disconnect", 0, None]
+        return None
+
+
+class _JsonError(Exception):
+    # Raised by handlers to answer with an API error.
+
+    def __init__(self, status: int, code: str) -> None:
+        super().__init__(code)
+        self.status = status
+        self.code = code
+
+
+class GofileEmulator:
+    """
+    Local emulator of the Gofile API backed by an in-memory store.
+
+    Requests are authenticated with the ``Authorization: Bearer`` header
+    against accounts created with :meth:`add_account`; uploads without a
+    token create a guest account like the real service. Uploaded files can
+    be downloaded again through their ``link`` or a direct link, with
+    support for HEAD and byte ranges.
+
+    Args:
+        bandwidth: Bytes per second for upload and download bodies (None for
+                   unlimited).
+        store_data: Keep uploaded bytes in memory. If False only sizes and
+                    hashes are kept and downloads return zero bytes, which
+                    keeps load tests with large files cheap.
+
+    Attributes:
+        url: Base URL of the emulator once started.
+        faults: :class:`Faults` applied to incoming requests, in order. It
+                can be changed while the emulator runs.
+        calls: Number of requests received per endpoint.
+        responses: Number of responses sent per HTTP status, including
+                   injected faults.
+    """
+
+    ENDPOINTS = (
+        "upload",
+        "create_folder",
+        "update_content",
+        "delete_content",
+        "get_content",
+        "search_content",
+        "copy_content",
+        "move_content",
+        "import_content",
+        "create_direct_link",
+        "update_direct_link",
+        "delete_direct_link",
+        "get_account_id",
+        "get_account",
+        "reset_token",
+        "download",
+    )
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, bandwidth: Optional[float] = None, store_data: bool = True) -> None:
+        self.bandwidth = bandwidth
+        self.store_data = store_data
+        self.url = ""
+        self.faults: List[Faults] = []
+        self.calls: Counter = Counter()
+        self.responses: Counter = Counter()
+        self._ids = itertools.count(1)
+        self._accounts: Dict[str, Dict[str, Any]] = {}
+        self._tokens: Dict[str, str] = {}
+        self._contents: Dict[str, Dict[str, Any]] = {}
+        self._data: Dict[str, bytes] = {}
+        self._links: Dict[str, str] = {}
+        self._listings: Dict[str, bytes] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+    # --- Lifecycle ---
+
+    async def start(self) -> "GofileEmulator":
+        """Start serving on a free port of 127.0.0.1."""
+        app = web.Application(middlewares=[self._middleware], client_max_size=1024 ** 4)
+        route = app.router
+        route.add_post("/uploadfile", self._upload, name="upload")
+        route.add_post("/contents/createFolder", self._create_folder, name="create_folder")
+        route.add_get("/contents/search", self._search_content, name="search_content")
+        route.add_post("/contents/copy", self._copy_content, name="copy_content")
+        route.add_put("/contents/move", self._move_content, name="move_content")
+        route.add_post("/contents/import", self._import_content, name="import_content")
+        route.add_delete("/contents", self._delete_content, name="delete_content")
+        route.add_put("/contents/{contentId}/update", self._update_content, name="update_content")
+        route.add_post(
+            "/contents/{contentId}/directlinks", self._create_direct_link,
+            name="create_direct_link",
+        )
+        route.add_put(
+            "/contents/{contentId}/directlinks/{linkId}", self._update_direct_link,
+            name="update_direct_link",
+        )
+        route.add_delete(
+            "/contents/{contentId}/directlinks/{linkId}", self._delete_direct_link,
+            name="delete_direct_link",
+        )
+        route.add_get("/contents/{contentId}", self._get_content, name="get_content")
+        route.add_get("/accounts/getid", self._get_account_id, name="get_account_id")
+        route.add_get("/accounts/{accountId}", self._get_account, name="get_account")
+        route.add_post(
+            "/accounts/{accountId}/resettoken", self._reset_token, name="reset_token"
+        )
+        route.add_get("/download/{key}/{name}", self._download, name="download")
+        # Upload servers are probed with HEAD / by Gofile.select_server().
+        route.add_route("HEAD", "/", self._probe, name="probe")
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def close(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "GofileEmulator":
+        return await self.start()
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def client(self, token: Optional[str] = None, **kwargs: Any) -> Gofile:
+        """
+        Create a :class:`Gofile` client talking to this emulator.
+
+        Args:
+            token: API token of an emulated account.
+            **kwargs: Other :class:`Gofile` arguments.
+        """
+        client = Gofile(token, **kwargs)
+        client.api_url = self.url
+        client.upload_url = self.url
+        return client
+
+    # --- Store ---
+
+    def _new_id(self) -> str:
+        return f"{next(self._ids):08x}"
+
+    def _touched(self, *contentIds: Optional[str]) -> None:
+        for contentId in contentIds:
+            if contentId:
+                self._listings.pop(contentId, None)
+
+    def add_account(self, token: Optional[str] = None, tier: str = "premium") -> Dict[str, Any]:
+        """
+        Create an account with an empty root folder.
+
+        Returns:
+            The account, including its ``id``, ``token`` and ``rootFolder``.
+        """
+        accountId = self._new_id()
+        token = token or hashlib.sha256(accountId.encode()).hexdigest()[:32]
+        account = {
+            "id": accountId,
+            "email": f"{accountId}@example.com",
+            "tier": tier,
+            "token": token,
+            "rootFolder": None,
+            "createTime": int(time.time()),
+        }
+        self._accounts[accountId] = account
+        self._tokens[token] = accountId
+        account["rootFolder"] = self.add_folder(None, "root", owner=accountId)["id"]
+        return account
+
+    def add_folder(
+        self,
+        parentId: Optional[str],
+        name: Optional[str] = None,
+        public: bool = False,
+        owner: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Create a folder in ``parentId`` (a root folder if None)."""
+        folderId = self._new_id()
+        now = int(time.time())
+        folder = {
+            "id": folderId,
+            "type": "folder",
+            "name": name or folderId,
+            "parentFolder": parentId,
+            "code": folderId[-6:],
+            "createTime": now,
+            "modTime": now,
+            "public": public,
+            "owner": owner or self._contents[parentId]["owner"],
+            "children": [],
+            "directLinks": {},
+        }
+        self._insert(folder)
+        return folder
+
+    def add_file(
+        self,
+        parentId: str,
+        name: str,
+        data: Union[bytes, int] = b"",
+    ) -> Dict[str, Any]:
+        """Create a file in ``parentId`` from ``data`` (bytes, or a size in bytes)."""
+        if isinstance(data, int):
+            # Only the size is known; downloads return zero bytes.
+            return self._add_file(parentId, name, data, hashlib.md5().hexdigest(), None)
+        return self._add_file(parentId, name, len(data), hashlib.md5(data).hexdigest(), data)
+
+    def _add_file(
+        self, parentId: str, name: str, size: int, md5: str, data: Optional[bytes]
+    ) -> Dict[str, Any]:
+        fileId = self._new_id()
+        now = int(time.time())
+        entry = {
+            "id": fileId,
+            "type": "file",
+            "name": name,
+            "parentFolder": parentId,
+            "size": size,
+            "md5": md5,
+            "mimetype": mimetypes.guess_type(name)[0] or "application/octet-stream",
+            "createTime": now,
+            "modTime": now,
+            "downloadCount": 0,
+            "owner": self._contents[parentId]["owner"],
+            "directLinks": {},
+        }
+        if self.store_data and data is not None:
+            self._data[fileId] = data
+        self._insert(entry)
+        return entry
+
+    def _insert(self, entry: Dict[str, Any]) -> None:
+        self._contents[entry["id"]] = entry
+        parentId = entry["parentFolder"]
+        if parentId is not None:
+            self._contents[parentId]["children"].append(entry["id"])
+            self._touched(parentId)
+
+    def _remove(self, contentId: str) -> None:
+        entry = self._contents.pop(contentId)
+        for childId in entry.get("children", ()):
+            self._remove(childId)
+        for linkId in entry["directLinks"]:
+            self._links.pop(linkId, None)
+        self._data.pop(contentId, None)
+        self._touched(contentId)
+
+    def _detach(self, entry: Dict[str, Any]) -> None:
+        parent = self._contents.get(entry["parentFolder"])
+        if parent is not None:
+            parent["children"].remove(entry["id"])
+            self._touched(parent["id"])
+
+    def _copy(self, entry: Dict[str, Any], parentId: str) -> Dict[str, Any]:
+        if entry["type"] == "file":
+            return self._add_file(
+                parentId, entry["name"], entry["size"], entry["md5"],
+                self._data.get(entry["id"]),
+            )
+        folder = self.add_folder(parentId, entry["name"], entry["public"])
+        for childId in list(entry["children"]):
+            self._copy(self._contents[childId], folder["id"])
+        return folder
+
+    def get(self, contentId: str) -> Optional[Dict[str, Any]]:
+        """The stored entry of ``contentId``, or None."""
+        return self._contents.get(contentId)
+
+    # --- Request handling ---
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        endpoint = request.match_info.route.name or "unknown"
+        self.calls[endpoint] += 1
+        fault = None
+        for faults in self.faults:
+            if not faults.applies_to(endpoint):
+                continue
+            delay = faults.delay()
+            if delay:
+                await asyncio.sleep(delay)
+            fault = fault or faults.draw()
+
+        kind = fault[0] if fault else None
+        if kind == "rate_limit":
+            response = self._json(429, {"status": "error-rateLimit", "data": {}})
+            response.headers["Retry-After"] = f"{fault[2]:g}"
+        elif kind == "fail":
+            response = self._json(fault[2], {"status": "error-internal", "data": {}})
+        else:
+            # Streamed bodies are cut by the handler itself.
+            request["gofile2.disconnect"] = kind == "disconnect"
+            try:
+                response = await handler(request)
+            except _JsonError as e:
+                response = self._json(e.status, {"status": e.code, "data": {}})
+        self.responses[response.status] += 1
+        if kind == "disconnect":
+            return await self._disconnect(request, response)
+        return response
+
+    async def _disconnect(
+        self, request: web.Request, response: web.StreamResponse
+    ) -> web.StreamResponse:
+        # Sends the headers and half of the body, then drops the connection.
+        if response.prepared:
+            return response
+        body = response.body if isinstance(response, web.Response) else None
+        if not body or request.method == "HEAD":
+            request.transport.close()
+            return response
+        broken = web.StreamResponse(status=response.status, headers=response.headers)
+        broken.content_length = len(body)
+        await broken.prepare(request)
+        await broken.write(bytes(body[: len(body) // 2]))
+        request.transport.close()
+        return broken
+
+    @staticmethod
+    def _json(status: int, payload: Dict[str, Any]) -> web.Response:
+        return web.json_response(payload, status=status)
+
+    def _ok(self, data: Any) -> web.Response:
+        return self._json(200, {"status": "ok", "data": data})
+
+    def _account(self, request: web.Request, required: bool = True) -> Optional[Dict[str, Any]]:
+        auth = request.headers.get("Authorization", "")
+        token = auth[7:] if auth.startswith("Bearer ") else None
+        if token is None:
+            if required:
+                raise _JsonError(401, "error-notAuthenticated")
+            return None
+        accountId = self._tokens.get(token)
+        if accountId is None:
+            raise _JsonError(401, "error-token")
+        return self._accounts[accountId]
+
+    def _owned(self, account: Dict[str, Any], contentId: str) -> Dict[str, Any]:
+        entry = self._contents.get(contentId)
+        if entry is None:
+            raise _JsonError(404, "error-notFound")
+        if entry["owner"] != account["id"]:
+            raise _JsonError(403, "error-notOwner")
+        return entry
+
+    def _readable(
+        self, account: Dict[str, Any], contentId: str, password: Optional[str]
+    ) -> Dict[str, Any]:
+        entry = self._contents.get(contentId)
+        if entry is None:
+            raise _JsonError(404, "error-notFound")
+        if entry["owner"] != account["id"]:
+            if entry["type"] == "folder" and not entry["public"]:
+                raise _JsonError(403, "error-notPublic")
+            if entry.get("password") and entry["password"] != password:
+                raise _JsonError(401, "error-passwordRequired")
+        return entry
+
+    def _summary(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        info = {
+            k: v for k, v in entry.items()
+            if k not in ("owner", "children", "directLinks", "password")
+        }
+        if entry.get("password"):
+            info["password"] = True
+        if entry["directLinks"]:
+            info["directLinks"] = dict(entry["directLinks"])
+        if entry["type"] == "file":
+            info["link"] = f"{self.url}/download/{entry['id']}/{quote(entry['name'])}"
+            info["servers"] = ["emulator"]
+        else:
+            info["childrenCount"] = len(entry["children"])
+        return info
+
+    async def _probe(self, request: web.Request) -> web.Response:
+        return web.Response()
+
+    async def _read_throttled(self, read: Callable[[int], Any]) -> Any:
+        # Reads a body chunk by chunk, pacing it to the bandwidth limit.
+        while True:
+            chunk = await read(self.CHUNK_SIZE)
+            if not chunk:
+                return
+            if self.bandwidth:
+                await asyncio.sleep(len(chunk) / self.bandwidth)
+            yield chunk
+
+    # --- Endpoints ---
+
+    async def _upload(self, request: web.Request) -> web.Response:
+        account = self._account(request, required=False)
+        guestToken = None
+        if account is None:
+            account = self.add_account(tier="guest")
+            guestToken = account["token"]
+        folderId = None
+        uploaded = None
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name == "folderId":
+                folderId = await part.text()
+            elif part.name == "file":
+                digest = hashlib.md5()
+                size = 0
+                chunks = []
+                async for chunk in self._read_throttled(part.read_chunk):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    if self.store_data:
+                        chunks.append(chunk)
+                uploaded = (unquote(part.filename or "file"), size, digest.hexdigest(), b"".join(chunks))
+        if uploaded is None:
+            raise _JsonError(400, "error-noFile")
+        if folderId:
+            folder = self._owned(account, folderId)
+            if folder["type"] != "folder":
+                raise _JsonError(400, "error-notFolder")
+        else:
+            folder = self.add_folder(account["rootFolder"])
+        entry = self._add_file(folder["id"], *uploaded)
+        result = self._summary(entry)
+        result["parentFolderCode"] = folder["code"]
+        result["downloadPage"] = f"{self.url}/d/{folder['code']}"
+        if guestToken:
+            result["guestToken"] = guestToken
+        return self._ok(result)
+
+    async def _create_folder(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        body = await request.json()
+        parent = self._owned(account, body.get("parentFolderId", ""))
+        folder = self.add_folder(
+            parent["id"], body.get("folderName"), bool(body.get("public", False))
+        )
+        return self._ok(self._summary(folder))
+
+    async def _update_content(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        entry = self._owned(account, request.match_info["contentId"])
+        body = await request.json()
+        attribute, value = body.get("attribute"), body.get("attributeValue")
+        if attribute not in Gofile.VALID_ATTRIBUTES:
+            raise _JsonError(400, "error-attribute")
+        if attribute == "password" and value:
+            value = hashlib.sha256(str(value).encode()).hexdigest()
+        entry[attribute] = value
+        entry["modTime"] = int(time.time())
+        self._touched(entry["id"], entry["parentFolder"])
+        return self._ok({})
+
+    async def _delete_content(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        body = await request.json()
+        result = {}
+        for contentId in str(body.get("contentsId", "")).split(","):
+            try:
+                entry = self._owned(account, contentId)
+            except _JsonError as e:
+                result[contentId] = {"status": e.code}
+                continue
+            self._detach(entry)
+            self._remove(contentId)
+            result[contentId] = {"status": "ok"}
+        return self._ok(result)
+
+    async def _get_content(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        contentId = request.match_info["contentId"]
+        entry = self._readable(account, contentId, request.query.get("password"))
+        if entry["type"] == "file":
+            return self._ok(self._summary(entry))
+        body = self._listings.get(contentId)
+        if body is None:
+            info = self._summary(entry)
+            children = {}
+            total = 0
+            for childId in entry["children"]:
+                child = self._contents[childId]
+                children[childId] = self._summary(child)
+                total += child.get("size", 0)
+            info["children"] = children
+            info["totalSize"] = total
+            body = json.dumps({"status": "ok", "data": info}).encode()
+            self._listings[contentId] = body
+        return web.Response(body=body, content_type="application/json")
+
+    async def _search_content(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        root = self._owned(account, request.query.get("contentId", ""))
+        needle = request.query.get("searchedString", "").lower()
+        found = {}
+        pending = list(root["children"])
+        while pending:
+            entry = self._contents[pending.pop()]
+            pending.extend(entry.get("children", ()))
+            if needle in entry["name"].lower() or needle in str(entry.get("tags") or "").lower():
+                found[entry["id"]] = self._summary(entry)
+        return self._ok(found)
+
+    async def _copy_content(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        body = await request.json()
+        target = self._owned(account, body.get("folderId", ""))
+        result = {}
+        for contentId in str(body.get("contentsId", "")).split(","):
+            source = self._readable(account, contentId, body.get("password"))
+            result[contentId] = {"status": "ok", "id": self._copy(source, target["id"])["id"]}
+        return self._ok(result)
+
+    async def _move_content(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        body = await request.json()
+        target = self._owned(account, body.get("folderId", ""))
+        for contentId in str(body.get("contentsId", "")).split(","):
+            entry = self._owned(account, contentId)
+            self._detach(entry)
+            entry["parentFolder"] = target["id"]
+            self._insert(entry)
+        return self._ok({})
+
+    async def _import_content(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        body = await request.json()
+        result = {}
+        for contentId in str(body.get("contentsId", "")).split(","):
+            source = self._readable(account, contentId, body.get("password"))
+            result[contentId] = {
+                "status": "ok",
+                "id": self._copy(source, account["rootFolder"])["id"],
+            }
+        return self._ok(result)
+
+    async def _create_direct_link(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        entry = self._owned(account, request.match_info["contentId"])
+        body = await request.json() if request.can_read_body else {}
+        linkId = self._new_id()
+        link = {
+            "id": linkId,
+            "directLink": f"{self.url}/download/{linkId}/{quote(entry['name'])}",
+            "expireTime": body.get("expireTime"),
+            "sourceIpsAllowed": body.get("sourceIpsAllowed", []),
+            "domainsAllowed": body.get("domainsAllowed", []),
+            "domainsBlocked": body.get("domainsBlocked", []),
+            "auth": body.get("auth", []),
+            "isReqLink": False,
+        }
+        entry["directLinks"][linkId] = link
+        self._links[linkId] = entry["id"]
+        self._touched(entry["id"], entry["parentFolder"])
+        return self._ok(link)
+
+    def _direct_link(self, request: web.Request) -> Dict[str, Any]:
+        account = self._account(request)
+        entry = self._owned(account, request.match_info["contentId"])
+        link = entry["directLinks"].get(request.match_info["linkId"])
+        if link is None:
+            raise _JsonError(404, "error-notFound")
+        self._touched(entry["id"], entry["parentFolder"])
+        return link
+
+    async def _update_direct_link(self, request: web.Request) -> web.Response:
+        link = self._direct_link(request)
+        body = await request.json() if request.can_read_body else {}
+        for key in ("expireTime", "sourceIpsAllowed", "domainsAllowed", "domainsBlocked", "auth"):
+            if key in body:
+                link[key] = body[key]
+        return self._ok(link)
+
+    async def _delete_direct_link(self, request: web.Request) -> web.Response:
+        link = self._direct_link(request)
+        entry = self._contents[self._links.pop(link["id"])]
+        del entry["directLinks"][link["id"]]
+        return self._ok({})
+
+    async def _get_account_id(self, request: web.Request) -> web.Response:
+        return self._ok({"id": self._account(request)["id"]})
+
+    async def _get_account(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        if request.match_info["accountId"] != account["id"]:
+            raise _JsonError(403, "error-notOwner")
+        files = [e for e in self._contents.values() if e["owner"] == account["id"]]
+        info = dict(account)
+        info["statsCurrent"] = {
+            "fileCount": sum(e["type"] == "file" for e in files),
+            "folderCount": sum(e["type"] == "folder" for e in files),
+            "storage": sum(e.get("size", 0) for e in files),
+        }
+        return self._ok(info)
+
+    async def _reset_token(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        if request.match_info["accountId"] != account["id"]:
+            raise _JsonError(403, "error-notOwner")
+        del self._tokens[account["token"]]
+        account["token"] = hashlib.sha256(
+            f"{account['id']}{next(self._ids)}".encode()
+        ).hexdigest()[:32]
+        self._tokens[account["token"]] = account["id"]
+        return self._ok({})
+
+    async def _download(self, request: web.Request) -> web.StreamResponse:
+        key = request.match_info["key"]
+        entry = self._contents.get(self._links.get(key, key))
+        if entry is None or entry["type"] != "file":
+            raise _JsonError(404, "error-notFound")
+        size = entry["size"]
+        start, end = 0, size - 1
+        status = 200
+        headers = {"Accept-Ranges": "bytes", "Content-Type": entry["mimetype"]}
+        spec = request.headers.get("Range", "")
+        if spec.startswith("bytes=") and size:
+            first, _, last = spec[6:].partition("-")
+            start = int(first) if first else max(0, size - int(last))
+            end = min(int(last), size - 1) if first and last else size - 1
+            if start > end:
+                raise _JsonError(416, "error-range")
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        length = max(0, end - start + 1)
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(length)
+            return web.Response(status=status, headers=headers)
+
+        entry["downloadCount"] += 1
+        self._touched(entry["parentFolder"])
+        data = self._data.get(entry["id"])
+        if request.get("gofile2.disconnect"):
+            end = start + length // 2 - 1
+        resp = web.StreamResponse(status=status, headers=headers)
+        resp.content_length = length
+        await resp.prepare(request)
+        position = start
+        while position <= end:
+            stop = min(position + self.CHUNK_SIZE, end + 1)
+            chunk = data[position:stop] if data is not None else bytes(stop - position)
+            await resp.write(chunk)
+            if self.bandwidth:
+                await asyncio.sleep(len(chunk) / self.bandwidth)
+            position = stop
+        if request.get("gofile2.disconnect"):
+            request.transport.close()
+            return resp
+        await resp.write_eof()
+        return resp
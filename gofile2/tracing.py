@@ -0,0 +1,277 @@
+# Copyright (c) 2026 Present Itz-fork
+# Author: https://github.com/Itz-fork
+# Project: https://github.com/Itz-fork/Gofile2
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from aiohttp import TraceConfig
+
+_correlation_id: ContextVar[Optional[str]] = ContextVar("gofile2_correlation_id", default=None)
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+@contextmanager
+def correlation(correlation_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Tag the requests made inside the block with one correlation ID.
+
+    Clients with a tracer use this around every API call, so all attempts
+    of a retried call share an ID. Nested blocks keep the outermost ID,
+    which lets callers group the requests of a whole job::
+
+        with correlation("nightly-sync"):
+            await g.upload_folder("build")
+
+    Args:
+        correlation_id: ID to use; a random one is created if omitted.
+
+    Yields:
+        The correlation ID in effect.
+    """
+    current = _correlation_id.get()
+    if current is not None:
+        yield current
+        return
+    token = _correlation_id.set(correlation_id or _new_id())
+    try:
+        yield _correlation_id.get()  # type: ignore[misc]
+    finally:
+        _correlation_id.reset(token)
+
+
+class RequestTrace:
+    """
+    Phase timings of one HTTP request, passed to the tracer's callback.
+
+    ``phases`` maps each phase the request went through to its duration in
+    seconds, and ``offsets`` to its start relative to :attr:`start`:
+
+    - ``queue``: waiting for a free connection in the pool
+    - ``dns``: resolving the host name (absent on DNS cache hits)
+    - ``connect``: opening the TCP connection, including the TLS handshake
+    - ``send``: writing the request headers and body
+    - ``wait``: waiting for the response headers after the request was sent
+
+    Reading the response body happens after the trace is emitted.
+
+    Attributes:
+        correlation_id: ID shared by the attempts of one API call (see
+                        :func:`correlation`).
+        request_id: Unique ID of this HTTP request.
+        method: HTTP method.
+        url: Request URL.
+        host: Host the request was sent to.
+        status: HTTP status of the response, or None if it failed.
+        error: Exception the request failed with, or None.
+        start: Wall-clock time the request started (seconds since the epoch).
+        duration: Seconds from the start until the response headers arrived
+                  or the request failed.
+        reused_connection: Whether a pooled connection was reused.
+        phases: Duration of each phase in seconds.
+        offsets: Start of each phase in seconds after :attr:`start`.
+    """
+
+    __slots__ = (
+        "correlation_id",
+        "request_id",
+        "method",
+        "url",
+        "host",
+        "status",
+        "error",
+        "start",
+        "duration",
+        "reused_connection",
+        "phases",
+        "offsets",
+    )
+
+    def __init__(self, **values: Any) -> None:
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in self.phases.items())
+        return (
+            f"RequestTrace({self.method} {self.url} status={self.status} "
+            f"duration={self.duration * 1000:.1f}ms {phases})"
+        )
+
+
+def _span(
+    marks: Dict[str, float], start: str, end: str, until: Optional[float]
+) -> Optional[Tuple[float, float]]:
+    # (offset, duration) of a phase. A phase that never ended lasts `until`
+    # the request failed.
+    if start not in marks:
+        return None
+    stop = marks.get(end, until)
+    if stop is None:
+        return None
+    return marks[start], stop - marks[start]
+
+
+class RequestTracer:
+    """
+    Records connection-phase timings of a client's requests with aiohttp
+    trace hooks.
+
+    Pass it to :class:`Gofile` as ``tracer``; every HTTP request of the
+    client then produces a :class:`RequestTrace` once its response headers
+    arrive or it fails. Tracing only applies to sessions created by the
+    client; add :meth:`trace_config` to the ``trace_configs`` of a shared
+    session yourself.
+
+    Args:
+        callback: Called with every :class:`RequestTrace`. If omitted, traces
+                  are exported as OpenTelemetry spans, which requires the
+                  ``opentelemetry-api`` package.
+
+    Raises:
+        ImportError: If no callback is given and OpenTelemetry is not installed.
+    """
+
+    def __init__(self, callback: Optional[Callable[[RequestTrace], Any]] = None) -> None:
+        self.callback = callback or _opentelemetry_exporter()
+
+    def trace_config(self) -> TraceConfig:
+        """A new :class:`aiohttp.TraceConfig` reporting to this tracer."""
+        config = TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_connection_queued_start.append(self._mark("queue_start"))
+        config.on_connection_queued_end.append(self._mark("queue_end"))
+        config.on_connection_create_start.append(self._mark("connect_start"))
+        config.on_connection_create_end.append(self._mark("connect_end"))
+        config.on_connection_reuseconn.append(self._mark("reused"))
+        config.on_dns_resolvehost_start.append(self._mark("dns_start"))
+        config.on_dns_resolvehost_end.append(self._mark("dns_end"))
+        config.on_request_headers_sent.append(self._mark("headers_sent"))
+        config.on_request_chunk_sent.append(self._mark("body_sent"))
+        config.on_request_end.append(self._on_request_end)
+        config.on_request_exception.append(self._on_request_exception)
+        return config
+
+    @staticmethod
+    def _mark(name: str) -> Callable[..., Any]:
+        async def hook(session: Any, ctx: SimpleNamespace, params: Any) -> None:
+            # Later marks of the same name (e.g. body chunks) overwrite
+            # earlier ones.
+            ctx.marks[name] = time.perf_counter() - ctx.started
+
+        return hook
+
+    async def _on_request_start(self, session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        ctx.marks = {}
+        ctx.request_id = _new_id()
+        ctx.wall = time.time()
+        ctx.started = time.perf_counter()
+
+    async def _on_request_end(self, session: Any, ctx: SimpleNamespace, params: Any) -> None:
+        self._emit(ctx, params.method, params.url, params.response.status, None)
+
+    async def _on_request_exception(
+        self, session: Any, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self._emit(ctx, params.method, params.url, None, params.exception)
+
+    def _emit(
+        self,
+        ctx: SimpleNamespace,
+        method: str,
+        url: Any,
+        status: Optional[int],
+        error: Optional[BaseException],
+    ) -> None:
+        duration = time.perf_counter() - ctx.started
+        marks = ctx.marks
+        timeline: Dict[str, Tuple[float, float]] = {}
+        until = duration if error is not None else None
+        queue = _span(marks, "queue_start", "queue_end", until)
+        if queue:
+            timeline["queue"] = queue
+        dns = _span(marks, "dns_start", "dns_end", until)
+        if dns:
+            timeline["dns"] = dns
+        connect = _span(marks, "connect_start", "connect_end", until)
+        if connect:
+            # DNS resolution happens inside connection creation.
+            offset, length = connect
+            if dns:
+                offset, length = dns[0] + dns[1], length - dns[1]
+            timeline["connect"] = (offset, length)
+        ready = max(
+            (marks[k] for k in ("queue_end", "connect_end", "reused") if k in marks),
+            default=0.0,
+        )
+        sent = marks.get("body_sent", marks.get("headers_sent"))
+        if sent is not None:
+            timeline["send"] = (ready, sent - ready)
+            timeline["wait"] = (sent, duration - sent)
+        elif error is not None and ready:
+            timeline["send"] = (ready, duration - ready)
+
+        self.callback(RequestTrace(
+            correlation_id=_correlation_id.get() or ctx.request_id,
+            request_id=ctx.request_id,
+            method=method,
+            url=str(url),
+            host=url.host,
+            status=status,
+            error=error,
+            start=ctx.wall,
+            duration=duration,
+            reused_connection="reused" in marks,
+            phases={name: span[1] for name, span in timeline.items()},
+            offsets={name: span[0] for name, span in timeline.items()},
+        ))
+
+
+def _opentelemetry_exporter() -> Callable[[RequestTrace], None]:
+    # Exports each trace as a client span with one child span per phase.
+    # Spans are created once the timings are known, with explicit start and
+    # end times, as children of the span active around the request.
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        raise ImportError(
+            "RequestTracer needs a callback or the opentelemetry-api package"
+        ) from None
+    tracer = trace.get_tracer("gofile2")
+
+    def export(record: RequestTrace) -> None:
+        start = int(record.start * 1e9)
+        span = tracer.start_span(
+            f"HTTP {record.method}",
+            kind=trace.SpanKind.CLIENT,
+            start_time=start,
+            attributes={
+                "http.request.method": record.method,
+                "url.full": record.url,
+                "server.address": record.host or "",
+                "gofile2.correlation_id": record.correlation_id,
+                "gofile2.reused_connection": record.reused_connection,
+            },
+        )
+        if record.status is not None:
+            span.set_attribute("http.response.status_code", record.status)
+        context = trace.set_span_in_context(span)
+        for name, duration in record.phases.items():
+            offset = int(record.offsets[name] * 1e9)
+            child = tracer.start_span(name, context=context, start_time=start + offset)
+            child.end(end_time=start + offset + int(duration * 1e9))
+        if record.error is not None:
+            span.record_exception(record.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(record.error)))
+        span.end(end_time=start + int(record.duration * 1e9))
+
+    return export
@@ -37,7 +37,7 @@ setup(name='gofile2',
       author='Itz-fork, Codec04',
       author_email='itz-fork@users.noreply.github.com',
       license='MIT',
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
       download_url=f"https://github.com/Itz-fork/Gofile2/releases/tag/Gofile2-{v}",
       keywords=['Gofile', 'Api-wrapper', 'Gofile2'],
       long_description=big_description,
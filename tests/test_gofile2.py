@@ -1,11 +1,31 @@
 import os
 import asyncio
+import json
+import subprocess
+import sys
 import tempfile
 
 import pytest
-from aioresponses import aioresponses
-
-from gofile2 import Gofile, Sync_Gofile
+import pytest_asyncio
+from aioresponses import CallbackResult, aioresponses
+
+from aiohttp import ClientSession, web
+
+from gofile2 import (
+    ConnectionOptions,
+    DedupIndex,
+    Gofile,
+    JsonCodec,
+    MetadataCache,
+    Metrics,
+    RateLimiter,
+    RequestTracer,
+    RetryPolicy,
+    Sync_Gofile,
+    UploadJournal,
+)
+from gofile2.models import Account, DirectLink, File, Folder, UploadResult
+from gofile2.streaming import FilePayload, iter_children
 from gofile2.errors import (
     InvalidOption,
     InvalidPath,
@@ -44,6 +64,551 @@ def tmp_dir():
     os.rmdir(d)
 
 
+class TestLazyImports:
+    # Cumulative `import gofile2` time allowed, in microseconds. Loading
+    # aiohttp alone takes several times longer.
+    IMPORT_BUDGET_US = 100_000
+
+    def _run(self, code):
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+
+    def test_import_does_not_load_http_stack(self):
+        proc = self._run(
+            "import sys, gofile2, gofile2.errors; "
+            "print(sorted(m for m in ('aiohttp', 'asyncio', 'ssl') if m in sys.modules))"
+        )
+        assert proc.stdout.strip() == "[]"
+
+    def test_import_time(self):
+        proc = self._run("import gofile2")
+        (line,) = [l for l in proc.stderr.splitlines() if l.endswith("| gofile2")]
+        cumulative = int(line.split("|")[1])
+        assert cumulative < self.IMPORT_BUDGET_US
+
+    def test_lazy_attributes(self):
+        import gofile2
+
+        assert gofile2.Gofile is Gofile
+        assert gofile2.Sync_Gofile is Sync_Gofile
+        assert set(gofile2.__all__) <= set(dir(gofile2))
+        for name in gofile2.__all__:
+            assert getattr(gofile2, name).__name__ == name
+        with pytest.raises(AttributeError):
+            gofile2.Missing
+
+
+class TestBenchmarks:
+    def test_quick_run_writes_results(self, tmp_path, capsys):
+        from benchmarks.bench import SCENARIOS, main
+
+        output = tmp_path / "results.json"
+        main(["--quick", "--latency", "1", "--output", str(output)])
+        results = json.loads(output.read_text())
+        assert [s["name"] for s in results["scenarios"]] == list(SCENARIOS)
+        for scenario in results["scenarios"]:
+            assert scenario["errors"] == 0
+            assert scenario["requests_per_second"] > 0
+            assert 0 < scenario["latency_ms"]["p50"] <= scenario["latency_ms"]["p99"]
+            assert scenario["rss_growth_mb"] >= 0
+        assert results["scenarios"][1]["mb_per_second"] > 0
+
+        main(["--quick", "--scenario", "get_content", "--compare", str(output)])
+        assert "get_content: requests_per_second" in capsys.readouterr().out
+
+    def test_percentile(self):
+        from benchmarks.bench import percentile
+
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) == 0.0
+
+
+@pytest_asyncio.fixture
+async def emulator():
+    from gofile2.testing import GofileEmulator
+
+    async with GofileEmulator() as emu:
+        yield emu
+
+
+def _fast_retries(attempts=5):
+    return RetryPolicy(max_attempts=attempts, base_delay=0.001, max_delay=0.001)
+
+
+class TestEmulator:
+    @pytest.mark.asyncio
+    async def test_upload_and_list(self, emulator, tmp_file):
+        account = emulator.add_account()
+        root = account["rootFolder"]
+        async with emulator.client(account["token"]) as g:
+            uploaded = await g.upload(tmp_file, folderId=root)
+            folder = await g.create_folder(root, "sub")
+            listing = await g.get_content(root)
+        assert set(listing["children"]) == {uploaded["id"], folder["id"]}
+        child = listing["children"][uploaded["id"]]
+        assert child["size"] == len("test content")
+        assert child["name"] == os.path.basename(tmp_file)
+
+    @pytest.mark.asyncio
+    async def test_guest_upload(self, emulator, tmp_file):
+        async with emulator.client() as g:
+            result = await g.upload(tmp_file)
+        assert result["guestToken"]
+        assert emulator.get(result["parentFolder"])["type"] == "folder"
+
+    @pytest.mark.asyncio
+    async def test_content_operations(self, emulator):
+        account = emulator.add_account()
+        root = account["rootFolder"]
+        source = emulator.add_folder(root, "source")
+        target = emulator.add_folder(root, "target")
+        report = emulator.add_file(source["id"], "report.txt", b"data")
+        async with emulator.client(account["token"]) as g:
+            await g.update_content(report["id"], "name", "renamed.txt")
+            found = await g.search_content(root, "renamed")
+            assert list(found) == [report["id"]]
+
+            copied = await g.copy_content(source["id"], target["id"])
+            copyId = copied[source["id"]]["id"]
+            assert (await g.get_content(copyId))["childrenCount"] == 1
+
+            await g.move_content(report["id"], target["id"])
+            assert report["id"] in (await g.get_content(target["id"]))["children"]
+
+            deleted = await g.delete_content(f"{source['id']},missing")
+            assert deleted[source["id"]]["status"] == "ok"
+            assert deleted["missing"]["status"] == "error-notFound"
+            with pytest.raises(ResponseError) as e:
+                await g.get_content(source["id"])
+            assert e.value.code == 404
+
+    @pytest.mark.asyncio
+    async def test_permissions(self, emulator):
+        owner = emulator.add_account()
+        other = emulator.add_account()
+        private = emulator.add_folder(owner["rootFolder"], "private")
+        public = emulator.add_folder(owner["rootFolder"], "public", public=True)
+        async with emulator.client(other["token"]) as g:
+            with pytest.raises(ResponseError) as e:
+                await g.get_content(private["id"])
+            assert e.value.code == 403
+            assert (await g.get_content(public["id"]))["name"] == "public"
+            deleted = await g.delete_content(public["id"])
+            assert deleted[public["id"]]["status"] == "error-notOwner"
+        async with emulator.client("bad-token") as g:
+            with pytest.raises(ResponseError) as e:
+                await g.get_account_id()
+            assert e.value.code == 401
+
+    @pytest.mark.asyncio
+    async def test_direct_link_download(self, emulator, tmp_path):
+        account = emulator.add_account()
+        blob = os.urandom(200_000)
+        entry = emulator.add_file(account["rootFolder"], "blob.bin", blob)
+        async with emulator.client(account["token"]) as g:
+            link = await g.create_direct_link(entry["id"], domainsAllowed=["example.com"])
+            assert link["domainsAllowed"] == ["example.com"]
+            updated = await g.update_direct_link(entry["id"], link["id"], expireTime=1)
+            assert updated["expireTime"] == 1
+            path = await g.download(
+                entry["id"], str(tmp_path), segments=4, min_segment_size=40_000
+            )
+            await g.delete_direct_link(entry["id"], link["id"])
+        assert open(path, "rb").read() == blob
+        assert emulator.calls["download"] == 5
+        assert emulator.get(entry["id"])["directLinks"] == {}
+
+    @pytest.mark.asyncio
+    async def test_account(self, emulator):
+        account = emulator.add_account()
+        emulator.add_file(account["rootFolder"], "a.bin", 10)
+        async with emulator.client(account["token"]) as g:
+            assert (await g.get_account_id())["id"] == account["id"]
+            info = await g.get_account(account["id"])
+            assert info["statsCurrent"]["storage"] == 10
+            old = account["token"]
+            await g.reset_token(account["id"])
+        assert account["token"] != old
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_burst_is_retried(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        emulator.faults.append(Faults().rate_limit(2, retry_after=0.01))
+        async with emulator.client(account["token"], retry_policy=_fast_retries()) as g:
+            assert (await g.get_account_id())["id"] == account["id"]
+            rate = g.rate_limiter.rate("127.0.0.1")
+        assert emulator.responses[429] == 2
+        assert emulator.calls["get_account_id"] == 3
+        assert rate < RateLimiter().initial_rate
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_without_retries(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        emulator.faults.append(Faults().rate_limit(1))
+        async with emulator.client(account["token"]) as g:
+            with pytest.raises(RateLimitError):
+                await g.get_account_id()
+
+    @pytest.mark.asyncio
+    async def test_scripted_server_errors(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        emulator.faults.append(Faults(endpoints=["get_content"]).fail(2, status=502))
+        async with emulator.client(account["token"], retry_policy=_fast_retries(2)) as g:
+            await g.get_account_id()
+            with pytest.raises(ResponseError) as e:
+                await g.get_content(account["rootFolder"])
+            assert e.value.code == 502
+            await g.get_content(account["rootFolder"])
+        assert emulator.responses[502] == 2
+
+    @pytest.mark.asyncio
+    async def test_error_rate_under_bulk_load(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        ids = [
+            emulator.add_file(account["rootFolder"], f"f{i}.txt", b"x")["id"]
+            for i in range(20)
+        ]
+        emulator.faults.append(Faults(error_rate=0.3, seed=7))
+        async with emulator.client(account["token"], retry_policy=_fast_retries(10)) as g:
+            results = [
+                result
+                async for _, _, result in g.bulk_update_content(
+                    [(i, "tags", "done") for i in ids]
+                )
+            ]
+        assert not any(isinstance(r, Exception) for r in results)
+        assert emulator.responses[503] > 0
+        assert all(emulator.get(i)["tags"] == "done" for i in ids)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_is_retried(self, emulator, tmp_path):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        blob = os.urandom(100_000)
+        entry = emulator.add_file(account["rootFolder"], "blob.bin", blob)
+        emulator.faults.append(Faults(endpoints=["get_content"]).disconnect(1))
+        emulator.faults.append(Faults(endpoints=["download"]).disconnect(2))
+        async with emulator.client(account["token"], retry_policy=_fast_retries()) as g:
+            path = await g.download(entry["id"], str(tmp_path / "out.bin"), segments=1)
+        assert open(path, "rb").read() == blob
+        # Listing, HEAD probe and body were each cut off once.
+        assert emulator.calls["get_content"] == 2
+        assert emulator.calls["download"] == 4
+
+    @pytest.mark.asyncio
+    async def test_latency_distribution(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        delays = iter([0.05, 0.0])
+        emulator.faults.append(Faults(latency=lambda: next(delays, 0.0)))
+        limiter = RateLimiter(initial_rate=1e6, max_rate=1e6)
+        async with emulator.client(account["token"], rate_limiter=limiter) as g:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await g.get_account_id()
+            first = loop.time() - started
+            started = loop.time()
+            await g.get_account_id()
+            second = loop.time() - started
+        assert first >= 0.05 > second
+
+    def test_faults_script_order(self):
+        from gofile2.testing import Faults
+
+        faults = Faults(error_status=500).rate_limit(1, retry_after=2).fail(2).disconnect(1)
+        kinds = [faults.draw() for _ in range(5)]
+        assert [k and k[0] for k in kinds] == [
+            "rate_limit", "fail", "fail", "disconnect", None
+        ]
+        assert kinds[1][2] == 500
+        assert not Faults(endpoints=["upload"]).applies_to("get_content")
+
+
+class TestMetrics:
+    def test_endpoint_name(self):
+        from gofile2.metrics import endpoint_name
+
+        assert endpoint_name("GET", "https://api.gofile.io/contents/abc?x=1") == (
+            "GET /contents/{id}"
+        )
+        assert endpoint_name(
+            "PUT", "https://api.gofile.io/contents/abc/directlinks/def"
+        ) == "PUT /contents/{id}/directlinks/{id}"
+        assert endpoint_name("POST", "https://upload.gofile.io/uploadfile") == (
+            "POST /uploadfile"
+        )
+
+    def test_histogram_buckets(self):
+        metrics = Metrics(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            metrics.observe("GET /x", "h", seconds, status=200)
+        latency = metrics.snapshot()["endpoints"]["GET /x"]["latency"]
+        assert latency["buckets"] == {"0.1": 2, "1": 3, "+Inf": 4}
+        assert latency["count"] == 4
+        assert latency["sum"] == pytest.approx(2.65)
+        with pytest.raises(ValueError):
+            Metrics(buckets=(1.0, 0.5))
+
+    def test_snapshot_groups_by_endpoint_and_host(self):
+        metrics = Metrics()
+        metrics.observe("GET /a", "h1", 0.01, status=200, bytes_received=10)
+        metrics.observe("GET /a", "h2", 0.01, error=TimeoutError())
+        metrics.observe("POST /b", "h1", 0.01, status=429, error=RateLimitError())
+        snapshot = metrics.snapshot()
+        assert snapshot["endpoints"]["GET /a"]["requests"] == 2
+        assert snapshot["endpoints"]["GET /a"]["errors"] == {"TimeoutError": 1}
+        assert snapshot["hosts"]["h1"]["statuses"] == {200: 1, 429: 1}
+        assert snapshot["hosts"]["h1"]["bytes_received"] == 10
+        metrics.reset()
+        assert metrics.snapshot() == {"endpoints": {}, "hosts": {}}
+
+    def test_prometheus_format(self):
+        metrics = Metrics(buckets=(0.5,))
+        metrics.observe('GET /"x"', "h", 0.1, status=503, error=ResponseError("e", 503))
+        text = metrics.prometheus()
+        labels = 'endpoint="GET /\\"x\\"",host="h"'
+        assert f"gofile2_requests_total{{{labels}}} 1" in text
+        assert f'gofile2_responses_total{{{labels},status="503"}} 1' in text
+        assert f'gofile2_errors_total{{{labels},type="ResponseError"}} 1' in text
+        assert f'gofile2_request_duration_seconds_bucket{{{labels},le="0.5"}} 1' in text
+        assert f'gofile2_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert "# TYPE gofile2_request_duration_seconds histogram" in text
+        assert text.endswith("\n")
+
+    @pytest.mark.asyncio
+    async def test_client_records_attempts(self, emulator, tmp_file):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        metrics = Metrics()
+        emulator.faults.append(Faults().rate_limit(1, retry_after=0.001))
+        async with emulator.client(
+            account["token"], metrics=metrics, retry_policy=_fast_retries()
+        ) as g:
+            await g.get_content(account["rootFolder"])
+            await g.upload(tmp_file, folderId=account["rootFolder"])
+        endpoints = metrics.snapshot()["endpoints"]
+        listing = endpoints["GET /contents/{id}"]
+        assert listing["requests"] == 2
+        assert listing["statuses"] == {200: 1, 429: 1}
+        assert listing["errors"] == {"RateLimitError": 1}
+        assert listing["bytes_received"] > 0
+        upload = endpoints["POST /uploadfile"]
+        assert upload["bytes_sent"] > len("test content")
+        assert metrics.snapshot()["hosts"]["127.0.0.1"]["requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_recorded(self):
+        metrics = Metrics()
+        async with Gofile(token="t", metrics=metrics) as g:
+            g.api_url = "http://127.0.0.1:1"
+            with pytest.raises(Exception):
+                await g.get_account_id()
+        (series,) = metrics.snapshot()["endpoints"].values()
+        assert series["statuses"] == {}
+        assert sum(series["errors"].values()) == 1
+
+
+class TestRequestTracer:
+    @pytest.mark.asyncio
+    async def test_retried_call_shares_correlation_id(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        traces = []
+        emulator.faults.append(Faults().fail(1))
+        async with emulator.client(
+            account["token"],
+            tracer=RequestTracer(traces.append),
+            retry_policy=_fast_retries(),
+        ) as g:
+            await g.get_content(account["rootFolder"])
+            await g.get_account_id()
+        first, retry, other = traces
+        assert (first.status, retry.status, other.status) == (503, 200, 200)
+        assert first.correlation_id == retry.correlation_id != other.correlation_id
+        assert len({t.request_id for t in traces}) == 3
+        assert "connect" in first.phases and not first.reused_connection
+        assert "connect" not in retry.phases and retry.reused_connection
+        for trace in traces:
+            assert trace.host == "127.0.0.1"
+            assert {"send", "wait"} <= set(trace.phases)
+            assert sum(trace.phases.values()) <= trace.duration + 1e-6
+            assert trace.offsets["wait"] >= trace.offsets["send"]
+
+    @pytest.mark.asyncio
+    async def test_correlation_block(self, emulator):
+        from gofile2.tracing import correlation
+
+        account = emulator.add_account()
+        traces = []
+        async with emulator.client(
+            account["token"], tracer=RequestTracer(traces.append)
+        ) as g:
+            with correlation("job-1") as outer:
+                with correlation("ignored") as inner:
+                    await g.get_account_id()
+                await g.get_content(account["rootFolder"])
+        assert outer == inner == "job-1"
+        assert [t.correlation_id for t in traces] == ["job-1", "job-1"]
+
+    @pytest.mark.asyncio
+    async def test_pool_wait_is_traced(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        traces = []
+        emulator.faults.append(Faults(latency=0.05))
+        async with emulator.client(
+            account["token"],
+            tracer=RequestTracer(traces.append),
+            rate_limiter=RateLimiter(initial_rate=1e6, max_rate=1e6),
+            connection_options=ConnectionOptions(limit=1),
+        ) as g:
+            await asyncio.gather(g.get_account_id(), g.get_account_id())
+        queued = [t for t in traces if "queue" in t.phases]
+        assert len(queued) == 1
+        assert queued[0].phases["queue"] >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_is_traced(self):
+        traces = []
+        async with Gofile(token="t", tracer=RequestTracer(traces.append)) as g:
+            g.api_url = "http://127.0.0.1:1"
+            with pytest.raises(Exception):
+                await g.get_account_id()
+        (trace,) = traces
+        assert trace.status is None
+        assert trace.error is not None
+        assert "connect" in trace.phases
+        assert trace.to_dict()["url"] == "http://127.0.0.1:1/accounts/getid"
+
+    def test_opentelemetry_required_without_callback(self):
+        try:
+            import opentelemetry  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError):
+                RequestTracer()
+        else:
+            assert callable(RequestTracer().callback)
+
+
+class TestSingleFlight:
+    @staticmethod
+    def _slow(emulator, seconds=0.05):
+        from gofile2.testing import Faults
+
+        emulator.faults.append(Faults(latency=seconds))
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_share_request(self, emulator):
+        account = emulator.add_account()
+        root = account["rootFolder"]
+        self._slow(emulator)
+        async with emulator.client(account["token"], coalesce_reads=True) as g:
+            listings = await asyncio.gather(*(g.get_content(root) for _ in range(10)))
+            ids = await asyncio.gather(g.get_account_id(), g.get_account_id())
+            found = await asyncio.gather(
+                g.search_content(root, "x"), g.search_content(root, "x")
+            )
+            assert g.coalesced == 11
+            assert not g._inflight
+        assert all(listing is listings[0] for listing in listings)
+        assert ids[0] == ids[1] and found[0] == found[1]
+        assert emulator.calls["get_content"] == 1
+        assert emulator.calls["get_account_id"] == 1
+        assert emulator.calls["search_content"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_shared(self, emulator):
+        owner = emulator.add_account()
+        other = emulator.add_account()
+        folder = emulator.add_folder(owner["rootFolder"], "shared", public=True)
+        self._slow(emulator)
+        async with emulator.client(owner["token"], coalesce_reads=True) as g:
+            await asyncio.gather(
+                g.get_content(folder["id"]),
+                g.get_content(folder["id"], token=other["token"]),
+                g.get_content(folder["id"], password="hash"),
+                g.search_content(owner["rootFolder"], "a"),
+                g.search_content(owner["rootFolder"], "b"),
+            )
+            await g.get_content(folder["id"])
+            assert g.coalesced == 0
+        assert emulator.calls["get_content"] == 4
+        assert emulator.calls["search_content"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, emulator):
+        account = emulator.add_account()
+        self._slow(emulator)
+        async with emulator.client(account["token"]) as g:
+            await asyncio.gather(g.get_account_id(), g.get_account_id())
+        assert emulator.calls["get_account_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_error_shared(self, emulator):
+        from gofile2.testing import Faults
+
+        account = emulator.add_account()
+        emulator.faults.append(Faults(latency=0.05).fail(1, status=500))
+        async with emulator.client(account["token"], coalesce_reads=True) as g:
+            results = await asyncio.gather(
+                *(g.get_account_id() for _ in range(3)), return_exceptions=True
+            )
+            assert all(isinstance(r, ResponseError) and r.code == 500 for r in results)
+            assert (await g.get_account_id())["id"] == account["id"]
+        assert emulator.calls["get_account_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, emulator):
+        account = emulator.add_account()
+        self._slow(emulator, 0.1)
+        async with emulator.client(account["token"], coalesce_reads=True) as g:
+            first = asyncio.ensure_future(g.get_account_id())
+            second = asyncio.ensure_future(g.get_account_id())
+            await asyncio.sleep(0.02)
+            first.cancel()
+            assert (await second)["id"] == account["id"]
+            assert first.cancelled()
+        assert emulator.calls["get_account_id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_cancelled_with_last_caller(self, emulator):
+        account = emulator.add_account()
+        self._slow(emulator, 0.1)
+        async with emulator.client(account["token"], coalesce_reads=True) as g:
+            callers = [asyncio.ensure_future(g.get_account_id()) for _ in range(2)]
+            await asyncio.sleep(0.02)
+            (flight,) = g._inflight.values()
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            assert not g._inflight
+            await asyncio.sleep(0)
+            assert flight[0].cancelled()
+            # A later caller starts a fresh request.
+            assert (await g.get_account_id())["id"] == account["id"]
+        assert emulator.calls["get_account_id"] == 2
+
+
 class TestGofileInit:
     def test_default_init(self):
         g = Gofile()
@@ -134,6 +699,125 @@ class TestGofileUpload:
                 await g.upload(tmp_file)
 
 
+class _ChunkWriter:
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, chunk):
+        self.chunks.append(chunk)
+
+
+class TestGofileAutoServer:
+    @staticmethod
+    def _fake_probe(latencies, calls):
+        async def probe(session, server):
+            calls.append(server)
+            return latencies.get(server, float("inf"))
+        return probe
+
+    @pytest.mark.asyncio
+    async def test_picks_fastest_and_caches(self):
+        calls = []
+        async with Gofile() as g:
+            g._probe_server = self._fake_probe(
+                {"upload-eu-par": 0.3, "upload-ap-sgp": 0.1}, calls
+            )
+            assert await g.select_server() == "upload-ap-sgp"
+            assert await g.select_server() == "upload-ap-sgp"
+        assert len(calls) == len(Gofile.VALID_SERVERS) - 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_unreachable(self):
+        async with Gofile() as g:
+            g._probe_server = self._fake_probe({}, [])
+            assert await g.select_server() == "upload"
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_reprobes(self):
+        calls = []
+        async with Gofile() as g:
+            g.AUTO_SERVER_TTL = 0
+            g._probe_server = self._fake_probe({"upload-eu-par": 0.1}, calls)
+            await g.select_server()
+            await g.select_server()
+        assert len(calls) == 2 * (len(Gofile.VALID_SERVERS) - 1)
+
+    @pytest.mark.asyncio
+    async def test_throughput_drop_reprobes(self):
+        async with Gofile() as g:
+            g._probe_server = self._fake_probe({"upload-eu-par": 0.1}, [])
+            await g.select_server()
+            g._record_auto_server_speed("upload-eu-par", 1000.0)
+            assert g._auto_server_expires > 0
+            g._record_auto_server_speed("upload-eu-par", 100.0)
+            assert g._auto_server_expires == 0
+
+    @pytest.mark.asyncio
+    async def test_probe_server(self, mock_aio):
+        mock_aio.head("https://upload-eu-par.gofile.io/", status=200)
+        async with Gofile() as g:
+            session = await g._get_session()
+            assert await g._probe_server(session, "upload-eu-par") < 5
+            assert await g._probe_server(session, "upload-ap-tyo") == float("inf")
+
+    @pytest.mark.asyncio
+    async def test_upload_auto(self, mock_aio, tmp_file):
+        mock_aio.post(
+            "https://upload-na-phx.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"fileId": "f1"}},
+        )
+        async with Gofile() as g:
+            g._probe_server = self._fake_probe({"upload-na-phx": 0.1}, [])
+            result = await g.upload(tmp_file, server="auto")
+        assert result["fileId"] == "f1"
+
+
+class TestFilePayload:
+    @pytest.mark.asyncio
+    async def test_streams_in_chunks(self, tmp_file):
+        payload = FilePayload(tmp_file, os.path.getsize(tmp_file), chunk_size=5)
+        assert payload.size == len("test content")
+        writer = _ChunkWriter()
+        await payload.write(writer)
+        assert writer.chunks == [b"test ", b"conte", b"nt"]
+
+    @pytest.mark.asyncio
+    async def test_can_be_written_twice(self, tmp_file):
+        payload = FilePayload(tmp_file, os.path.getsize(tmp_file), chunk_size=1024)
+        first, second = _ChunkWriter(), _ChunkWriter()
+        await payload.write(first)
+        await payload.write(second)
+        assert first.chunks == second.chunks == [b"test content"]
+
+    @pytest.mark.asyncio
+    async def test_progress_reports_every_chunk(self, tmp_file):
+        reports = []
+        payload = FilePayload(
+            tmp_file, 12, chunk_size=5, progress=reports.append, progress_interval=0
+        )
+        await payload.write(_ChunkWriter())
+        assert [r.bytes_sent for r in reports] == [5, 10, 12]
+        assert all(r.total_bytes == 12 and r.file == tmp_file for r in reports)
+        assert reports[-1].done
+
+    @pytest.mark.asyncio
+    async def test_progress_is_rate_limited(self, tmp_file):
+        reports = []
+        payload = FilePayload(
+            tmp_file, 12, chunk_size=1, progress=reports.append, progress_interval=60
+        )
+        await payload.write(_ChunkWriter())
+        assert len(reports) == 1
+        assert reports[0].bytes_sent == 12
+        assert reports[0].average_speed >= 0
+
+    @pytest.mark.asyncio
+    async def test_upload_directory_is_invalid_path(self, tmp_dir):
+        async with Gofile() as g:
+            with pytest.raises(InvalidPath):
+                await g.upload(tmp_dir)
+
+
 class TestGofileUploadFolder:
     @pytest.mark.asyncio
     async def test_upload_folder_invalid_path(self):
@@ -163,6 +847,465 @@ class TestGofileUploadFolder:
             results = await g.upload_folder(tmp_dir, delay=0)
             assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_upload_folder_stops_at_failure(self, mock_aio, tmp_dir):
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "error-uploadFailed"},
+        )
+        async with Gofile() as g:
+            with pytest.raises(ResponseError):
+                await g.upload_folder(tmp_dir, delay=0)
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 1
+
+    @pytest.mark.asyncio
+    async def test_upload_folder_concurrent(self, mock_aio, tmp_dir):
+        for i in range(2):
+            mock_aio.post(
+                "https://upload.gofile.io/uploadfile",
+                payload={
+                    "status": "ok",
+                    "data": {"fileId": f"f{i}", "parentFolder": "folder1"},
+                },
+            )
+        async with Gofile() as g:
+            results = await g.upload_folder_concurrently(tmp_dir, delay=0, concurrency=4)
+        assert set(results) == {
+            os.path.join(tmp_dir, "a.txt"),
+            os.path.join(tmp_dir, "b.txt"),
+        }
+        assert {r["fileId"] for r in results.values()} == {"f0", "f1"}
+
+    @pytest.mark.asyncio
+    async def test_upload_folder_concurrent_failure_isolated(self, mock_aio, tmp_dir):
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"fileId": "f0", "parentFolder": "folder1"}},
+        )
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "error-uploadFailed"},
+        )
+        async with Gofile() as g:
+            results = await g.upload_folder_concurrently(tmp_dir, delay=0, concurrency=2)
+        values = list(results.values())
+        assert values[0]["fileId"] == "f0"
+        assert isinstance(values[1], ResponseError)
+
+    @pytest.mark.asyncio
+    async def test_upload_folder_invalid_concurrency(self, tmp_dir):
+        async with Gofile() as g:
+            with pytest.raises(InvalidOption):
+                await g.upload_folder_concurrently(tmp_dir, concurrency=0)
+
+
+class TestUploadJournal:
+    @staticmethod
+    def _mock_uploads(mock_aio, count):
+        for i in range(count):
+            mock_aio.post(
+                "https://upload.gofile.io/uploadfile",
+                payload={
+                    "status": "ok",
+                    "data": {"fileId": f"f{i}", "parentFolder": "folder1"},
+                },
+            )
+
+    @pytest.mark.asyncio
+    async def test_rerun_skips_completed(self, mock_aio, tmp_dir, tmp_path):
+        journal = str(tmp_path / "journal.jsonl")
+        self._mock_uploads(mock_aio, 2)
+        async with Gofile() as g:
+            first = await g.upload_folder(tmp_dir, journal=journal)
+            second = await g.upload_folder(tmp_dir, journal=journal)
+        assert first == second
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_reuses_parent_folder(self, mock_aio, tmp_dir, tmp_path):
+        path = str(tmp_path / "journal.jsonl")
+        with UploadJournal(path) as journal:
+            journal.record(
+                os.path.join(tmp_dir, "a.txt"),
+                {"fileId": "f0", "parentFolder": "folder1"},
+            )
+        self._mock_uploads(mock_aio, 1)
+        async with Gofile() as g:
+            results = await g.upload_folder_concurrently(tmp_dir, journal=path, concurrency=2)
+        assert results[os.path.join(tmp_dir, "a.txt")]["fileId"] == "f0"
+        assert results[os.path.join(tmp_dir, "b.txt")]["fileId"] == "f0"
+        (call,) = [c for calls in mock_aio.requests.values() for c in calls]
+        fields = [field[0]["name"] for field in call.kwargs["data"]._fields]
+        assert "folderId" in fields
+        with UploadJournal(path) as journal:
+            assert len(journal) == 2
+
+    @pytest.mark.asyncio
+    async def test_records_stat_taken_before_upload(self, mock_aio, tmp_path):
+        folder = tmp_path / "src"
+        folder.mkdir()
+        path = folder / "a.txt"
+        path.write_text("original")
+
+        def modify(url, **kwargs):
+            path.write_text("changed during upload")
+
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"fileId": "f0", "parentFolder": "p1"}},
+            callback=modify,
+        )
+        with UploadJournal(str(tmp_path / "journal.jsonl")) as journal:
+            async with Gofile() as g:
+                await g.upload_folder(str(folder), journal=journal)
+            assert journal.completed([str(path)]) == {}
+
+    @pytest.mark.asyncio
+    async def test_journal_error_is_per_file(self, mock_aio, tmp_dir, tmp_path):
+        failing = os.path.join(tmp_dir, "a.txt")
+
+        class FailingJournal(UploadJournal):
+            def record(self, file, result, st=None):
+                if file == failing:
+                    raise OSError("disk full")
+                super().record(file, result, st)
+
+        self._mock_uploads(mock_aio, 2)
+        with FailingJournal(str(tmp_path / "journal.jsonl")) as journal:
+            async with Gofile() as g:
+                results = await g.upload_folder_concurrently(
+                    tmp_dir, folderId="folder1", journal=journal, concurrency=2
+                )
+            assert len(journal) == 1
+        assert isinstance(results[failing], OSError)
+        assert results[os.path.join(tmp_dir, "b.txt")]["parentFolder"] == "folder1"
+
+    @pytest.mark.asyncio
+    async def test_other_folder_uploaded_again(self, mock_aio, tmp_dir, tmp_path):
+        path = str(tmp_path / "journal.jsonl")
+        with UploadJournal(path) as journal:
+            for name in ("a.txt", "b.txt"):
+                journal.record(
+                    os.path.join(tmp_dir, name),
+                    {"fileId": "old", "parentFolder": "folder0"},
+                )
+        self._mock_uploads(mock_aio, 2)
+        async with Gofile() as g:
+            results = await g.upload_folder(tmp_dir, folderId="folder1", journal=path)
+        assert [r["fileId"] for r in results] == ["f0", "f1"]
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+    def test_changed_file_not_completed(self, tmp_file, tmp_path):
+        with UploadJournal(str(tmp_path / "journal.jsonl")) as journal:
+            journal.record(tmp_file, {"fileId": "f0"})
+            assert tmp_file in journal.completed([tmp_file])
+            with open(tmp_file, "a") as f:
+                f.write("more")
+            assert journal.completed([tmp_file]) == {}
+
+    def test_truncated_line_ignored(self, tmp_file, tmp_path):
+        path = str(tmp_path / "journal.jsonl")
+        with UploadJournal(path) as journal:
+            journal.record(tmp_file, {"fileId": "f0", "parentFolder": "p1"})
+        with open(path, "a") as f:
+            f.write('{"path": "/x", "si')
+        with UploadJournal(path) as journal:
+            assert len(journal) == 1
+            assert journal.parent_folder == "p1"
+
+    def test_record_after_truncated_line(self, tmp_file, tmp_path):
+        path = str(tmp_path / "journal.jsonl")
+        with open(path, "w") as f:
+            f.write('{"path":"/a","si')
+        with UploadJournal(path) as journal:
+            journal.record(tmp_file, {"fileId": "f0", "parentFolder": "p1"})
+        with UploadJournal(path) as journal:
+            assert len(journal) == 1
+            assert journal.parent_folder == "p1"
+
+
+class TestDedupIndex:
+    def test_hash_file(self, tmp_file):
+        import hashlib
+        index = DedupIndex()
+        expected = hashlib.sha256(b"test content").hexdigest()
+        assert index.hash_file(tmp_file, chunk_size=3) == expected
+
+    def test_persisted(self, tmp_path):
+        path = str(tmp_path / "index.jsonl")
+        with DedupIndex(path) as index:
+            index.add("h1", "c1")
+            index.add("h2", "c2")
+            index.discard("h1")
+        with DedupIndex(path) as index:
+            assert index.get("h1") is None
+            assert index.get("h2") == "c2"
+
+    def test_add_after_truncated_line(self, tmp_path):
+        path = str(tmp_path / "index.jsonl")
+        with open(path, "w") as f:
+            f.write('{"hash":"h0","cont')
+        with DedupIndex(path) as index:
+            index.add("h1", "c1")
+        with DedupIndex(path) as index:
+            assert index.get("h1") == "c1"
+
+    @pytest.mark.asyncio
+    async def test_upload_records_then_copies(self, mock_aio, tmp_file):
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"fileId": "f1", "parentFolder": "p1"}},
+        )
+        mock_aio.post(
+            "https://api.gofile.io/contents/copy",
+            payload={"status": "ok", "data": {"f1": {"status": "ok", "id": "c1"}}},
+        )
+        mock_aio.put(
+            "https://api.gofile.io/contents/c1/update",
+            payload={"status": "ok", "data": {}},
+        )
+        index = DedupIndex()
+        async with Gofile(token="t", dedup_index=index) as g:
+            await g.upload(tmp_file, folderId="p1")
+            result = await g.upload(tmp_file, folderId="p2")
+        assert result == {
+            "id": "c1",
+            "name": os.path.basename(tmp_file),
+            "size": len("test content"),
+            "parentFolder": "p2",
+            "duplicateOf": "f1",
+        }
+        assert len(index) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_rename_returns_copy(self, mock_aio, tmp_file):
+        mock_aio.post(
+            "https://api.gofile.io/contents/copy",
+            payload={"status": "ok", "data": {"f1": {"status": "ok", "id": "c1"}}},
+        )
+        mock_aio.put(
+            "https://api.gofile.io/contents/c1/update",
+            payload={"status": "error-notFound"},
+        )
+        index = DedupIndex()
+        index.add(index.hash_file(tmp_file), "f1")
+        async with Gofile(token="t", dedup_index=index) as g:
+            result = await g.upload(tmp_file, folderId="p2")
+        assert result["id"] == "c1"
+        assert result["duplicateOf"] == "f1"
+        assert "name" not in result
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+    @pytest.mark.asyncio
+    async def test_copy_gets_new_id_and_name(self, emulator, tmp_path):
+        account = emulator.add_account()
+        target = emulator.add_folder(account["rootFolder"], "target")
+        a = tmp_path / "a.bin"
+        b = tmp_path / "b.bin"
+        a.write_bytes(b"same bytes")
+        b.write_bytes(b"same bytes")
+        async with emulator.client(
+            account["token"], dedup_index=DedupIndex(), response_models=True
+        ) as g:
+            first = await g.upload(str(a), folderId=account["rootFolder"])
+            copy = await g.upload(str(b), folderId=target["id"])
+        assert copy.duplicateOf == first.id
+        assert copy.id and copy.id != first.id
+        assert copy.fileId == copy.id
+        assert first.id not in copy.to_dict()
+        assert emulator.get(copy.id)["name"] == "b.bin"
+        assert emulator.get(copy.id)["parentFolder"] == target["id"]
+        assert emulator.calls["upload"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_falls_back_to_upload(self, mock_aio, tmp_file):
+        mock_aio.post(
+            "https://api.gofile.io/contents/copy",
+            payload={"status": "error-notFound"},
+        )
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"fileId": "f2", "parentFolder": "p2"}},
+        )
+        index = DedupIndex()
+        index.add(index.hash_file(tmp_file), "gone")
+        async with Gofile(token="t", dedup_index=index) as g:
+            result = await g.upload(tmp_file, folderId="p2")
+        assert result["fileId"] == "f2"
+        assert index.get(index.hash_file(tmp_file)) == "f2"
+
+    @pytest.mark.asyncio
+    async def test_no_folder_uploads(self, mock_aio, tmp_file):
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"fileId": "f3", "parentFolder": "p3"}},
+        )
+        index = DedupIndex()
+        index.add(index.hash_file(tmp_file), "f1")
+        async with Gofile(token="t", dedup_index=index) as g:
+            result = await g.upload(tmp_file)
+        assert result["fileId"] == "f3"
+
+
+class TestRateLimiter:
+    def test_rate_increases_on_success(self):
+        limiter = RateLimiter(initial_rate=2, increase=1, max_rate=3)
+        limiter.on_success("h")
+        assert limiter.rate("h") == 3
+        limiter.on_success("h")
+        assert limiter.rate("h") == 3
+
+    def test_rate_decreases_on_429(self):
+        limiter = RateLimiter(initial_rate=8, decrease=0.5, min_rate=3)
+        limiter.on_rate_limited("h")
+        assert limiter.rate("h") == 4
+        limiter.on_rate_limited("h")
+        assert limiter.rate("h") == 3
+
+    def test_hosts_are_independent(self):
+        limiter = RateLimiter(initial_rate=8)
+        limiter.on_rate_limited("api.gofile.io")
+        assert limiter.rate("upload.gofile.io") == 8
+
+    def test_parse_retry_after(self):
+        assert RateLimiter.parse_retry_after("2") == 2.0
+        assert RateLimiter.parse_retry_after(None) is None
+        assert RateLimiter.parse_retry_after("garbage") is None
+        assert RateLimiter.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_spaces_requests(self):
+        limiter = RateLimiter(initial_rate=20)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(3):
+            await limiter.acquire("h")
+        assert loop.time() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_retry_after_honoured(self, mock_aio):
+        mock_aio.get(
+            "https://api.gofile.io/accounts/getid",
+            status=429,
+            headers={"Retry-After": "0.2"},
+            payload={},
+        )
+        limiter = RateLimiter(initial_rate=100)
+        async with Gofile(token="t", rate_limiter=limiter) as g:
+            with pytest.raises(RateLimitError):
+                await g.get_account_id()
+        assert limiter.rate("api.gofile.io") == 50
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire("api.gofile.io")
+        assert loop.time() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_waiting_requests(self):
+        limiter = RateLimiter(initial_rate=20)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = []
+
+        async def request():
+            await limiter.acquire("h")
+            sent.append(loop.time() - start)
+
+        waiters = [asyncio.ensure_future(request()) for _ in range(8)]
+        await asyncio.sleep(0.075)
+        limiter.on_rate_limited("h", retry_after=0.3)
+        paused = loop.time() - start
+        await asyncio.gather(*waiters)
+        assert len(sent) == 8
+        before = [t for t in sent if t < paused]
+        after = [t for t in sent if t >= paused]
+        assert len(before) == 2
+        assert min(after) >= paused + 0.29
+        # Requests resume at the reduced rate of 10 per second.
+        assert after[-1] - after[0] >= 5 * 0.1 - 0.01
+
+    @pytest.mark.asyncio
+    async def test_waiting_requests_follow_rate_increase(self):
+        limiter = RateLimiter(initial_rate=2, max_rate=100, increase=98)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        waiters = [asyncio.ensure_future(limiter.acquire("h")) for _ in range(5)]
+        await asyncio.sleep(0)
+        limiter.on_success("h")
+        await asyncio.gather(*waiters)
+        # At the initial rate the last request would wait two seconds.
+        assert loop.time() - start < 0.6
+
+    @pytest.mark.asyncio
+    async def test_server_errors_do_not_raise_rate(self, mock_aio):
+        mock_aio.get("https://api.gofile.io/accounts/getid", status=503, body="busy")
+        limiter = RateLimiter(initial_rate=5)
+        async with Gofile(token="t", rate_limiter=limiter) as g:
+            with pytest.raises(ResponseError):
+                await g.get_account_id()
+        assert limiter.rate("api.gofile.io") == 5
+
+
+class TestRetryPolicy:
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(base_delay=1, max_delay=3)
+        for attempt in range(1, 10):
+            assert 0 <= policy.backoff(attempt) <= min(3, 2 ** (attempt - 1))
+
+    def test_is_retryable(self):
+        policy = RetryPolicy(retry_statuses={503})
+        assert policy.is_retryable(ResponseError("x", 503))
+        assert not policy.is_retryable(ResponseError("error-notFound", 200))
+        assert not policy.is_retryable(RateLimitError())
+        assert not policy.is_retryable(InvalidToken())
+
+    @pytest.mark.asyncio
+    async def test_retries_server_error(self, mock_aio):
+        mock_aio.get("https://api.gofile.io/accounts/getid", status=503, body="busy")
+        mock_aio.get(
+            "https://api.gofile.io/accounts/getid",
+            payload={"status": "ok", "data": {"id": "acc1"}},
+        )
+        policy = RetryPolicy(base_delay=0)
+        async with Gofile(token="t", retry_policy=policy) as g:
+            result = await g.get_account_id()
+        assert result["id"] == "acc1"
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, mock_aio):
+        for _ in range(2):
+            mock_aio.get("https://api.gofile.io/accounts/getid", status=429, payload={})
+        policy = RetryPolicy(max_attempts=2, base_delay=0)
+        async with Gofile(token="t", retry_policy=policy) as g:
+            with pytest.raises(RateLimitError):
+                await g.get_account_id()
+
+    @pytest.mark.asyncio
+    async def test_api_error_not_retried(self, mock_aio):
+        mock_aio.get(
+            "https://api.gofile.io/accounts/getid",
+            payload={"status": "error-notFound"},
+        )
+        policy = RetryPolicy(base_delay=0)
+        async with Gofile(token="t", retry_policy=policy) as g:
+            with pytest.raises(ResponseError):
+                await g.get_account_id()
+
+    @pytest.mark.asyncio
+    async def test_upload_resends_body(self, mock_aio, tmp_file):
+        mock_aio.post("https://upload.gofile.io/uploadfile", status=502, body="")
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"fileId": "f1"}},
+        )
+        policy = RetryPolicy(base_delay=0)
+        async with Gofile(retry_policy=policy) as g:
+            result = await g.upload(tmp_file)
+        assert result["fileId"] == "f1"
+        sent = [call.kwargs["data"] for calls in mock_aio.requests.values() for call in calls]
+        assert len(sent) == 2
+        assert sent[0] is not sent[1]
+
 
 class TestGofileCreateFolder:
     @pytest.mark.asyncio
@@ -226,6 +1369,46 @@ class TestGofileUpdateContent:
                     pass  # Other errors (network etc.) are expected
 
 
+class TestGofileBulkUpdate:
+    @pytest.mark.asyncio
+    async def test_invalid_attribute_checked_up_front(self, mock_aio):
+        async with Gofile(token="t") as g:
+            with pytest.raises(InvalidOption):
+                async for _ in g.bulk_update_content(
+                    [("c1", "name", "x"), ("c2", "bogus", 1)]
+                ):
+                    pass
+        assert not mock_aio.requests
+
+    @pytest.mark.asyncio
+    async def test_streams_results(self, mock_aio):
+        for i in range(3):
+            mock_aio.put(
+                f"https://api.gofile.io/contents/c{i}/update",
+                payload={"status": "ok", "data": {}},
+            )
+        mock_aio.put(
+            "https://api.gofile.io/contents/bad/update",
+            payload={"status": "error-notFound"},
+        )
+        updates = [(f"c{i}", "public", True) for i in range(3)] + [("bad", "expiry", 0)]
+        async with Gofile(token="t") as g:
+            results = [r async for r in g.bulk_update_content(updates, concurrency=2)]
+        assert len(results) == 4
+        outcome = {(cid, attr): r for cid, attr, r in results}
+        assert isinstance(outcome[("bad", "expiry")], ResponseError)
+        assert outcome[("c0", "public")] == {}
+
+    def test_sync_bulk_update(self, mock_aio):
+        mock_aio.put(
+            "https://api.gofile.io/contents/c1/update",
+            payload={"status": "ok", "data": {}},
+        )
+        with Sync_Gofile(token="t") as g:
+            results = list(g.bulk_update_content([("c1", "tags", "a,b")]))
+        assert results == [("c1", "tags", {})]
+
+
 class TestGofileDeleteContent:
     @pytest.mark.asyncio
     async def test_delete_content_no_token(self):
@@ -244,6 +1427,84 @@ class TestGofileDeleteContent:
             assert result == {}
 
 
+class TestGofileBulkDelete:
+    @staticmethod
+    def _mock_delete(mock_aio, batches, bad=()):
+        def callback(url, **kwargs):
+            ids = json.loads(kwargs["data"])["contentsId"].split(",")
+            batches.append(ids)
+            if any(i in bad for i in ids):
+                return CallbackResult(payload={"status": "error-notFound"})
+            return CallbackResult(payload={"status": "ok", "data": {}})
+
+        mock_aio.delete("https://api.gofile.io/contents", callback=callback, repeat=True)
+
+    @pytest.mark.asyncio
+    async def test_batches(self, mock_aio):
+        batches = []
+        self._mock_delete(mock_aio, batches)
+        ids = [f"c{i}" for i in range(25)]
+        async with Gofile(token="t") as g:
+            report = await g.bulk_delete_content(iter(ids + ["c0"]), batch_size=10)
+        assert list(report) == ids
+        assert all(r == {} for r in report.values())
+        assert sorted(len(b) for b in batches) == [5, 10, 10]
+
+    @pytest.mark.asyncio
+    async def test_bad_id_isolated(self, mock_aio):
+        batches = []
+        self._mock_delete(mock_aio, batches, bad={"c5"})
+        ids = [f"c{i}" for i in range(8)]
+        async with Gofile(token="t") as g:
+            report = await g.bulk_delete_content(ids, batch_size=8, concurrency=2)
+        assert isinstance(report["c5"], ResponseError)
+        assert all(report[i] == {} for i in ids if i != "c5")
+
+    @pytest.mark.asyncio
+    async def test_bad_token_fails_batches_without_splitting(self, emulator):
+        emulator.add_account()
+        ids = [f"c{i}" for i in range(1000)]
+        async with emulator.client("bad-token") as g:
+            report = await g.bulk_delete_content(ids, batch_size=100, concurrency=8)
+        assert emulator.calls["delete_content"] == 10
+        assert all(isinstance(r, ResponseError) and r.code == 401 for r in report.values())
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,code", [("error-notPremium", 200), ("error", 503)])
+    async def test_batch_errors_not_split(self, mock_aio, status, code):
+        batches = []
+
+        def callback(url, **kwargs):
+            batches.append(json.loads(kwargs["data"])["contentsId"])
+            return CallbackResult(status=code, payload={"status": status})
+
+        mock_aio.delete("https://api.gofile.io/contents", callback=callback, repeat=True)
+        async with Gofile(token="t") as g:
+            report = await g.bulk_delete_content([f"c{i}" for i in range(8)], batch_size=4)
+        assert len(batches) == 2
+        assert all(r.status == status for r in report.values())
+
+    @pytest.mark.asyncio
+    async def test_per_id_status_in_response(self, mock_aio):
+        mock_aio.delete(
+            "https://api.gofile.io/contents",
+            payload={
+                "status": "ok",
+                "data": {"a": {"status": "ok", "data": {}}, "b": {"status": "error-notFound"}},
+            },
+        )
+        async with Gofile(token="t") as g:
+            report = await g.bulk_delete_content(["a", "b"])
+        assert report["a"] == {}
+        assert isinstance(report["b"], ResponseError)
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_size(self):
+        async with Gofile(token="t") as g:
+            with pytest.raises(InvalidOption):
+                await g.bulk_delete_content(["a"], batch_size=0)
+
+
 class TestGofileGetContent:
     @pytest.mark.asyncio
     async def test_get_content_no_token(self):
@@ -279,6 +1540,264 @@ class TestGofileGetContent:
             assert result["id"] == "folder123"
 
 
+class TestGofileWalk:
+    TREE = {
+        "root": {"children": {
+            "a": {"id": "a", "type": "folder"},
+            "f1": {"id": "f1", "type": "file"},
+        }},
+        "a": {"children": {
+            "b": {"id": "b", "type": "folder"},
+            "f2": {"id": "f2", "type": "file"},
+        }},
+        "b": {"children": {"f3": {"id": "f3", "type": "file"}}},
+    }
+
+    @pytest.mark.asyncio
+    async def test_walk_tree(self, mock_aio):
+        for folder, data in self.TREE.items():
+            mock_aio.get(
+                f"https://api.gofile.io/contents/{folder}",
+                payload={"status": "ok", "data": data},
+            )
+        async with Gofile(token="t") as g:
+            ids = [entry["id"] async for entry in g.walk("root")]
+        assert sorted(ids) == ["a", "b", "f1", "f2", "f3"]
+
+    @pytest.mark.asyncio
+    async def test_walk_bounded_concurrency(self):
+        tree = {"root": {"children": [{"id": f"d{i}", "type": "folder"} for i in range(6)]}}
+        state = {"running": 0, "peak": 0}
+
+        async def fake_get_content(contentId, password=None, token=None):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+            return tree.get(contentId, {})
+
+        async with Gofile(token="t") as g:
+            g.get_content = fake_get_content
+            entries = [entry async for entry in g.walk("root", concurrency=2)]
+        assert len(entries) == 6
+        assert state["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_walk_break_cancels_pending(self):
+        cancelled = []
+
+        async def fake_get_content(contentId, password=None, token=None):
+            if contentId == "root":
+                return {"children": [{"id": f"d{i}", "type": "folder"} for i in range(3)]}
+            if contentId == "d0":
+                return {"children": [{"id": "f0", "type": "file"}]}
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(contentId)
+                raise
+            return {}
+
+        async with Gofile(token="t") as g:
+            g.get_content = fake_get_content
+            agen = g.walk("root", concurrency=3)
+            async for entry in agen:
+                if entry["id"] == "f0":
+                    break
+            await agen.aclose()
+            await asyncio.sleep(0)
+        assert sorted(cancelled) == ["d1", "d2"]
+
+    def test_sync_walk(self, mock_aio):
+        for folder, data in self.TREE.items():
+            mock_aio.get(
+                f"https://api.gofile.io/contents/{folder}",
+                payload={"status": "ok", "data": data},
+            )
+        with Sync_Gofile(token="t") as g:
+            ids = [entry["id"] for entry in g.walk("root")]
+        assert sorted(ids) == ["a", "b", "f1", "f2", "f3"]
+
+
+class TestMetadataCache:
+    def test_lru_eviction(self):
+        cache = MetadataCache(maxsize=2)
+        cache.set("a", {})
+        cache.set("b", {})
+        assert cache.get("a") == {}
+        cache.set("c", {})
+        assert cache.get("b") is None
+        assert cache.stats() == {
+            "hits": 1, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2,
+        }
+
+    def test_ttl_expiry(self):
+        cache = MetadataCache(ttl=-1)
+        cache.set("a", {})
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_parent(self):
+        cache = MetadataCache()
+        cache.set("root", {"children": {"f1": {"id": "f1"}}})
+        cache.set("sub", {"parentFolder": "root"})
+        cache.invalidate(["f1"])
+        assert cache.get("root") is None
+        cache.set("root", {})
+        cache.invalidate(["sub"])
+        assert cache.get("root") is None
+
+    @staticmethod
+    def _mock_folder(mock_aio, times=1):
+        for _ in range(times):
+            mock_aio.get(
+                "https://api.gofile.io/contents/folder1",
+                payload={
+                    "status": "ok",
+                    "data": {"id": "folder1", "children": {"f1": {"id": "f1"}}},
+                },
+            )
+
+    @pytest.mark.asyncio
+    async def test_get_content_cached(self, mock_aio):
+        self._mock_folder(mock_aio)
+        cache = MetadataCache()
+        async with Gofile(token="t", metadata_cache=cache) as g:
+            first = await g.get_content("folder1")
+            second = await g.get_content("folder1")
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_token_is_part_of_key(self, mock_aio):
+        self._mock_folder(mock_aio, times=2)
+        cache = MetadataCache()
+        async with Gofile(token="t", metadata_cache=cache) as g:
+            await g.get_content("folder1")
+            await g.get_content("folder1", token="other")
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate(self, mock_aio):
+        self._mock_folder(mock_aio, times=2)
+        mock_aio.put(
+            "https://api.gofile.io/contents/f1/update",
+            payload={"status": "ok", "data": {}},
+        )
+        cache = MetadataCache()
+        async with Gofile(token="t", metadata_cache=cache) as g:
+            await g.get_content("folder1")
+            await g.update_content("f1", "name", "renamed.txt")
+            await g.get_content("folder1")
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_copy_invalidates_destination(self, mock_aio):
+        self._mock_folder(mock_aio, times=2)
+        mock_aio.post(
+            "https://api.gofile.io/contents/copy",
+            payload={"status": "ok", "data": {}},
+        )
+        cache = MetadataCache()
+        async with Gofile(token="t", metadata_cache=cache) as g:
+            await g.get_content("folder1")
+            await g.copy_content("x1,x2", "folder1")
+            await g.get_content("folder1")
+        assert cache.misses == 2
+
+
+class TestResponseModels:
+    LISTING = {
+        "id": "root",
+        "type": "folder",
+        "name": "Root",
+        "childrenCount": 2,
+        "children": {
+            "f1": {"id": "f1", "type": "file", "name": "a.txt", "size": 3, "parentFolder": "root"},
+            "d1": {"id": "d1", "type": "folder", "name": "sub", "parentFolder": "root",
+                   "children": {}},
+        },
+        "isOwner": True,
+    }
+
+    def test_folder_children_parsed_lazily(self):
+        folder = Folder.from_dict(self.LISTING)
+        assert folder._parsed is None
+        assert folder.child_ids() == ["f1", "d1"]
+        assert folder._parsed is None
+        children = folder.children
+        assert isinstance(children["f1"], File)
+        assert isinstance(children["d1"], Folder)
+        assert children["f1"].size == 3
+        assert folder.children is children
+
+    def test_dict_compatibility(self):
+        folder = Folder.from_dict(self.LISTING)
+        assert folder["name"] == "Root"
+        assert folder.get("code") is None
+        assert "isOwner" in folder and folder.extra == {"isOwner": True}
+        assert folder.to_dict() == self.LISTING
+        assert folder == self.LISTING
+        with pytest.raises(KeyError):
+            folder["code"]
+
+    def test_slots(self):
+        result = UploadResult.from_dict({"id": "f1", "parentFolder": "p1"})
+        assert not hasattr(result, "__dict__")
+        assert result.fileId == "f1"
+        assert dict(result) == {"id": "f1", "parentFolder": "p1"}
+
+    @pytest.mark.asyncio
+    async def test_default_returns_dicts(self, mock_aio):
+        mock_aio.get("https://api.gofile.io/contents/root",
+                     payload={"status": "ok", "data": self.LISTING})
+        async with Gofile(token="t") as g:
+            assert type(await g.get_content("root")) is dict
+
+    @pytest.mark.asyncio
+    async def test_client_returns_models(self, tmp_file, mock_aio):
+        mock_aio.get("https://api.gofile.io/contents/root",
+                     payload={"status": "ok", "data": self.LISTING})
+        mock_aio.post("https://upload.gofile.io/uploadfile",
+                      payload={"status": "ok", "data": {"id": "f9", "parentFolder": "root"}})
+        mock_aio.post("https://api.gofile.io/contents/f9/directlinks",
+                      payload={"status": "ok", "data": {"id": "l1", "directLink": "https://x"}})
+        mock_aio.get("https://api.gofile.io/accounts/acc1",
+                     payload={"status": "ok", "data": {"id": "acc1", "tier": "premium"}})
+        async with Gofile(token="t", response_models=True) as g:
+            listing = await g.get_content("root")
+            uploaded = await g.upload(tmp_file, folderId="root")
+            link = await g.create_direct_link("f9")
+            account = await g.get_account("acc1")
+        assert isinstance(listing, Folder) and listing.childrenCount == 2
+        assert isinstance(uploaded, UploadResult) and uploaded.parentFolder == "root"
+        assert isinstance(link, DirectLink) and link.directLink == "https://x"
+        assert isinstance(account, Account) and account.tier == "premium"
+
+    @pytest.mark.asyncio
+    async def test_models_with_cache_and_walk(self, mock_aio):
+        mock_aio.get("https://api.gofile.io/contents/root",
+                     payload={"status": "ok", "data": self.LISTING})
+        mock_aio.get("https://api.gofile.io/contents/d1",
+                     payload={"status": "ok", "data": {"id": "d1", "type": "folder",
+                                                       "children": {}}})
+        cache = MetadataCache()
+        async with Gofile(token="t", metadata_cache=cache, response_models=True) as g:
+            entries = [entry async for entry in g.walk("root")]
+            assert await g.get_content("root") is await g.get_content("root")
+        assert [e.id for e in entries] == ["f1", "d1"]
+        assert cache._parents["f1"] == "root"
+
+    def test_journal_records_models(self, tmp_path, tmp_file):
+        path = str(tmp_path / "journal.jsonl")
+        with UploadJournal(path) as journal:
+            journal.record(tmp_file, UploadResult.from_dict({"id": "f1", "parentFolder": "p"}))
+        with UploadJournal(path) as journal:
+            assert journal.completed([tmp_file]) == {
+                tmp_file: {"id": "f1", "parentFolder": "p"}
+            }
+
+
 class TestGofileSearchContent:
     @pytest.mark.asyncio
     async def test_search_content_no_token(self):
@@ -482,6 +2001,239 @@ class TestGofileDirectLinks:
         }
 
 
+@pytest_asyncio.fixture
+async def file_server(tmp_path):
+    """Local stand-in for the Gofile API and download host."""
+    blob = os.urandom(100_000)
+    source = tmp_path / "source.bin"
+    source.write_bytes(blob)
+    state = {"ranges": [], "cookies": [], "release": asyncio.Event()}
+
+    async def get_content(request):
+        base = f"http://{request.host}"
+        return web.json_response({
+            "status": "ok",
+            "data": {"id": "file1", "type": "file", "name": "blob.bin", "link": f"{base}/dl/blob.bin"},
+        })
+
+    async def big_listing(request):
+        # Sends the first child, then holds the rest of the body back
+        # until the test releases it.
+        resp = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await resp.prepare(request)
+        await resp.write(b'{"status":"ok","data":{"id":"big","type":"folder","children":{')
+        await resp.write(b'"c0":{"type":"file","name":"f0"}')
+        await state["release"].wait()
+        for i in range(1, 500):
+            await resp.write(b',"c%d":{"type":"file","name":"f%d"}' % (i, i))
+        await resp.write(b'},"childrenCount":500}}')
+        return resp
+
+    async def download(request):
+        state["ranges"].append(request.headers.get("Range"))
+        state["cookies"].append(request.cookies.get("accountToken"))
+        return web.FileResponse(source)
+
+    app = web.Application()
+    app.router.add_get("/contents/file1", get_content)
+    app.router.add_get("/contents/big", big_listing)
+    app.router.add_get("/dl/blob.bin", download)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state["url"] = f"http://127.0.0.1:{port}"
+    state["blob"] = blob
+    yield state
+    await runner.cleanup()
+
+
+class TestIterChildren:
+    class _Body:
+        def __init__(self, data: bytes, size: int) -> None:
+            self.data, self.size, self.pos = data, size, 0
+
+        async def read(self, n: int) -> bytes:
+            chunk = self.data[self.pos:self.pos + min(n, self.size)]
+            self.pos += len(chunk)
+            return chunk
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 3, 7, 1 << 16])
+    async def test_chunk_boundaries(self, size):
+        doc = {
+            "status": "ok",
+            "data": {
+                "id": "r",
+                "totalSize": 1234567,
+                "children": {f"c{i}": {"size": i * 1001, "name": "caf\u00e9 \\\"x\""} for i in range(20)},
+                "public": True,
+            },
+        }
+        body = self._Body(json.dumps(doc, indent=1).encode(), size)
+        events = [e async for e in iter_children(body, size)]
+        assert events[0] == ("status", "ok")
+        assert [v for k, v in events if k == "child"] == [
+            {**child, "id": childId} for childId, child in doc["data"]["children"].items()
+        ]
+        assert events[-1] == ("info", {"id": "r", "totalSize": 1234567, "public": True})
+
+    @pytest.mark.asyncio
+    async def test_empty_and_missing_children(self):
+        for doc in ({}, {"status": "error-notFound", "data": {}}, {"data": {"children": {}}}):
+            body = self._Body(json.dumps(doc).encode(), 5)
+            events = [e async for e in iter_children(body)]
+            assert not [e for e in events if e[0] == "child"]
+
+    @pytest.mark.asyncio
+    async def test_truncated(self):
+        body = self._Body(b'{"data":{"children":{"a":{"size":12', 4)
+        with pytest.raises(ValueError):
+            [e async for e in iter_children(body)]
+
+
+class TestGofileIterContent:
+    @pytest.mark.asyncio
+    async def test_children_yielded_before_body_ends(self, file_server):
+        async with Gofile(token="t") as g:
+            g.api_url = file_server["url"]
+            listing = g.iter_content("big")
+            first = await listing.__anext__()
+            assert first == {"type": "file", "name": "f0", "id": "c0"}
+            assert not file_server["release"].is_set()
+            file_server["release"].set()
+            rest = [child["id"] async for child in listing]
+        assert rest == [f"c{i}" for i in range(1, 500)]
+
+    @pytest.mark.asyncio
+    async def test_models(self, mock_aio):
+        mock_aio.get(
+            "https://api.gofile.io/contents/root",
+            payload={"status": "ok", "data": {"id": "root", "children": [
+                {"id": "a", "type": "file"}, {"id": "b", "type": "folder"},
+            ]}},
+        )
+        async with Gofile(token="t", response_models=True) as g:
+            children = [child async for child in g.iter_content("root")]
+        assert [type(c) for c in children] == [File, Folder]
+
+    @pytest.mark.asyncio
+    async def test_error_status(self, mock_aio):
+        mock_aio.get(
+            "https://api.gofile.io/contents/root",
+            status=404,
+            payload={"status": "error-notFound", "data": {}},
+        )
+        async with Gofile(token="t") as g:
+            with pytest.raises(ResponseError, match="error-notFound"):
+                [child async for child in g.iter_content("root")]
+
+    @pytest.mark.asyncio
+    async def test_invalid_body(self, mock_aio):
+        mock_aio.get("https://api.gofile.io/contents/root", body=b'{"status":"ok","data":{"children":{"a":')
+        async with Gofile(token="t") as g:
+            with pytest.raises(ResponseError, match="Invalid API response"):
+                [child async for child in g.iter_content("root")]
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(self, mock_aio):
+        mock_aio.get("https://api.gofile.io/contents/root", status=503, body=b"")
+        mock_aio.get(
+            "https://api.gofile.io/contents/root",
+            payload={"status": "ok", "data": {"children": {"a": {"type": "file"}}}},
+        )
+        policy = RetryPolicy(max_attempts=2, base_delay=0)
+        async with Gofile(token="t", retry_policy=policy) as g:
+            children = [child async for child in g.iter_content("root")]
+        assert children == [{"type": "file", "id": "a"}]
+
+    @pytest.mark.asyncio
+    async def test_no_token(self):
+        async with Gofile() as g:
+            with pytest.raises(InvalidToken):
+                [child async for child in g.iter_content("root")]
+
+
+class TestGofileDownload:
+    @pytest.mark.asyncio
+    async def test_segmented_download(self, file_server, tmp_path):
+        async with Gofile(token="t") as g:
+            g.api_url = file_server["url"]
+            path = await g.download("file1", str(tmp_path), segments=4, min_segment_size=10_000)
+        assert path == str(tmp_path / "blob.bin")
+        assert open(path, "rb").read() == file_server["blob"]
+        ranges = [r for r in file_server["ranges"] if r]
+        assert len(ranges) == 4
+        assert set(file_server["cookies"]) == {"t"}
+        assert not os.path.exists(path + ".part")
+
+    @pytest.mark.asyncio
+    async def test_single_stream_download(self, file_server, tmp_path):
+        dest = str(tmp_path / "out.bin")
+        async with Gofile(token="t") as g:
+            g.api_url = file_server["url"]
+            path = await g.download("file1", dest, segments=1)
+        assert path == dest
+        assert open(dest, "rb").read() == file_server["blob"]
+        assert [r for r in file_server["ranges"] if r] == []
+
+    @pytest.mark.asyncio
+    async def test_ignored_range_falls_back_to_single_stream(self, mock_aio, tmp_path):
+        body = os.urandom(40)
+        mock_aio.get(
+            "https://api.gofile.io/contents/file1",
+            payload={"status": "ok", "data": {"link": "https://dl.example/x"}},
+        )
+        mock_aio.head(
+            "https://dl.example/x",
+            headers={"Content-Length": "40", "Accept-Ranges": "bytes"},
+        )
+        mock_aio.get("https://dl.example/x", body=body, repeat=True)
+        dest = str(tmp_path / "x")
+        async with Gofile(token="t") as g:
+            path = await g.download("file1", dest, segments=2, min_segment_size=10)
+        assert open(path, "rb").read() == body
+        assert os.listdir(tmp_path) == ["x"]
+        gets = [
+            call
+            for (method, url), calls in mock_aio.requests.items()
+            if method == "GET" and url.host == "dl.example"
+            for call in calls
+        ]
+        assert gets[-1].kwargs["headers"].get("Range") is None
+
+    @pytest.mark.asyncio
+    async def test_download_falls_back_to_direct_link(self, mock_aio, tmp_path):
+        mock_aio.get(
+            "https://api.gofile.io/contents/file1",
+            payload={"status": "ok", "data": {"id": "file1", "name": "x.txt"}},
+        )
+        mock_aio.post(
+            "https://api.gofile.io/contents/file1/directlinks",
+            payload={"status": "ok", "data": {"directLink": "https://dl.example/x.txt"}},
+        )
+        mock_aio.head("https://dl.example/x.txt", headers={"Content-Length": "5"})
+        mock_aio.get("https://dl.example/x.txt", body=b"hello")
+        async with Gofile(token="t") as g:
+            path = await g.download("file1", str(tmp_path))
+        assert open(path, "rb").read() == b"hello"
+
+    @pytest.mark.asyncio
+    async def test_download_error_removes_partial_file(self, mock_aio, tmp_path):
+        mock_aio.get(
+            "https://api.gofile.io/contents/file1",
+            payload={"status": "ok", "data": {"link": "https://dl.example/x"}},
+        )
+        mock_aio.head("https://dl.example/x", status=405)
+        mock_aio.get("https://dl.example/x", status=404)
+        dest = str(tmp_path / "x")
+        async with Gofile(token="t") as g:
+            with pytest.raises(ResponseError):
+                await g.download("file1", dest)
+        assert os.listdir(tmp_path) == []
+
+
 class TestGofileAccount:
     @pytest.mark.asyncio
     async def test_get_account_id_no_token(self):
@@ -548,6 +2300,104 @@ class TestGofileContextManager:
         assert g._session is None or g._session.closed
 
 
+class TestGofileConnectionPool:
+    @pytest.mark.asyncio
+    async def test_connection_options_applied(self):
+        options = ConnectionOptions(limit=7, limit_per_host=3)
+        async with Gofile(connection_options=options) as g:
+            session = await g._get_session()
+            assert session.connector.limit == 7
+            assert session.connector.limit_per_host == 3
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_ssl_context_is_reused(self):
+        a = ConnectionOptions().create_connector()
+        b = ConnectionOptions().create_connector()
+        assert a._ssl is b._ssl
+        await a.close()
+        await b.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_session_not_closed(self, mock_aio):
+        mock_aio.get(
+            "https://api.gofile.io/accounts/getid",
+            payload={"status": "ok", "data": {"id": "acc1"}},
+        )
+        session = ClientSession()
+        async with Gofile(token="t", session=session) as g:
+            assert await g._get_session() is session
+            await g.get_account_id()
+        assert not session.closed
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_connector_not_closed(self):
+        connector = ConnectionOptions(limit=5).create_connector()
+        async with Gofile(connector=connector) as a, Gofile(connector=connector) as b:
+            assert (await a._get_session()).connector is connector
+            assert (await b._get_session()).connector is connector
+        assert not connector.closed
+        await connector.close()
+
+
+class TestJsonCodec:
+    def test_default_prefers_fast_library(self):
+        codec = JsonCodec.default()
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            assert codec.name == "orjson"
+        assert JsonCodec.default() is codec
+        assert Gofile().json_codec is codec
+
+    def test_stdlib_round_trip(self):
+        codec = JsonCodec.named("json")
+        data = codec.dumps({"name": "caf\u00e9", "n": [1, 2]})
+        assert isinstance(data, bytes)
+        assert codec.loads(data) == {"name": "caf\u00e9", "n": [1, 2]}
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            JsonCodec.named("yaml")
+
+    @pytest.mark.asyncio
+    async def test_custom_codec_used_for_both_directions(self, mock_aio):
+        calls = []
+
+        def dumps(obj):
+            calls.append("dumps")
+            return json.dumps(obj).encode()
+
+        def loads(raw):
+            calls.append("loads")
+            assert isinstance(raw, bytes)
+            return json.loads(raw)
+
+        sent = {}
+
+        def callback(url, **kwargs):
+            sent.update(kwargs)
+            return CallbackResult(payload={"status": "ok", "data": {"folderId": "f1"}})
+
+        mock_aio.post("https://api.gofile.io/contents/createFolder", callback=callback)
+        async with Gofile(token="t", json_codec=JsonCodec(dumps, loads)) as g:
+            result = await g.create_folder("parent", "name")
+        assert result == {"folderId": "f1"}
+        assert calls == ["dumps", "loads"]
+        assert json.loads(sent["data"]) == {"parentFolderId": "parent", "folderName": "name"}
+        assert sent["headers"]["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_undecodable_body(self, mock_aio):
+        mock_aio.get("https://api.gofile.io/accounts/getid", body=b"<html>")
+        async with Gofile(token="t") as g:
+            with pytest.raises(ResponseError):
+                await g.get_account_id()
+
+
 class TestGofileAuth:
     @pytest.mark.asyncio
     async def test_bearer_token_in_headers(self, mock_aio):
@@ -776,11 +2626,62 @@ class TestSyncGofile:
         assert g._async_client.token == "test-token"
         g.done()
 
-    def test_sync_init_in_running_loop(self):
+    def test_sync_init_in_running_loop(self, mock_aio):
+        mock_aio.get(
+            "https://api.gofile.io/accounts/getid",
+            payload={"status": "ok", "data": {"id": "acc1"}},
+        )
+
         async def _inner():
-            with pytest.raises(RuntimeError, match="already running"):
-                Sync_Gofile(token="test-token")
-        asyncio.get_event_loop_policy().new_event_loop().run_until_complete(_inner())
+            with Sync_Gofile(token="test-token") as g:
+                return g.get_account_id()
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(_inner()) == {"id": "acc1"}
+        finally:
+            loop.close()
+
+    def test_sync_shared_between_threads(self, mock_aio):
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_aio.get(
+            "https://api.gofile.io/accounts/getid",
+            payload={"status": "ok", "data": {"id": "acc1"}},
+            repeat=True,
+        )
+        with Sync_Gofile(token="test-token") as g:
+            with ThreadPoolExecutor(8) as pool:
+                results = list(pool.map(lambda _: g.get_account_id(), range(16)))
+            session = g._async_client._session
+        assert results == [{"id": "acc1"}] * 16
+        assert session.closed
+
+    def test_sync_done_is_idempotent(self):
+        g = Sync_Gofile()
+        g.done()
+        g.done()
+        assert not g._thread.is_alive()
+        with pytest.raises(RuntimeError, match="closed"):
+            g.get_account_id(token="t")
+
+    def test_sync_dropped_instance_stops_thread(self):
+        import gc
+
+        g = Sync_Gofile()
+        thread, loop = g._thread, g._loop
+        del g
+        gc.collect()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert loop.is_closed()
+
+    def test_sync_call_from_loop_thread(self):
+        with Sync_Gofile(token="test-token") as g:
+            async def _callback():
+                with pytest.raises(RuntimeError, match="own event loop"):
+                    g.get_account_id()
+                return True
+            assert g._run(_callback())
 
     def test_sync_context_manager(self):
         with Sync_Gofile(token="test") as g:
@@ -862,6 +2763,93 @@ class TestSyncGofile:
                 g.reset_token("account123")
 
 
+
+class TestSyncGofileSubmit:
+    def test_submit_returns_future(self, mock_aio):
+        from concurrent.futures import Future
+
+        mock_aio.get(
+            "https://api.gofile.io/contents/f1",
+            payload={"status": "ok", "data": {"id": "f1"}},
+        )
+        mock_aio.get(
+            "https://api.gofile.io/contents/f2",
+            payload={"status": "ok", "data": {"id": "f2"}},
+        )
+        with Sync_Gofile(token="test-token") as g:
+            futures = [g.submit("get_content", cid) for cid in ("f1", "f2")]
+            assert all(isinstance(f, Future) for f in futures)
+            assert [f.result()["id"] for f in futures] == ["f1", "f2"]
+
+    def test_submit_propagates_errors(self):
+        with Sync_Gofile() as g:
+            future = g.submit("get_account_id")
+            with pytest.raises(InvalidToken):
+                future.result()
+
+    @pytest.mark.parametrize("method", ["walk", "done", "_send", "missing"])
+    def test_submit_rejects_non_request_methods(self, method):
+        with Sync_Gofile() as g:
+            with pytest.raises(InvalidOption):
+                g.submit(method)
+
+    def test_map_upload(self, tmp_dir, mock_aio):
+        mock_aio.post(
+            "https://upload.gofile.io/uploadfile",
+            payload={"status": "ok", "data": {"id": "f1", "parentFolder": "p1"}},
+            repeat=True,
+        )
+        paths = [os.path.join(tmp_dir, n) for n in ("a.txt", "b.txt")]
+        paths.append(os.path.join(tmp_dir, "missing.txt"))
+        with Sync_Gofile(token="test-token") as g:
+            results = dict(g.map_upload(paths, folderId="p1", concurrency=2))
+        assert set(results) == set(paths)
+        assert results[paths[0]]["id"] == "f1"
+        assert results[paths[1]]["id"] == "f1"
+        assert isinstance(results[paths[2]], InvalidPath)
+
+    def test_map_upload_limits_in_flight(self, tmp_dir):
+        with Sync_Gofile() as g:
+            in_flight = []
+            peak = []
+
+            async def fake_upload(file, *args, **kwargs):
+                in_flight.append(file)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.remove(file)
+                return {"id": file, "parentFolder": "p1"}
+
+            g._async_client.upload = fake_upload
+            paths = [f"file{i}" for i in range(10)]
+            results = dict(g.map_upload(paths, folderId="p1", concurrency=3))
+        assert results == {p: {"id": p, "parentFolder": "p1"} for p in paths}
+        assert max(peak) == 3
+
+    def test_map_upload_reuses_first_parent_folder(self):
+        with Sync_Gofile() as g:
+            calls = []
+
+            async def fake_upload(file, folderId=None, *args, **kwargs):
+                calls.append((file, folderId))
+                if file == "file0":
+                    raise ResponseError("error-upload")
+                return {"id": file, "parentFolder": folderId or "guest1"}
+
+            g._async_client.upload = fake_upload
+            paths = [f"file{i}" for i in range(6)]
+            results = dict(g.map_upload(paths, concurrency=3))
+        assert calls[:2] == [("file0", None), ("file1", None)]
+        assert sorted(calls[2:]) == [(f"file{i}", "guest1") for i in range(2, 6)]
+        assert isinstance(results["file0"], ResponseError)
+        assert all(results[p]["parentFolder"] == "guest1" for p in paths[1:])
+
+    def test_map_upload_invalid_concurrency(self):
+        with Sync_Gofile() as g:
+            with pytest.raises(InvalidOption):
+                list(g.map_upload(["a"], concurrency=0))
+
+
 # --- Error Tests ---
 
 class TestErrors: